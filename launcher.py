@@ -5,7 +5,6 @@
 from __future__ import annotations
 
 import argparse
-import importlib.machinery
 import importlib.util
 import json
 import os
@@ -25,11 +24,12 @@ def _load_desktop_app_launcher():
 
         return launch_desktop_app
     except SyntaxError:
-        pyc_path = Path(__file__).resolve().parent / "pc" / "__pycache__" / "desktop_app.cpython-311.pyc"
+        # 源码损坏时回退到当前解释器对应的字节码缓存，由 spec_from_file_location 按后缀选择加载器。
+        source_path = Path(__file__).resolve().parent / "pc" / "desktop_app.py"
+        pyc_path = Path(importlib.util.cache_from_source(str(source_path)))
         if not pyc_path.exists():
             raise
-        loader = importlib.machinery.SourcelessFileLoader("pc.desktop_app_fallback", str(pyc_path))
-        spec = importlib.util.spec_from_loader("pc.desktop_app_fallback", loader)
+        spec = importlib.util.spec_from_file_location("pc.desktop_app_fallback", pyc_path)
         if spec is None or spec.loader is None:
             raise
         module = importlib.util.module_from_spec(spec)
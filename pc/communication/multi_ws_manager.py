@@ -1,10 +1,15 @@
 ﻿import asyncio
+import concurrent.futures
+import functools
 import json
 import os
+import queue
+import random
+import socket
 import threading
 import time
 from collections import deque
-from typing import Any, Callable, Dict, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 import cv2
 import numpy as np
@@ -15,13 +20,28 @@ from pc.core.logger import console_info, console_error
 from pc.core.config import get_config
 from pc.core.expert_manager import expert_manager
 from pc.core.expert_closed_loop import (
+    PI_EVENT_FRAME_OPCODES,
+    parse_pi_expert_frame,
     parse_pi_expert_packet,
     build_expert_result_command,
+    build_pi_command,
     parse_pi_expert_ack,
     ExpertResult,
 )
 from pc.core.orchestrator import orchestrator
 
+_VOICE_PREFIX_LEN = len("PI_VOICE_COMMAND:")
+
+try:
+    from turbojpeg import TurboJPEG
+except Exception:  # pragma: no cover - optional dependency
+    TurboJPEG = None
+
+try:
+    import uvloop
+except Exception:  # pragma: no cover - optional dependency, not available on Windows
+    uvloop = None
+
 
 class MultiPiManager:
     def __init__(
@@ -33,10 +53,29 @@ class MultiPiManager:
         selected_model: str = "",
         archive_event: Optional[Callable[..., Any]] = None,
         on_node_progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+        enable_voice: bool = True,
     ):
         self.pi_dict = pi_dict
         self.frame_buffers = {pid: None for pid in pi_dict}
-        self.send_queues = {pid: asyncio.Queue() for pid in pi_dict}
+        # 预览帧解码复用每节点两块缓冲交替写入，消费方读到的始终是已完整解码的那一块。
+        # 缓冲会在两帧之后被覆盖：只做即时显示的读者可直接使用，需要跨帧持有画面的读者必须先 copy()。
+        # 帧池按首个解码成功的帧的分辨率分配一块连续的 (N, 2, H, W, 3) 缓冲，同分辨率节点共用，
+        # frame_buffers 中保存的是池内视图；分辨率与帧池不一致的节点退回各自独立的缓冲。
+        self._turbojpeg = self._create_turbojpeg()
+        self._node_index = {pid: idx for idx, pid in enumerate(pi_dict)}
+        self._frame_pool: Optional[np.ndarray] = None
+        self._frame_pool_lock = threading.Lock()
+        self._decode_buffers = {pid: [None, None] for pid in pi_dict}
+        self._decode_slots = {pid: 0 for pid in pi_dict}
+        # 解码放到独立线程池，避免 CPU 密集的 JPEG 解码阻塞所有节点共享的事件循环。
+        self._decode_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(8, max(1, len(pi_dict))),
+            thread_name_prefix="PreviewDecode",
+        )
+        self._decode_inflight = {pid: False for pid in pi_dict}
+        # 每节点一个待发双端队列 + 唤醒事件：广播时同一条已编码命令直接追加到各节点队列，无需逐条入队调度。
+        self._send_pending = {pid: deque() for pid in pi_dict}
+        self._send_ready = {pid: asyncio.Event() for pid in pi_dict}
         self.running = True
         self.log_info = log_info or console_info
         self.log_error = log_error or console_error
@@ -55,6 +94,10 @@ class MultiPiManager:
 
         num_nodes = len(pi_dict)
         self.target_fps = max(1.0, 30.0 / num_nodes) if num_nodes > 0 else 30.0
+        # 预览流 AIMD 流控：窗口内解码丢帧过多时节点帧率减半，持续顺畅时逐步加回 target_fps。
+        self.flow_window_seconds = float(get_config("network.flow_window_seconds", 2.0) or 2.0)
+        self._node_fps = {pid: self.target_fps for pid in pi_dict}
+        self._flow_window = {pid: [time.monotonic(), 0, 0] for pid in pi_dict}
 
         self.recent_event_ids = set()
         self.recent_event_queue = deque(maxlen=500)
@@ -63,13 +106,84 @@ class MultiPiManager:
         self.ack_retries = int(get_config("expert_loop.ack_retries", 2))
         self.event_queue = asyncio.Queue(maxsize=int(get_config("expert_loop.max_pending_events", 32) or 32))
         self.event_worker_count = max(1, int(get_config("expert_loop.worker_count", 1) or 1))
+        # 专家研判使用独立线程池，不与默认执行器中的其他阻塞调用争抢线程；每个事件协程同时最多占用一个线程。
+        self._expert_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.event_worker_count,
+            thread_name_prefix="ExpertPlan",
+        )
         self.event_cooldown = float(get_config("expert_loop.event_cooldown_seconds", 6.0) or 6.0)
         self.recent_policy_hits = {}
+        self._text_handlers = {
+            "PI_VOICE_COMMAND": self._on_voice_command,
+            "PI_CAPS": self._on_caps,
+            "PI_EXPERT_ACK": self._on_expert_ack,
+            "PI_PROGRESS": self._on_progress,
+            "PI_EXPERT_EVENT": self._on_text_edge_event,
+            "PI_YOLO_EVENT": self._on_text_edge_event,
+        }
+        self._frame_handlers = dict.fromkeys(PI_EVENT_FRAME_OPCODES, self._on_event_frame)
+        self._voice_queue = queue.SimpleQueue()
+        self._voice_thread: Optional[threading.Thread] = None
+        # 关闭 enable_voice 的精简部署不会导入语音模块（及其音频依赖），节点语音指令直接回复未启用。
+        self.enable_voice = bool(enable_voice)
+        self._voice_agent = None
+        # 握手命令按来源版本缓存：重连风暴下各节点复用同一个已编码字符串，不再逐次序列化。
+        self._handshake_cache: Dict[str, Tuple[Any, Any]] = {}
 
         self.audit_log_dir = str(resource_path("pc/log"))
         os.makedirs(self.audit_log_dir, exist_ok=True
         )
 
+    @staticmethod
+    def _create_turbojpeg():
+        if TurboJPEG is None:
+            return None
+        try:
+            return TurboJPEG()
+        except Exception:
+            # 已安装 PyTurboJPEG 但缺少 libjpeg-turbo 动态库时回退到 OpenCV。
+            return None
+
+    def _decode_preview(self, pi_id: str, data: bytes):
+        if self._turbojpeg is not None:
+            try:
+                width, height, _, _ = self._turbojpeg.decode_header(data)
+                slot = self._decode_slots[pi_id] ^ 1
+                target = self._decode_target(pi_id, slot, height, width)
+                frame = self._turbojpeg.decode(data, dst=target)
+                self._decode_slots[pi_id] = slot
+                return frame
+            except Exception:
+                pass
+        arr = np.frombuffer(data, np.uint8)
+        return cv2.imdecode(arr, cv2.IMREAD_COLOR)
+
+    def _decode_target(self, pi_id: str, slot: int, height: int, width: int) -> np.ndarray:
+        pool = self._frame_pool
+        if pool is None:
+            # 多个解码线程可能同时拿到各自节点的首帧，只允许其中一个分配帧池。
+            with self._frame_pool_lock:
+                pool = self._frame_pool
+                if pool is None:
+                    pool = np.empty((len(self._node_index), 2, height, width, 3), dtype=np.uint8)
+                    self._frame_pool = pool
+        if pool.shape[2:4] == (height, width):
+            return pool[self._node_index[pi_id], slot]
+        buffers = self._decode_buffers[pi_id]
+        target = buffers[slot]
+        if target is None or target.shape[:2] != (height, width):
+            target = np.empty((height, width, 3), dtype=np.uint8)
+            buffers[slot] = target
+        return target
+
+    def _on_preview_decoded(self, pi_id: str, future) -> None:
+        self._decode_inflight[pi_id] = False
+        if future.cancelled() or future.exception() is not None:
+            return
+        frame = future.result()
+        if frame is not None and self.running:
+            self.frame_buffers[pi_id] = frame
+
     def _handle_node_progress(self, pi_id: str, payload: Dict[str, Any]) -> None:
         if self.on_node_progress is not None:
             try:
@@ -78,13 +192,7 @@ class MultiPiManager:
                 self.log_error(f"节点 [{pi_id}] 进度回调处理失败: {exc}")
 
     def request_node_self_checks(self) -> bool:
-        triggered = False
-        for pi_id in self.pi_dict:
-            if self.node_status.get(pi_id) != "online":
-                continue
-            self.send_to_node(pi_id, "CMD:RUN_SELF_CHECK")
-            triggered = True
-        return triggered
+        return bool(self.broadcast_to_nodes(build_pi_command("RUN_SELF_CHECK")))
 
     def _write_audit(self, text: str):
         path = os.path.join(self.audit_log_dir, "expert_closed_loop.log")
@@ -94,7 +202,7 @@ class MultiPiManager:
     async def _send_with_ack(self, ws, pi_id: str, result: ExpertResult):
         cmd = build_expert_result_command(result)
         for attempt in range(self.ack_retries + 1):
-            await self.send_queues[pi_id].put(cmd)
+            self._queue_command(pi_id, cmd)
             self.pending_result_acks[(pi_id, result.event_id)] = time.time()
             await asyncio.sleep(self.ack_timeout)
             if (pi_id, result.event_id) not in self.pending_result_acks:
@@ -132,9 +240,23 @@ class MultiPiManager:
         except asyncio.QueueFull:
             self.log_error(f"节点 [{pi_id}] 边缘事件队列已满，已丢弃事件: {event.event_name}")
 
-    async def _event_worker(self):
-        from pc.voice.voice_interaction import get_remote_text_router
+    async def _accept_edge_event(self, pi_id: str, event, parse_error: Optional[str]) -> None:
+        if parse_error or event is None:
+            self.log_error(f"处理边缘告警事件异常: {parse_error}")
+            return
+
+        if event.event_id in self.recent_event_ids:
+            self.log_info(f"节点 [{pi_id}] 重复事件已忽略: {event.event_id}")
+            return
+        self.recent_event_ids.add(event.event_id)
+        self.recent_event_queue.append(event.event_id)
+        while len(self.recent_event_ids) > self.recent_event_queue.maxlen:
+            expired = self.recent_event_queue.popleft()
+            self.recent_event_ids.discard(expired)
+
+        await self._enqueue_edge_event(pi_id, event)
 
+    async def _event_worker(self):
         while self.running or not self.event_queue.empty():
             try:
                 pi_id, event = await asyncio.wait_for(self.event_queue.get(), timeout=0.5)
@@ -144,17 +266,20 @@ class MultiPiManager:
                 if not self.running:
                     continue
                 self.log_info(f"收到节点 [{pi_id}] 边缘高优告警: {event.event_name} ({event.event_id})")
-                agent = get_remote_text_router()
+                agent = self._get_voice_agent()
                 if agent and agent.is_active:
                     self.log_info("语音助手处于活跃状态，暂缓播报边缘告警。")
                     continue
 
-                orchestrated = await asyncio.to_thread(
-                    orchestrator.plan_edge_event,
-                    pi_id=pi_id,
-                    event=event,
-                    selected_model=self.selected_model or _STATE.get("selected_model", ""),
-                    node_caps=self.node_caps.get(pi_id, {}),
+                orchestrated = await self.loop.run_in_executor(
+                    self._expert_pool,
+                    functools.partial(
+                        orchestrator.plan_edge_event,
+                        pi_id=pi_id,
+                        event=event,
+                        selected_model=self.selected_model or _STATE.get("selected_model", ""),
+                        node_caps=self.node_caps.get(pi_id, {}),
+                    ),
                 )
                 tts_text = orchestrated.text
                 if tts_text:
@@ -186,6 +311,163 @@ class MultiPiManager:
             finally:
                 self.event_queue.task_done()
 
+    def _sync_config_command(self) -> str:
+        wake_word = get_config("voice_interaction.wake_word", "小爱同学")
+        wake_aliases = str(
+            get_config(
+                "voice_interaction.wake_aliases",
+                "小爱同学,小爱同,小爱,小艾同学,晓爱同学,哎同学,爱同学",
+            )
+            or ""
+        )
+        key = (wake_word, wake_aliases)
+        cached = self._handshake_cache.get("SYNC_CONFIG")
+        if cached is None or cached[0] != key:
+            # binary_event_frames 告知节点本端可解析二进制事件帧；未收到该字段的节点继续发送 Base64 文本事件包。
+            command = build_pi_command(
+                "SYNC_CONFIG",
+                {"wake_word": wake_word, "wake_aliases": wake_aliases, "binary_event_frames": True},
+            )
+            cached = self._handshake_cache["SYNC_CONFIG"] = (key, command)
+        return cached[1]
+
+    def _sync_policy_command(self) -> Tuple[str, int]:
+        version = expert_manager.policy_version
+        cached = self._handshake_cache.get("SYNC_POLICY")
+        if cached is None or cached[0] != version:
+            policies = expert_manager.get_aggregated_edge_policy()
+            command = build_pi_command("SYNC_POLICY", policies)
+            cached = self._handshake_cache["SYNC_POLICY"] = (version, (command, len(policies["event_policies"])))
+        return cached[1]
+
+    def _account_preview_frame(self, pi_id: str, dropped: bool) -> None:
+        window = self._flow_window[pi_id]
+        window[1] += 1
+        if dropped:
+            window[2] += 1
+        now = time.monotonic()
+        if now - window[0] < self.flow_window_seconds:
+            return
+        received, dropped_count = window[1], window[2]
+        window[:] = [now, 0, 0]
+        current = self._node_fps[pi_id]
+        if dropped_count * 4 > received:
+            fps = max(1.0, round(current / 2.0, 1))
+        elif dropped_count == 0:
+            fps = min(self.target_fps, current + 1.0)
+        else:
+            return
+        if fps != current:
+            self._node_fps[pi_id] = fps
+            self._queue_command(pi_id, build_pi_command("SET_FPS", fps))
+
+    async def _on_voice_command(self, pi_id: str, data: str) -> None:
+        self._handle_remote_voice(pi_id, data)
+
+    async def _on_caps(self, pi_id: str, data: str) -> None:
+        caps_raw = data.replace("PI_CAPS:", "", 1)
+        try:
+            self.node_caps[pi_id] = json.loads(caps_raw)
+            self.log_info(f"节点 [{pi_id}] 能力上报: {self.node_caps[pi_id]}")
+        except Exception:
+            self.log_error(f"节点 [{pi_id}] 能力上报解析失败")
+
+    async def _on_expert_ack(self, pi_id: str, data: str) -> None:
+        ack, ack_err = parse_pi_expert_ack(data)
+        if ack_err or not ack:
+            self.log_error(f"专家回传 ACK 解析失败: {ack_err}")
+            return
+        ack_event_id = str(ack.get("event_id", ""))
+        self.pending_result_acks.pop((pi_id, ack_event_id), None)
+        self._write_audit(f"node={pi_id} event_id={ack_event_id} ack={ack}")
+
+    async def _on_progress(self, pi_id: str, data: str) -> None:
+        payload_raw = data.replace("PI_PROGRESS:", "", 1)
+        try:
+            payload = json.loads(payload_raw)
+        except Exception as exc:
+            self.log_error(f"节点 [{pi_id}] 进度消息解析失败: {exc}")
+            return
+        self._handle_node_progress(pi_id, payload)
+
+    async def _on_text_edge_event(self, pi_id: str, data: str) -> None:
+        # 兼容旧版节点的 Base64 文本事件包。
+        await self._accept_edge_event(pi_id, *parse_pi_expert_packet(data))
+
+    async def _on_event_frame(self, pi_id: str, data: bytes) -> None:
+        # 新版节点以二进制帧上报事件关键帧，省去 Base64 膨胀与解码。
+        await self._accept_edge_event(pi_id, *parse_pi_expert_frame(data))
+
+    async def _recv_loop(self, pi_id: str, ws) -> None:
+        # 显式 recv 循环代替 async for，省去异步迭代器协议每帧一次的 __anext__ 包装；
+        # 每帧都会用到的属性与方法预先绑定为局部变量，完成回调也只构造一次。
+        recv = ws.recv
+        text_handlers = self._text_handlers
+        frame_handlers = self._frame_handlers
+        inflight = self._decode_inflight
+        account_frame = self._account_preview_frame
+        run_in_executor = self.loop.run_in_executor
+        decode_pool = self._decode_pool
+        decode_preview = self._decode_preview
+        on_decoded = functools.partial(self._on_preview_decoded, pi_id)
+        while self.running:
+            try:
+                data = await recv()
+            except websockets.ConnectionClosedOK:
+                break
+
+            # 文本帧按冒号前的消息类型、二进制帧按首字节操作码各做一次字典分发。
+            if isinstance(data, str):
+                handler = text_handlers.get(data.partition(":")[0])
+                if handler is not None:
+                    await handler(pi_id, data)
+                continue
+
+            handler = frame_handlers.get(data[0]) if data else None
+            if handler is not None:
+                await handler(pi_id, data)
+                continue
+
+            # 处理常规预览视频流的解码；上一帧仍在解码时直接丢弃新帧，预览只需要最新画面。
+            dropped = inflight[pi_id]
+            account_frame(pi_id, dropped)
+            if dropped:
+                continue
+            inflight[pi_id] = True
+            run_in_executor(decode_pool, decode_preview, pi_id, data).add_done_callback(on_decoded)
+        # 连接正常关闭时也要结束发送协程，交由外层统一标记离线并重连。
+        raise ConnectionError("节点连接已关闭")
+
+    async def _send_loop(self, pi_id: str, ws) -> None:
+        pending = self._send_pending[pi_id]
+        popleft = pending.popleft
+        ready = self._send_ready[pi_id]
+        send = ws.send
+        while self.running:
+            await ready.wait()
+            ready.clear()
+            while pending:
+                await send(popleft())
+
+    @staticmethod
+    def _reconnect_delay(attempt: int) -> float:
+        # 截断指数退避 + 全抖动：瞬断时通常 1 秒内重连，多台 PC 同时重连也会被打散。
+        # 2 ** 6 已超过 60 秒上限，先钳住指数，长时间离线的节点不会因浮点溢出拖垮整个 gather。
+        return random.uniform(0.0, min(60.0, 2.0 ** min(attempt, 6)))
+
+    @staticmethod
+    def _tune_node_socket(ws) -> None:
+        # Linux 下限制未确认数据的最长滞留时间，节点掉线约 15 秒即可被发现，而不是等待内核默认的数分钟。
+        if not hasattr(socket, "TCP_USER_TIMEOUT"):
+            return
+        sock = ws.transport.get_extra_info("socket") if ws.transport is not None else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_USER_TIMEOUT, 15000)
+        except OSError:
+            pass
+
     async def _node_handler(self, pi_id, ip):
         endpoint = str(ip).strip()
         if endpoint.startswith("ws://") or endpoint.startswith("wss://"):
@@ -195,106 +477,86 @@ class MultiPiManager:
         else:
             uri = f"ws://{endpoint}:8001"
         # 将节点连接置于死循环中，断线后继续自动重连。
+        attempt = 0
         while self.running:
             try:
                 self.node_status[pi_id] = "connecting"
-                async with websockets.connect(uri, ping_interval=None, proxy=None) as ws:
+                # 限制库内接收队列，消费跟不上时由 TCP 窗口向节点施加背压而不是在进程内堆积帧。
+                # JPEG 本身已压缩，关闭 permessage-deflate 以免两端为几乎为零的收益跑 zlib。
+                # 心跳与节点端保持一致并放宽超时，实验室弱网下既能发现僵死链路又不误判。
+                async with websockets.connect(
+                    uri,
+                    ping_interval=20,
+                    ping_timeout=20,
+                    proxy=None,
+                    compression=None,
+                    max_queue=4,
+                    max_size=4 * 1024 * 1024,
+                ) as ws:
                     self.node_status[pi_id] = "online"
                     self.log_info(f"节点 [{pi_id}] ({ip}) 握手成功")
-                    await self.send_queues[pi_id].put(f"CMD:SET_FPS:{self.target_fps}")
-
-                    sync_data = {
-                        "wake_word": get_config("voice_interaction.wake_word", "小爱同学"),
-                        "wake_aliases": str(
-                            get_config(
-                                "voice_interaction.wake_aliases",
-                                "小爱同学,小爱同,小爱,小艾同学,晓爱同学,哎同学,爱同学",
-                            )
-                            or ""
-                        ),
-                    }
-                    await self.send_queues[pi_id].put(f"CMD:SYNC_CONFIG:{json.dumps(sync_data, ensure_ascii=False)}")
-
-                    policies = expert_manager.get_aggregated_edge_policy()
-                    await self.send_queues[pi_id].put(f"CMD:SYNC_POLICY:{json.dumps(policies, ensure_ascii=False)}")
-                    self.log_info(f"已向节点 [{pi_id}] 下发 {len(policies['event_policies'])} 条专家策略")
-
-                    async def recv_stream_task():
-                        async for data in ws:
-                            if not self.running: break
-
-                            if isinstance(data, str):
-                                if data.startswith("PI_VOICE_COMMAND:"):
-                                    self._handle_remote_voice(pi_id, data)
-                                elif data.startswith("PI_CAPS:"):
-                                    caps_raw = data.replace("PI_CAPS:", "", 1)
-                                    try:
-                                        self.node_caps[pi_id] = json.loads(caps_raw)
-                                        self.log_info(f"节点 [{pi_id}] 能力上报: {self.node_caps[pi_id]}")
-                                    except Exception:
-                                        self.log_error(f"节点 [{pi_id}] 能力上报解析失败")
-                                elif data.startswith("PI_EXPERT_ACK:"):
-                                    ack, ack_err = parse_pi_expert_ack(data)
-                                    if ack_err or not ack:
-                                        self.log_error(f"专家回传 ACK 解析失败: {ack_err}")
-                                        continue
-                                    ack_event_id = str(ack.get("event_id", ""))
-                                    self.pending_result_acks.pop((pi_id, ack_event_id), None)
-                                    self._write_audit(f"node={pi_id} event_id={ack_event_id} ack={ack}")
-                                elif data.startswith("PI_PROGRESS:"):
-                                    payload_raw = data.replace("PI_PROGRESS:", "", 1)
-                                    try:
-                                        payload = json.loads(payload_raw)
-                                    except Exception as exc:
-                                        self.log_error(f"节点 [{pi_id}] 进度消息解析失败: {exc}")
-                                        continue
-                                    self._handle_node_progress(pi_id, payload)
-
-                                # 处理完整的边缘事件接收与解码逻辑。
-                                elif data.startswith("PI_EXPERT_EVENT:") or data.startswith("PI_YOLO_EVENT:"):
-                                    event, parse_error = parse_pi_expert_packet(data)
-                                    if parse_error or event is None:
-                                        self.log_error(f"处理边缘告警事件异常: {parse_error}")
-                                        continue
-
-                                    if event.event_id in self.recent_event_ids:
-                                        self.log_info(f"节点 [{pi_id}] 重复事件已忽略: {event.event_id}")
-                                        continue
-                                    self.recent_event_ids.add(event.event_id)
-                                    self.recent_event_queue.append(event.event_id)
-                                    while len(self.recent_event_ids) > self.recent_event_queue.maxlen:
-                                        expired = self.recent_event_queue.popleft()
-                                        self.recent_event_ids.discard(expired)
-
-                                    await self._enqueue_edge_event(pi_id, event)
-                                continue
-
-                            # 处理常规预览视频流的解码。
-                            arr = np.frombuffer(data, np.uint8)
-                            frame = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-                            if frame is not None:
-                                self.frame_buffers[pi_id] = frame
-
-                    async def send_command_task():
-                        while self.running:
-                            msg = await self.send_queues[pi_id].get()
-                            await ws.send(msg)
-
-                    await asyncio.gather(recv_stream_task(), send_command_task())
+                    attempt = 0
+                    self._tune_node_socket(ws)
+                    self._node_fps[pi_id] = self.target_fps
+                    self._flow_window[pi_id][:] = [time.monotonic(), 0, 0]
+                    self._queue_command(pi_id, build_pi_command("SET_FPS", self.target_fps))
+
+                    self._queue_command(pi_id, self._sync_config_command())
+                    policy_command, policy_count = self._sync_policy_command()
+                    self._queue_command(pi_id, policy_command)
+                    self.log_info(f"已向节点 [{pi_id}] 下发 {policy_count} 条专家策略")
+
+                    async with asyncio.TaskGroup() as tg:
+                        tg.create_task(self._recv_loop(pi_id, ws))
+                        tg.create_task(self._send_loop(pi_id, ws))
             except Exception as e:
+                if isinstance(e, ExceptionGroup):
+                    e = e.exceptions[0]
                 if self.running:
                     # 断线后不退出程序，而是标记为离线并继续后台重连。
                     self.node_status[pi_id] = "offline"
                     self.log_error(f"节点 [{pi_id}] ({ip}) 通信断开，正在后台尝试重连: {e}")
-                    await asyncio.sleep(5)
+                    # 指数退避叠加随机抖动，交换机重启后各节点不会在同一时刻集中重连。
+                    await asyncio.sleep(self._reconnect_delay(attempt))
+                    attempt += 1
 
     def _handle_remote_voice(self, pi_id, data):
-        cmd_text = data.replace("PI_VOICE_COMMAND:", "")
+        cmd_text = data[_VOICE_PREFIX_LEN:]
         self.log_info(f"收到节点 {pi_id} 语音指令: {cmd_text}")
-        from pc.voice.voice_interaction import get_remote_text_router
-        agent = get_remote_text_router()
+        if not self.enable_voice:
+            self.send_to_node(pi_id, build_pi_command("TTS", "PC 端语音助手未启用。"))
+            return
+        # 语音指令交给常驻工作线程串行处理，避免每条指令新建线程。
+        if self._voice_thread is None:
+            self._voice_thread = threading.Thread(target=self._voice_worker, name="RemoteVoiceWorker", daemon=True)
+            self._voice_thread.start()
+        self._voice_queue.put((pi_id, cmd_text))
+
+    def _get_voice_agent(self):
+        # 远端文本路由器是进程级单例，首次使用时才导入并缓存在实例上；未就绪时不缓存，下次继续尝试。
+        if not self.enable_voice:
+            return None
+        if self._voice_agent is None:
+            from pc.voice.voice_interaction import get_remote_text_router
+
+            self._voice_agent = get_remote_text_router()
+        return self._voice_agent
+
+    def _voice_worker(self) -> None:
+        while True:
+            item = self._voice_queue.get()
+            if item is None:
+                return
+            pi_id, cmd_text = item
+            try:
+                self._process_remote_voice(pi_id, cmd_text)
+            except Exception as exc:
+                self.log_error(f"节点 [{pi_id}] 语音指令处理失败: {exc}")
+
+    def _process_remote_voice(self, pi_id, cmd_text):
+        agent = self._get_voice_agent()
         if not agent:
-            self.send_to_node(pi_id, "CMD:TTS:PC 端语音助手未就绪，请检查依赖环境。")
+            self.send_to_node(pi_id, build_pi_command("TTS", "PC 端语音助手未就绪，请检查依赖环境。"))
             return
 
         def _reply(answer: str):
@@ -309,9 +571,15 @@ class MultiPiManager:
             preview = message if len(message) <= 120 else f"{message[:117]}..."
             self.log_info(f"已回传节点 {pi_id} 语音播报: {preview}")
             self._write_audit(f"node={pi_id} voice_command={cmd_text} reply={message}")
-            self.send_to_node(pi_id, f"CMD:TTS:{message}")
+            self.send_to_node(pi_id, build_pi_command("TTS", message))
 
-        threading.Thread(target=agent.process_remote_command, args=(pi_id, cmd_text, _reply), daemon=True).start()
+        agent.process_remote_command(pi_id, cmd_text, _reply)
+
+    def run(self) -> None:
+        """在当前线程运行节点连接事件循环；安装了 uvloop 时改用 libuv 事件循环。"""
+        loop_factory = uvloop.new_event_loop if uvloop is not None else None
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            runner.run(self.start())
 
     async def start(self):
         self.loop = asyncio.get_running_loop()
@@ -319,19 +587,39 @@ class MultiPiManager:
         tasks.extend(self._event_worker() for _ in range(self.event_worker_count))
         await asyncio.gather(*tasks)
 
+    def _queue_command(self, pi_id, text) -> None:
+        pending = self._send_pending.get(pi_id)
+        if pending is None:
+            return
+        pending.append(text)
+        self._send_ready[pi_id].set()
+
     def send_to_node(self, pi_id, text):
-        queue_ref = self.send_queues.get(pi_id)
-        if queue_ref is None:
+        if pi_id not in self._send_pending:
             return
         if self.loop is not None and self.loop.is_running():
-            self.loop.call_soon_threadsafe(queue_ref.put_nowait, text)
+            self.loop.call_soon_threadsafe(self._queue_command, pi_id, text)
         else:
-            queue_ref.put_nowait(text)
+            self._queue_command(pi_id, text)
+
+    def broadcast_to_nodes(self, text, *, online_only: bool = True) -> list:
+        """向多个节点下发同一条已编码命令，返回实际投递的节点列表。"""
+        targets = [
+            pi_id for pi_id in self.pi_dict
+            if not online_only or self.node_status.get(pi_id) == "online"
+        ]
+        for pi_id in targets:
+            self.send_to_node(pi_id, text)
+        return targets
 
     def stop(self):
         self.running = False
         self.pending_result_acks.clear()
         self.recent_policy_hits.clear()
+        self._decode_pool.shutdown(wait=False, cancel_futures=True)
+        self._expert_pool.shutdown(wait=False, cancel_futures=True)
+        if self._voice_thread is not None:
+            self._voice_queue.put(None)
         while not self.event_queue.empty():
             try:
                 self.event_queue.get_nowait()
@@ -1,21 +1,424 @@
+import atexit
+import ctypes
+import errno
 import json
+import selectors
 import socket
+import sys
+import threading
 import time
 
-from pc.core.config import get_config, set_config
+from pc.core.config import get_config, get_config_list, set_config
 from pc.core.logger import console_error, console_info, console_prompt
+from pc.core.network import get_local_ip, get_network_prefix
+from pc.core.subprocess_utils import run_hidden
+
+try:
+    from orjson import loads as _json_loads
+except Exception:  # pragma: no cover - optional dependency
+    _json_loads = json.loads
+
+try:
+    from zeroconf import IPVersion, ServiceBrowser, ServiceStateChange, Zeroconf
+except Exception:  # pragma: no cover - optional dependency
+    IPVersion = ServiceBrowser = ServiceStateChange = Zeroconf = None
+
+DEFAULT_WS_PORT = 8001
+MDNS_SERVICE_TYPE = "_videostream._tcp.local."
+_KNOWN_NODES_LIMIT = 8
+_KNOWN_NODES_MAX_AGE = 7 * 24 * 3600.0
+_RECVMMSG_BATCH = 32
+_DISCOVERY_BURST = 3
+_DISCOVERY_BURST_GAP = 0.05
+_DISCOVERY_SOCK: socket.socket | None = None
+_DISCOVERY_LOCK = threading.Lock()
+_DISCOVERY_PAYLOAD = json.dumps({"type": "pc_discovery", "service": "video_analysis"}, separators=(",", ":")).encode("utf-8")
+_DATAGRAM_SIZE = 1024
+_DISCOVERY_PORT = 50000
+
+
+class _IoVec(ctypes.Structure):
+    _fields_ = [("iov_base", ctypes.c_void_p), ("iov_len", ctypes.c_size_t)]
+
+
+class _SockAddrIn(ctypes.Structure):
+    _fields_ = [
+        ("sin_family", ctypes.c_ushort),
+        ("sin_port", ctypes.c_uint16),
+        ("sin_addr", ctypes.c_ubyte * 4),
+        ("sin_zero", ctypes.c_ubyte * 8),
+    ]
+
+
+class _MsgHdr(ctypes.Structure):
+    _fields_ = [
+        ("msg_name", ctypes.c_void_p),
+        ("msg_namelen", ctypes.c_uint32),
+        ("msg_iov", ctypes.POINTER(_IoVec)),
+        ("msg_iovlen", ctypes.c_size_t),
+        ("msg_control", ctypes.c_void_p),
+        ("msg_controllen", ctypes.c_size_t),
+        ("msg_flags", ctypes.c_int),
+    ]
+
+
+class _MMsgHdr(ctypes.Structure):
+    _fields_ = [("msg_hdr", _MsgHdr), ("msg_len", ctypes.c_uint)]
+
+
+_recvmmsg = None
+if sys.platform.startswith("linux"):
+    try:
+        _recvmmsg = ctypes.CDLL(None, use_errno=True).recvmmsg
+        _recvmmsg.argtypes = [ctypes.c_int, ctypes.POINTER(_MMsgHdr), ctypes.c_uint, ctypes.c_int, ctypes.c_void_p]
+        _recvmmsg.restype = ctypes.c_int
+    except (OSError, AttributeError):
+        _recvmmsg = None
 
 
 def _virtual_endpoints() -> list[str]:
-    hosts_raw = str(get_config("network.virtual_pi_hosts", "") or "").strip()
-    if hosts_raw:
-        endpoints = [item.strip() for item in hosts_raw.split(",") if item.strip()]
-        if endpoints:
-            return endpoints
+    endpoints = get_config_list("network.virtual_pi_hosts")
+    if endpoints:
+        return endpoints
     host = str(get_config("network.virtual_pi_host", "127.0.0.1")).strip() or "127.0.0.1"
     return [host]
 
 
+def _probe_ports(targets, timeout: float = 0.5, limit: int = 0) -> list[tuple[str, int]]:
+    """单线程并发探测 TCP 端口：非阻塞 connect 后用 selector 等待可写，SO_ERROR 为 0 即端口开放。
+
+    limit > 0 时找够即提前返回；结果按连接建立的先后排列。
+    """
+    selector = selectors.DefaultSelector()
+    opened: list[tuple[str, int]] = []
+    try:
+        for target in targets:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sock.setblocking(False)
+            if sock.connect_ex(target) not in (0, errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY):
+                sock.close()
+                continue
+            selector.register(sock, selectors.EVENT_WRITE, target)
+        deadline = time.monotonic() + timeout
+        while selector.get_map() and (remaining := deadline - time.monotonic()) > 0:
+            for key, _events in selector.select(remaining):
+                sock = key.fileobj
+                selector.unregister(sock)
+                if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    opened.append(key.data)
+                sock.close()
+                if 0 < limit <= len(opened):
+                    return opened
+    finally:
+        for key in list(selector.get_map().values()):
+            key.fileobj.close()
+        selector.close()
+    return opened
+
+
+def _sweep_subnet(limit: int, exclude=(), port: int = DEFAULT_WS_PORT, timeout: float = 0.5) -> dict[str, str]:
+    """广播被屏蔽（如无线 AP 隔离）时，并发探测本机 /24 网段内开放节点端口的主机，找够 limit 台即停止。
+
+    端口开放的主机还要单播应答发现请求才算作 Pi 节点，返回 {ip: endpoint}。
+    """
+    local_ip = get_local_ip()
+    if limit <= 0 or local_ip.startswith("127."):
+        return {}
+    prefix = get_network_prefix()
+    skipped = {local_ip, *exclude}
+    candidates = [f"{prefix}{i}" for i in range(1, 255) if f"{prefix}{i}" not in skipped]
+    # ARP 表里的主机最近确实在线，先只探测它们；数量太少说明表不可信，直接全网段探测。
+    recent = _live_hosts_from_arp(prefix)
+    batches = [candidates]
+    if len(recent) >= 3:
+        batches = [[ip for ip in candidates if ip in recent], [ip for ip in candidates if ip not in recent]]
+    found: dict[str, str] = {}
+    for batch in batches:
+        # 同一端口上可能是打印机、开发服务器等其他服务，整批探测完再逐一确认。
+        opened = _probe_ports([(ip, port) for ip in batch], timeout)
+        found.update(_confirm_pi_nodes([ip for ip, _port in opened], timeout))
+        if len(found) >= limit:
+            break
+    return found
+
+
+def _parse_pi_response(data, addr) -> tuple[str, str] | None:
+    """解析 Pi 的发现应答，返回 (ip, endpoint)；不是 raspberry_pi_response 时返回 None。"""
+    try:
+        resp = _json_loads(data)
+    except Exception:
+        return None
+    if not isinstance(resp, dict) or resp.get("type") != "raspberry_pi_response":
+        return None
+    ip = str(resp.get("ip", addr[0]) or addr[0]).strip()
+    ws_port = str(resp.get("ws_port", "") or "").strip()
+    if not ip:
+        return None
+    return ip, f"{ip}:{ws_port}" if ws_port else ip
+
+
+def _confirm_pi_nodes(ips, timeout: float = 0.5) -> dict[str, str]:
+    """向候选主机的发现端口单播请求，只保留回复 raspberry_pi_response 的主机，返回 {ip: endpoint}。"""
+    pending = set(ips)
+    confirmed: dict[str, str] = {}
+    if not pending:
+        return confirmed
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        for ip in sorted(pending):
+            try:
+                sock.sendto(_DISCOVERY_PAYLOAD, (ip, _DISCOVERY_PORT))
+            except OSError:
+                continue
+        for data, addr in _receive_datagrams(sock, timeout):
+            parsed = _parse_pi_response(data, addr)
+            if addr[0] in pending and parsed is not None:
+                confirmed[addr[0]] = parsed[1]
+                pending.discard(addr[0])
+            if not pending:
+                break
+    finally:
+        sock.close()
+    return confirmed
+
+
+def _live_hosts_from_arp(prefix: str) -> set[str]:
+    """读取本机 ARP 缓存中位于本网段、已完成解析的主机 IP。"""
+    hosts: set[str] = set()
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/net/arp", encoding="ascii", errors="ignore") as handle:
+                rows = [line.split() for line in handle.readlines()[1:]]
+            hosts = {row[0] for row in rows if len(row) >= 4 and row[2] != "0x0"}
+        elif sys.platform.startswith("win"):
+            output = run_hidden(["arp", "-a"], capture_output=True, text=True, timeout=3).stdout
+            hosts = {parts[0] for parts in (line.split() for line in output.splitlines()) if len(parts) >= 3 and parts[1].count("-") == 5}
+    except Exception:
+        return set()
+    return {ip for ip in hosts if ip.startswith(prefix)}
+
+
+def _split_endpoint(endpoint: str) -> tuple[str, int]:
+    host, _, port = str(endpoint).partition(":")
+    try:
+        return host, int(port) if port else DEFAULT_WS_PORT
+    except ValueError:
+        return host, DEFAULT_WS_PORT
+
+
+def _load_known_nodes() -> list[str]:
+    """读取最近验证过的节点端点（最新在前），丢弃超过 7 天的记录。"""
+    try:
+        rows = json.loads(str(get_config("network.known_nodes", "") or "[]"))
+    except Exception:
+        return []
+    now = time.time()
+    endpoints: list[str] = []
+    for row in rows if isinstance(rows, list) else []:
+        if not isinstance(row, dict):
+            continue
+        endpoint = str(row.get("endpoint", "") or "").strip()
+        if endpoint and now - float(row.get("ts", 0) or 0) <= _KNOWN_NODES_MAX_AGE and endpoint not in endpoints:
+            endpoints.append(endpoint)
+    return endpoints[:_KNOWN_NODES_LIMIT]
+
+
+def _remember_nodes(endpoints) -> None:
+    """把本次确认在线的节点提到缓存最前，最多保留 8 条。"""
+    fresh = [str(item) for item in endpoints if str(item)]
+    if not fresh:
+        return
+    merged = fresh + [item for item in _load_known_nodes() if item not in fresh]
+    now = time.time()
+    rows = [{"endpoint": endpoint, "ts": now} for endpoint in merged[:_KNOWN_NODES_LIMIT]]
+    set_config("network.known_nodes", json.dumps(rows, ensure_ascii=False))
+
+
+def _probe_known_nodes(endpoints: list[str], timeout: float = 0.5) -> list[str]:
+    if not endpoints:
+        return []
+    alive = set(_probe_ports([_split_endpoint(endpoint) for endpoint in endpoints], timeout))
+    return [endpoint for endpoint in endpoints if _split_endpoint(endpoint) in alive]
+
+
+def _recvmmsg_batch(sock, n: int = _RECVMMSG_BATCH, buflen: int = _DATAGRAM_SIZE) -> list:
+    """Linux 下用一次 recvmmsg(2) 取回至多 n 个 IPv4 数据报；队列为空时返回空列表。"""
+    buffers = (ctypes.c_char * (n * buflen))()
+    iovecs = (_IoVec * n)()
+    addrs = (_SockAddrIn * n)()
+    headers = (_MMsgHdr * n)()
+    base = ctypes.addressof(buffers)
+    for i in range(n):
+        iovecs[i].iov_base = base + i * buflen
+        iovecs[i].iov_len = buflen
+        header = headers[i].msg_hdr
+        header.msg_name = ctypes.addressof(addrs[i])
+        header.msg_namelen = ctypes.sizeof(_SockAddrIn)
+        header.msg_iov = ctypes.pointer(iovecs[i])
+        header.msg_iovlen = 1
+    count = _recvmmsg(sock.fileno(), headers, n, socket.MSG_DONTWAIT, None)
+    if count < 0:
+        err = ctypes.get_errno()
+        if err in (errno.EAGAIN, errno.EWOULDBLOCK, errno.EINTR):
+            return []
+        raise OSError(err, "recvmmsg failed")
+    return [
+        (
+            ctypes.string_at(base + i * buflen, headers[i].msg_len),
+            (socket.inet_ntoa(bytes(addrs[i].sin_addr)), socket.ntohs(addrs[i].sin_port)),
+        )
+        for i in range(count)
+    ]
+
+
+def _browse_mdns(limit: int, timeout: float = 2.0, exclude=(), done: threading.Event | None = None) -> list[str]:
+    """安装了 zeroconf 时监听 Pi 通告的 mDNS 服务，找到 limit 台 exclude 之外的节点、超时或 done 被置位即返回。
+
+    找够时会置位 done，与之并行的广播可据此提前结束。
+    """
+    if Zeroconf is None or limit <= 0:
+        return []
+    found: dict[str, str] = {}
+    skipped = set(exclude)
+    done = done or threading.Event()
+
+    def _on_service_state_change(zeroconf, service_type, name, state_change) -> None:
+        if state_change is not ServiceStateChange.Added:
+            return
+        info = zeroconf.get_service_info(service_type, name, timeout=1000)
+        if info is None or not info.port:
+            return
+        for ip in info.parsed_addresses(IPVersion.V4Only):
+            if ip not in skipped:
+                found.setdefault(ip, f"{ip}:{info.port}")
+        if len(found) >= limit:
+            done.set()
+
+    try:
+        zeroconf = Zeroconf()
+    except Exception:
+        return []
+    try:
+        ServiceBrowser(zeroconf, MDNS_SERVICE_TYPE, handlers=[_on_service_state_change])
+        done.wait(timeout)
+    finally:
+        zeroconf.close()
+    return list(found.values())
+
+
+def _read_ready_datagrams(sock) -> list:
+    """非阻塞地一次取空内核接收队列中已到达的全部数据报。"""
+    datagrams = []
+    if _recvmmsg is not None and sock.family == socket.AF_INET:
+        try:
+            while True:
+                batch = _recvmmsg_batch(sock)
+                datagrams.extend(batch)
+                if len(batch) < _RECVMMSG_BATCH:
+                    return datagrams
+        except OSError:
+            pass
+    while True:
+        try:
+            datagrams.append(sock.recvfrom(_DATAGRAM_SIZE))
+        except InterruptedError:
+            continue
+        except OSError:
+            # 队列已空（BlockingIOError），或套接字已关闭/出错：交还已读到的数据，由外层按截止时间收尾。
+            return datagrams
+
+
+def _receive_blocking(sock, deadline: float, stop: threading.Event | None = None):
+    while time.monotonic() < deadline and not (stop is not None and stop.is_set()):
+        try:
+            yield sock.recvfrom(1024)
+        except socket.timeout:
+            return
+        except OSError:
+            continue
+
+
+def _receive_datagrams(sock, timeout: float, stop: threading.Event | None = None):
+    """在截止时间内逐个产出 (data, addr)；套接字就绪一次就批量读完积压的应答。
+
+    传入 stop 时每 0.1s 检查一次，置位后提前结束。
+    """
+    deadline = time.monotonic() + timeout
+    selector = selectors.DefaultSelector()
+    try:
+        selector.register(sock, selectors.EVENT_READ)
+    except (ValueError, OSError):
+        # 没有可注册的文件描述符（如测试替身）时退回阻塞 recvfrom。
+        selector.close()
+        yield from _receive_blocking(sock, deadline, stop)
+        return
+    sock.setblocking(False)
+    try:
+        while (remaining := deadline - time.monotonic()) > 0:
+            if stop is not None and stop.is_set():
+                return
+            if not selector.select(remaining if stop is None else min(remaining, 0.1)):
+                if stop is None:
+                    return
+                continue
+            yield from _read_ready_datagrams(sock)
+    finally:
+        selector.close()
+
+
+def _discovery_socket() -> socket.socket:
+    """进程内复用同一个广播套接字，避免每次扫描都重新创建/关闭。"""
+    global _DISCOVERY_SOCK
+    if _DISCOVERY_SOCK is None:
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        atexit.register(sock.close)
+        _DISCOVERY_SOCK = sock
+    return _DISCOVERY_SOCK
+
+
+def _drop_discovery_socket() -> None:
+    global _DISCOVERY_SOCK
+    if _DISCOVERY_SOCK is not None:
+        _DISCOVERY_SOCK.close()
+        _DISCOVERY_SOCK = None
+
+
+def _broadcast_discover(
+    expected_count: int,
+    timeout: float,
+    found_endpoints: dict[str, str],
+    stop: threading.Event | None = None,
+) -> None:
+    sock = _discovery_socket()
+    sock.settimeout(timeout)
+    try:
+        # UDP 广播可能丢包，间隔 50ms 连发 3 次；重复应答按 IP 去重。
+        for index in range(_DISCOVERY_BURST):
+            if index:
+                time.sleep(_DISCOVERY_BURST_GAP)
+            sock.sendto(_DISCOVERY_PAYLOAD, ("<broadcast>", _DISCOVERY_PORT))
+        for data, addr in _receive_datagrams(sock, timeout, stop):
+            parsed = _parse_pi_response(data, addr)
+            if parsed is not None and parsed[1] not in found_endpoints.values():
+                ip, endpoint = parsed
+                found_endpoints[ip] = endpoint
+                console_info(f"发现节点: {endpoint} ({len(found_endpoints)}/{expected_count})")
+            if len(found_endpoints) >= expected_count:
+                break
+    except OSError:
+        # 网卡切换等错误后套接字可能已失效，下次扫描重新创建。
+        _drop_discovery_socket()
+        raise
+
+
+def _finish_scan(found_endpoints: dict[str, str]) -> dict:
+    _remember_nodes(found_endpoints.values())
+    ordered = [found_endpoints[ip] for ip in sorted(found_endpoints)]
+    return {str(i + 1): endpoint for i, endpoint in enumerate(ordered)}
+
+
 def scan_multi_nodes(expected_count: int, timeout: float = 3.0) -> dict:
     """Broadcast-discover Pi nodes, or return local virtual nodes when enabled."""
     console_info(f"正在扫描网络，预期寻找 {expected_count} 台设备...")
@@ -25,37 +428,45 @@ def scan_multi_nodes(expected_count: int, timeout: float = 3.0) -> dict:
         console_info(f"已启用本地虚拟 Pi 节点，直接使用 {len(endpoints)} 个端点: {endpoints}")
         return {str(i + 1): endpoint for i, endpoint in enumerate(endpoints)}
 
-    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-    sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-    sock.settimeout(timeout)
-
-    msg = json.dumps({"type": "pc_discovery", "service": "video_analysis"}).encode("utf-8")
+    # 先并发探测上次确认过的节点：DHCP 租约稳定时无需广播即可直接返回。
     found_endpoints: dict[str, str] = {}
+    for endpoint in _probe_known_nodes(_load_known_nodes()):
+        found_endpoints[_split_endpoint(endpoint)[0]] = endpoint
+    if found_endpoints and len(found_endpoints) >= expected_count:
+        console_info(f"已命中缓存的在线节点: {list(found_endpoints.values())}")
+        return _finish_scan(found_endpoints)
 
+    # mDNS 浏览与 UDP 广播并行：不通告 mDNS 的旧节点不必多等，任一方找够节点即结束另一方。
+    mdns_done = threading.Event()
+    mdns_found: list[str] = []
+    mdns_thread = threading.Thread(
+        target=lambda: mdns_found.extend(
+            _browse_mdns(expected_count - len(found_endpoints), timeout, exclude=set(found_endpoints), done=mdns_done)
+        ),
+        name="MdnsBrowse",
+        daemon=True,
+    )
+    mdns_thread.start()
     try:
-        sock.sendto(msg, ("<broadcast>", 50000))
-        start_time = time.time()
-        while (time.time() - start_time) < timeout and len(found_endpoints) < expected_count:
-            try:
-                data, addr = sock.recvfrom(1024)
-                payload = data.decode("utf-8", errors="ignore")
-                resp = json.loads(payload)
-                if resp.get("type") == "raspberry_pi_response":
-                    ip = str(resp.get("ip", addr[0]) or addr[0]).strip()
-                    ws_port = str(resp.get("ws_port", "") or "").strip()
-                    endpoint = f"{ip}:{ws_port}" if ws_port else ip
-                    if ip and endpoint not in found_endpoints.values():
-                        found_endpoints[ip] = endpoint
-                        console_info(f"发现节点: {endpoint} ({len(found_endpoints)}/{expected_count})")
-            except socket.timeout:
-                break
-            except Exception:
-                continue
+        with _DISCOVERY_LOCK:
+            _broadcast_discover(expected_count, timeout, found_endpoints, stop=mdns_done)
     finally:
-        sock.close()
+        mdns_done.set()
+        mdns_thread.join()
+    for endpoint in mdns_found:
+        ip = _split_endpoint(endpoint)[0]
+        if ip not in found_endpoints:
+            found_endpoints[ip] = endpoint
+            console_info(f"mDNS 发现节点: {endpoint} ({len(found_endpoints)}/{expected_count})")
 
-    ordered = [found_endpoints[ip] for ip in sorted(found_endpoints)]
-    return {str(i + 1): endpoint for i, endpoint in enumerate(ordered)}
+    missing = expected_count - len(found_endpoints)
+    if missing > 0 and bool(get_config("network.subnet_sweep_enabled", True)):
+        console_info(f"广播仅发现 {len(found_endpoints)} 台设备，正在并发探测本网段 {DEFAULT_WS_PORT} 端口...")
+        for ip, endpoint in sorted(_sweep_subnet(missing, exclude=found_endpoints).items()):
+            found_endpoints[ip] = endpoint
+            console_info(f"发现节点: {endpoint} ({len(found_endpoints)}/{expected_count})")
+
+    return _finish_scan(found_endpoints)
 
 
 def get_lab_topology() -> dict:
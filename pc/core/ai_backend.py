@@ -10,8 +10,9 @@ from typing import Any, Dict, List, Tuple
 
 import cv2
 import requests
+from requests.adapters import HTTPAdapter
 
-from pc.core.config import get_config, set_config
+from pc.core.config import get_config, get_config_list, set_config
 from pc.core.logger import console_error, console_info
 from pc.core.runtime_assets import DEFAULT_OLLAMA_MODELS, ollama_asset_root, ollama_model_options
 from pc.core.subprocess_utils import run_hidden
@@ -149,6 +150,7 @@ _STATE: Dict[str, str] = {
 
 _LOCAL_MODEL_CACHE: Dict[Tuple[str, str], Dict[str, Any]] = {}
 _OLLAMA_SESSION: requests.Session | None = None
+_CLOUD_SESSION: requests.Session | None = None
 
 
 def ollama_host() -> str:
@@ -161,12 +163,29 @@ def _ollama_session() -> requests.Session:
     """本地 Ollama 请求固定绕过系统代理，避免 127.0.0.1 被错误转发到本机代理端口。"""
     global _OLLAMA_SESSION
     if _OLLAMA_SESSION is None:
-        session = requests.Session()
+        session = _pooled_session()
         session.trust_env = False
         _OLLAMA_SESSION = session
     return _OLLAMA_SESSION
 
 
+def _cloud_session() -> requests.Session:
+    """云端模型请求复用连接池，连续逐帧分析时不必每次重新做 TCP/TLS 握手。"""
+    global _CLOUD_SESSION
+    if _CLOUD_SESSION is None:
+        _CLOUD_SESSION = _pooled_session()
+    return _CLOUD_SESSION
+
+
+def _pooled_session() -> requests.Session:
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["Connection"] = "keep-alive"
+    return session
+
+
 def ollama_runtime_env() -> Dict[str, str]:
     """返回固定到项目目录的 Ollama 运行环境变量。"""
     env = os.environ.copy()
@@ -243,7 +262,7 @@ def list_openai_compatible_models(backend: str) -> List[str]:
     if not base_url:
         return []
     try:
-        response = requests.get(
+        response = _cloud_session().get(
             f"{base_url}/models",
             headers=_auth_headers(backend, config),
             timeout=min(_timeout_seconds(), 5.0),
@@ -261,11 +280,37 @@ def list_openai_compatible_models(backend: str) -> List[str]:
         return []
 
 
+_OLLAMA_MODELS_TTL = 30.0
+
+
+def invalidate_ollama_models_cache() -> None:
+    """拉取或删除模型后调用，使下一次 list_ollama_models 重新查询。"""
+    _STATE.pop("_ollama_models_cache_ts", None)
+
+
 def list_ollama_models() -> List[str]:
     cache_key = "_ollama_models_cache"
     cache_ts_key = "_ollama_models_cache_ts"
     error_ts_key = "_ollama_models_error_ts"
     cached_models = list(_STATE.get(cache_key) or [])
+    # 每次本地推理前都会确认模型已安装，30 秒内直接复用上次结果，避免反复启动 ollama 子进程。
+    cached_ts = _STATE.get(cache_ts_key)
+    if cached_ts is not None and time.monotonic() - float(cached_ts) < _OLLAMA_MODELS_TTL:
+        return cached_models
+    # 守护进程在线时 /api/tags 只需一次本地 HTTP 请求；仅在连不上时才退回启动 ollama 子进程。
+    try:
+        response = _ollama_session().get(f"{ollama_host()}/api/tags", timeout=2)
+        response.raise_for_status()
+        models: List[str] = [str(item.get("name", "")) for item in response.json().get("models", []) if item.get("name")]
+        unique_models = sorted(set(models))
+        _STATE[cache_key] = list(unique_models)
+        _STATE[cache_ts_key] = time.monotonic()
+        return unique_models
+    except requests.ConnectionError:
+        pass
+    except Exception:
+        return cached_models
+
     try:
         ollama_exe = "ollama"
         default_path = r"C:\Users\Administrator\AppData\Local\Programs\Ollama\ollama.exe"
@@ -280,14 +325,14 @@ def list_ollama_models() -> List[str]:
             env=ollama_runtime_env(),
         )
         if result.returncode == 0:
-            models: List[str] = []
+            models = []
             for line in result.stdout.strip().splitlines()[1:]:
                 parts = line.split()
                 if parts:
                     models.append(parts[0])
             unique_models = sorted(set(models))
             _STATE[cache_key] = list(unique_models)
-            _STATE[cache_ts_key] = time.time()
+            _STATE[cache_ts_key] = time.monotonic()
             return unique_models
     except Exception as exc:
         now = time.time()
@@ -295,17 +340,7 @@ def list_ollama_models() -> List[str]:
         if now - last_error_ts >= 60.0:
             console_error(f"获取 Ollama 模型列表失败: {exc}")
             _STATE[error_ts_key] = now
-
-    try:
-        response = _ollama_session().get(f"{ollama_host()}/api/tags", timeout=8)
-        response.raise_for_status()
-        models = [str(item.get("name", "")) for item in response.json().get("models", []) if item.get("name")]
-        unique_models = sorted(set(models))
-        _STATE[cache_key] = list(unique_models)
-        _STATE[cache_ts_key] = time.time()
-        return unique_models
-    except Exception:
-        return cached_models
+    return cached_models
 
 
 def ensure_ollama_model_available(model: str) -> bool:
@@ -326,6 +361,7 @@ def ensure_ollama_model_available(model: str) -> bool:
     except Exception as exc:
         console_error(f"[OLLAMA] 模型拉取失败: {target_model} -> {exc}")
         return False
+    invalidate_ollama_models_cache()
     installed = list_ollama_models()
     ready = target_model in installed
     if ready:
@@ -341,8 +377,7 @@ def list_local_adapter_models() -> List[str]:
 
 
 def configured_model_catalog() -> Dict[str, List[str]]:
-    raw_defaults = get_config("ollama.default_models", ", ".join(DEFAULT_OLLAMA_MODELS))
-    default_models = [item.strip() for item in str(raw_defaults).split(",") if item.strip()]
+    default_models = get_config_list("ollama.default_models", ", ".join(DEFAULT_OLLAMA_MODELS))
     local_ollama_models = list_ollama_models()
     merged_ollama_models: List[str] = []
     for item in list(local_ollama_models) + default_models:
@@ -387,8 +422,13 @@ def _timeout_seconds() -> float:
         return 20.0
 
 
-def _encode_frame(frame: Any) -> str:
-    ok, encoded = cv2.imencode(".jpg", frame)
+def _encode_frame(frame: Any, quality: int = 75, max_side: int = 1280) -> str:
+    """编码为 base64 JPEG；视觉模型内部本就会降采样，长边超过 max_side 时先缩小以减小上传体积。"""
+    height, width = frame.shape[:2]
+    if max(height, width) > max_side:
+        scale = max_side / float(max(height, width))
+        frame = cv2.resize(frame, (max(1, round(width * scale)), max(1, round(height * scale))), interpolation=cv2.INTER_AREA)
+    ok, encoded = cv2.imencode(".jpg", frame, [int(cv2.IMWRITE_JPEG_QUALITY), quality, int(cv2.IMWRITE_JPEG_OPTIMIZE), 1])
     if not ok:
         raise RuntimeError("图像编码失败")
     return base64.b64encode(encoded.tobytes()).decode("utf-8")
@@ -483,7 +523,7 @@ def _openai_chat_completion(
         "temperature": 0.3,
         "max_tokens": max_tokens,
     }
-    response = requests.post(
+    response = _cloud_session().post(
         f"{base_url}/chat/completions",
         headers=headers,
         json=payload,
@@ -499,6 +539,41 @@ def _openai_chat_completion(
     return result or "模型服务未返回文本内容。"
 
 
+def _ollama_stream_chunks(prompt: str, model: str, frame: Any | None = None) -> Iterator[Dict[str, Any]]:
+    """以流式方式请求 /api/generate，逐个产出 Ollama 返回的 JSON 片段。"""
+    if not ensure_ollama_model_available(model):
+        raise RuntimeError(f"Ollama 模型不可用：{model}")
+    host = ollama_host()
+    options = {
+        "temperature": 0.3,
+    }
+    options.update(ollama_model_options(model))
+    payload: Dict[str, Any] = {
+        "model": model,
+        "prompt": prompt,
+        "stream": True,
+        "options": options,
+    }
+    # Qwen3.5 在本项目场景下更适合直接给最终答案，避免把时间耗在 thinking 轨迹上。
+    if str(model or "").strip().startswith("qwen3.5:"):
+        payload["think"] = False
+    if frame is not None:
+        payload["images"] = [_encode_frame(frame)]
+    with _ollama_session().post(f"{host}/api/generate", json=payload, stream=True, timeout=_timeout_seconds()) as response:
+        response.raise_for_status()
+        for line in response.iter_lines():
+            if line:
+                yield json.loads(line)
+
+
+def stream_ollama_text(prompt: str, model: str, frame: Any | None = None) -> Iterator[str]:
+    """逐段产出模型正文，便于语音播报在首个分句生成后即可开始。"""
+    for chunk in _ollama_stream_chunks(prompt, model, frame=frame):
+        text = str(chunk.get("response", "") or "")
+        if text:
+            yield text
+
+
 def _ollama_generate(prompt: str, model: str, frame: Any | None = None) -> str:
     if not ensure_ollama_model_available(model):
         raise RuntimeError(f"Ollama 模型不可用：{model}")
@@ -1,5 +1,27 @@
 ﻿from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class EdgePolicy:
+    """不可变的边缘触发策略，专家在模块级定义一次后直接返回。"""
+
+    event_name: str
+    trigger_classes: Tuple[str, ...] = ()
+    condition: str = "any"
+    action: str = "full_frame"
+    cooldown: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """转换为下发到树莓派的 JSON 字典。"""
+        return {
+            "event_name": self.event_name,
+            "trigger_classes": list(self.trigger_classes),
+            "condition": self.condition,
+            "action": self.action,
+            "cooldown": self.cooldown,
+        }
 
 
 class BaseExpert(ABC):
@@ -19,8 +41,8 @@ class BaseExpert(ABC):
         return []
 
     @abstractmethod
-    def get_edge_policy(self) -> Dict[str, Any] | List[Dict[str, Any]]:
-        """返回边缘策略，可为单个 dict 或 dict 列表。"""
+    def get_edge_policy(self) -> EdgePolicy | Tuple[EdgePolicy, ...] | Dict[str, Any] | List[Dict[str, Any]]:
+        """返回边缘策略，可为单个 EdgePolicy / dict，或它们的列表、元组。"""
         pass
 
     @abstractmethod
@@ -29,6 +51,7 @@ class BaseExpert(ABC):
 
     @abstractmethod
     def analyze(self, frame: Any, context: dict) -> str:
+        """分析一帧事件；context 的 detected_classes 为原始类别，detected_classes_set 为调度层解析好的小写 frozenset。"""
         pass
 
     def self_check(self) -> Dict[str, Any]:
@@ -4,9 +4,15 @@
 
 from __future__ import annotations
 
+import atexit
 import configparser
+import io
 import os
-from typing import Any
+import re
+import sys
+import threading
+from contextlib import contextmanager
+from typing import Any, Iterator
 
 from pc.app_identity import resource_path
 from pc.core.runtime_assets import DEFAULT_OLLAMA_MODELS, sensevoice_model_dir, vosk_model_dir
@@ -15,7 +21,22 @@ from pc.core.runtime_assets import DEFAULT_OLLAMA_MODELS, sensevoice_model_dir,
 project_root = str(resource_path("pc"))
 config_file = str(resource_path("config.ini"))
 
-_config = configparser.ConfigParser()
+# 配置值中不使用 %()s 插值，关闭插值以省去每次读取时的插值处理。
+_config = configparser.ConfigParser(interpolation=None)
+_initialized = False
+_init_lock = threading.Lock()
+# 已完成类型转换的配置值，set_config 时整体失效；热路径上的读取只需一次字典查找。
+_value_cache: dict[str, Any] = {}
+# 逗号分隔列表（如 ollama.default_models）拆分后的结果，与 _value_cache 同步失效。
+_list_cache: dict[str, tuple[str, ...]] = {}
+# set_config 每次使缓存失效时递增；读取开始后代数变化说明读到的可能是旧值，不再写入缓存。
+_cache_generation = 0
+# set_config 只修改内存中的解析结果，250ms 内的连续写入合并为一次落盘。
+_FLUSH_DELAY = 0.25
+_flush_lock = threading.Lock()
+_flush_timer: threading.Timer | None = None
+_dirty = False
+_batch_depth = 0
 
 _DEFAULT_CONFIG = {
     "ai_backend": {
@@ -113,6 +134,7 @@ _DEFAULT_CONFIG = {
         "wake_phrase_time_limit": "4.0",
         "command_timeout": "6.0",
         "command_phrase_time_limit": "12.0",
+        "max_speech_bytes": "360",
         "online_recognition": "True",
         "asr_engine": "auto",
         "wake_engine": "auto",
@@ -195,35 +217,93 @@ _DEFAULT_CONFIG = {
 
 
 def _save_config() -> None:
+    buffer = io.StringIO()
+    _config.write(buffer)
+    data = buffer.getvalue().encode("utf-8-sig")
+    # 内容未变化时不重写文件，树莓派 SD 卡等慢速存储上可省去一次写入。
+    try:
+        with open(config_file, "rb") as existing:
+            if existing.read() == data:
+                return
+    except OSError:
+        pass
     config_dir = os.path.dirname(config_file)
     if config_dir:
         os.makedirs(config_dir, exist_ok=True)
-    with open(config_file, "w", encoding="utf-8-sig") as configfile:
-        _config.write(configfile)
+    with open(config_file, "wb") as configfile:
+        configfile.write(data)
+
+
+_SECTION_RE = re.compile(r"^\[([^\]]+)\]$")
+_OPTION_RE = re.compile(r"^([^=:]+?)\s*[:=]\s*(.*)$")
+
+
+def _read_ini(path: str) -> dict[str, dict[str, str]]:
+    """单遍解析 config.ini 为嵌套字典；只支持本项目用到的子集（整行注释、缩进续行），写回仍交给 configparser。"""
+    sections: dict[str, dict[str, str]] = {}
+    current: dict[str, str] | None = None
+    last_key = ""
+    with open(path, encoding="utf-8-sig") as handle:
+        for raw_line in handle:
+            line = raw_line.rstrip("\r\n")
+            stripped = line.strip()
+            if not stripped or stripped[0] in "#;":
+                continue
+            if current is not None and last_key and line[0] in " \t":
+                current[last_key] += "\n" + stripped
+                continue
+            match = _SECTION_RE.match(stripped)
+            if match:
+                current = sections.setdefault(sys.intern(match.group(1)), {})
+                last_key = ""
+                continue
+            match = _OPTION_RE.match(stripped)
+            if match and current is not None:
+                last_key = sys.intern(match.group(1).strip().lower())
+                current[last_key] = match.group(2).strip()
+    return sections
+
+
+def _parse_config_file(path: str) -> dict[str, dict[str, str]] | None:
+    # 直接打开文件，不存在时返回 None，省去单独的存在性检查。
+    try:
+        return _read_ini(path)
+    except FileNotFoundError:
+        return None
+
+
+def _merge_default_models(existing_val: str, default_val: str) -> bool:
+    existing_list = [x.strip() for x in existing_val.split(",") if x.strip()]
+    missing_items = [x.strip() for x in default_val.split(",") if x.strip() and x.strip() not in existing_list]
+    if not missing_items:
+        return False
+    _config.set("ollama", "default_models", ", ".join(existing_list + missing_items))
+    return True
 
 
 def _init_config() -> None:
-    if os.path.exists(config_file):
-        _config.read(config_file, encoding="utf-8-sig")
+    parsed = _parse_config_file(config_file)
+    # 首次运行直接整体载入默认模板，下面的逐项补齐循环随即全部命中。
+    _config.read_dict(_DEFAULT_CONFIG if parsed is None else parsed)
 
-    needs_save = False
+    # 只收集缺失的默认项，一次 read_dict 补齐（增量合并，不覆盖用户已有值）。
+    missing: dict[str, dict[str, str]] = {}
     for section, options in _DEFAULT_CONFIG.items():
         if not _config.has_section(section):
-            _config.add_section(section)
-            needs_save = True
-        for key, value in options.items():
-            if not _config.has_option(section, key):
-                _config.set(section, key, str(value))
-                needs_save = True
-                continue
-            if key == "default_models":
-                existing_val = _config.get(section, key)
-                existing_list = [x.strip() for x in existing_val.split(",") if x.strip()]
-                default_list = [x.strip() for x in str(value).split(",") if x.strip()]
-                missing_items = [x for x in default_list if x not in existing_list]
-                if missing_items:
-                    _config.set(section, key, ", ".join(existing_list + missing_items))
-                    needs_save = True
+            missing[section] = options
+            continue
+        present = _config[section]
+        gap = {key: value for key, value in options.items() if key not in present}
+        if gap:
+            missing[section] = gap
+    needs_save = parsed is None or bool(missing)
+    if missing:
+        _config.read_dict(missing)
+
+    existing_val = _config.get("ollama", "default_models")
+    default_val = _DEFAULT_CONFIG["ollama"]["default_models"]
+    if existing_val != default_val:
+        needs_save = _merge_default_models(existing_val, default_val) or needs_save
 
     old_sensevoice_path = str(resource_path("pc/voice/models/SenseVoiceSmall"))
     new_sensevoice_path = str(sensevoice_model_dir())
@@ -237,39 +317,127 @@ def _init_config() -> None:
         _config.set("voice_interaction", "vosk_model_path", new_vosk_path)
         needs_save = True
 
-    if needs_save or not os.path.exists(config_file):
+    if needs_save:
         _save_config()
 
 
-_init_config()
+
+def _ensure_init() -> None:
+    # 首次读写时才解析 config.ini，仅导入本模块的插件不再承担磁盘读取。
+    global _initialized
+    if _initialized:
+        return
+    with _init_lock:
+        if not _initialized:
+            _init_config()
+            _initialized = True
 
 
 def get_config(key: str, default: Any = None) -> Any:
-    if default is None and "ollama" in key.lower() and any(x in key.lower() for x in ["url", "api", "base", "host"]):
+    # 缓存命中时直接返回；默认值推导只在未命中时才需要。
+    try:
+        return _value_cache[key]
+    except KeyError:
+        pass
+    lowered_key = key.lower()
+    if default is None and "ollama" in lowered_key and any(x in lowered_key for x in ["url", "api", "base", "host"]):
         default = "http://127.0.0.1:11434"
 
-    if "." in key:
-        section, option = key.split(".", 1)
-        if _config.has_section(section) and _config.has_option(section, option):
-            val = _config.get(section, option)
-            lowered = val.lower()
-            if lowered in ["true", "yes", "on"]:
-                return True
-            if lowered in ["false", "no", "off"]:
-                return False
-            try:
-                if "." in val and all(ch.isdigit() or ch in {".", "-"} for ch in val.replace("e", "").replace("E", "")):
-                    return float(val)
-                return int(val)
-            except ValueError:
-                return val
+    generation = _cache_generation
+    _ensure_init()
+    section, sep, option = key.partition(".")
+    if sep and _config.has_section(section) and _config.has_option(section, option):
+        value = _coerce_value(_config.get(section, option))
+        with _flush_lock:
+            if generation == _cache_generation:
+                # 缓存键驻留后，后续以字面量查询时可直接按指针比较命中。
+                _value_cache[sys.intern(key)] = value
+        return value
     return default
 
 
+_BOOL_VALUES = {"true": True, "yes": True, "on": True, "false": False, "no": False, "off": False}
+_NUMERIC_LEADS = frozenset("+-.0123456789")
+
+
+def get_config_list(key: str, default: str = "") -> list[str]:
+    """读取逗号分隔的列表配置；配置文件中的值拆分一次后缓存，直到下一次 set_config。"""
+    try:
+        return list(_list_cache[key])
+    except KeyError:
+        pass
+    generation = _cache_generation
+    raw = get_config(key, None)
+    if raw is None:
+        return [x.strip() for x in str(default).split(",") if x.strip()]
+    items = tuple(x.strip() for x in str(raw).split(",") if x.strip())
+    with _flush_lock:
+        if generation == _cache_generation:
+            _list_cache[sys.intern(key)] = items
+    return list(items)
+
+
+def _coerce_value(val: str, _bools: dict[str, bool] = _BOOL_VALUES, _leads: frozenset = _NUMERIC_LEADS) -> Any:
+    # 先看首字符：大多数配置值是路径、URL 或名称，无需再做布尔与数值尝试。
+    # 常量表以默认参数绑定为局部变量。
+    if not val or val[0] not in _leads:
+        flag = _bools.get(val.lower())
+        return val if flag is None else flag
+    try:
+        if "." in val and all(ch.isdigit() or ch in {".", "-"} for ch in val.replace("e", "").replace("E", "")):
+            return float(val)
+        return int(val)
+    except ValueError:
+        return val
+
+
 def set_config(key: str, value: Any) -> None:
-    if "." in key:
-        section, option = key.split(".", 1)
+    global _flush_timer, _dirty, _cache_generation
+    _ensure_init()
+    section, sep, option = key.partition(".")
+    if not sep:
+        return
+    with _flush_lock:
         if not _config.has_section(section):
             _config.add_section(section)
         _config.set(section, option, str(value))
+        _value_cache.clear()
+        _list_cache.clear()
+        _cache_generation += 1
+        _dirty = True
+        if _batch_depth == 0 and _flush_timer is None:
+            _flush_timer = threading.Timer(_FLUSH_DELAY, flush_config)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_config() -> None:
+    """立即把尚未落盘的配置写回 config.ini。"""
+    global _flush_timer, _dirty
+    with _flush_lock:
+        timer, _flush_timer = _flush_timer, None
+        if timer is not None:
+            timer.cancel()
+        if not _dirty:
+            return
+        _dirty = False
         _save_config()
+
+
+@contextmanager
+def config_batch() -> Iterator[None]:
+    """批量修改配置：块内的 set_config 只改内存，退出最外层时一次性写回。"""
+    global _batch_depth
+    with _flush_lock:
+        _batch_depth += 1
+    try:
+        yield
+    finally:
+        with _flush_lock:
+            _batch_depth -= 1
+            outermost = _batch_depth == 0
+        if outermost:
+            flush_config()
+
+
+atexit.register(flush_config)
@@ -1,12 +1,12 @@
 import cv2
 import time
-import threading
 import torch
 import sys
 import os
 import json
 import urllib.request
 import urllib.error
+from concurrent.futures import ThreadPoolExecutor
 
 # ==========================================
 # 动态注入系统路径，确保能找到当前目录下的 logger.py
@@ -138,6 +138,8 @@ class LabMultiModalScheduler:
         self.safety_expert = UnifiedSafetyExpert()
         self.contact_angle_expert = MicrofluidicContactAngleExpert()
         self.ocr_expert = EquipmentOCRExpert()
+        # 大模型问答共用一个有界线程池，连续语音指令不会各自新建线程、并发压垮 Ollama
+        self.llm_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="OllamaChat")
 
         # 视频调度状态机
         self.is_running = False
@@ -201,5 +203,5 @@ class LabMultiModalScheduler:
 
         # 2. 如果不是系统控制指令，则作为专业问题，抛给本地大语言模型
         else:
-            # 开启子线程去请求大模型，防止阻塞主程序的语音监听
-            threading.Thread(target=self.llm_expert.chat, args=(recognized_text,)).start()
\ No newline at end of file
+            # 交给后台线程池请求大模型，防止阻塞主程序的语音监听
+            self.llm_executor.submit(self.llm_expert.chat, recognized_text)
\ No newline at end of file
@@ -2,11 +2,20 @@ from __future__ import annotations
 
 import base64
 import json
+import struct
 import uuid
 from dataclasses import dataclass
 from typing import Any, Dict, Optional, Tuple
 
 
+# Pi 以二进制帧上报事件关键帧：1 字节操作码 + 4 字节大端元数据长度 + UTF-8 JSON 元数据 + 原始 JPEG。
+# 常规预览帧是裸 JPEG（首字节 0xFF），与这些操作码互不冲突。
+PI_FRAME_EXPERT_EVENT = 0x02
+PI_FRAME_YOLO_EVENT = 0x03
+PI_EVENT_FRAME_OPCODES = frozenset({PI_FRAME_EXPERT_EVENT, PI_FRAME_YOLO_EVENT})
+_PI_FRAME_HEADER = struct.Struct(">BI")
+
+
 @dataclass
 class ExpertEvent:
     event_id: str
@@ -29,8 +38,35 @@ class ExpertResult:
     source: str = "pc_expert_system"
 
 
+def _decode_expert_event(meta: Dict[str, Any], image_bytes: Any) -> Tuple[Optional[ExpertEvent], Optional[str]]:
+    import cv2
+    import numpy as np
+
+    arr = np.frombuffer(image_bytes, np.uint8)
+    frame = cv2.imdecode(arr, cv2.IMREAD_COLOR)
+    if frame is None:
+        return None, "failed to decode frame"
+
+    event_id = str(meta.get("event_id") or uuid.uuid4())
+    capture_metrics = meta.get("capture_metrics", {})
+    if not isinstance(capture_metrics, dict):
+        capture_metrics = {}
+
+    return ExpertEvent(
+        event_id=event_id,
+        event_name=str(meta.get("event_name", "未知事件") or "未知事件"),
+        expert_code=str(meta.get("expert_code", "") or ""),
+        detected_classes=str(meta.get("detected_classes", "") or ""),
+        timestamp=float(meta.get("timestamp", 0.0)),
+        frame=frame,
+        capture_metrics=capture_metrics,
+        policy_name=str(meta.get("policy_name", "") or ""),
+        policy_action=str(meta.get("policy_action", "") or ""),
+    ), None
+
+
 def parse_pi_expert_packet(packet: str) -> Tuple[Optional[ExpertEvent], Optional[str]]:
-    """解析 PI 端上报事件。"""
+    """解析 PI 端以文本帧（Base64 关键帧）上报的事件，兼容旧版节点。"""
     if not packet.startswith("PI_EXPERT_EVENT:") and not packet.startswith("PI_YOLO_EVENT:"):
         return None, "unsupported prefix"
 
@@ -38,36 +74,37 @@ def parse_pi_expert_packet(packet: str) -> Tuple[Optional[ExpertEvent], Optional
         payload = packet.split(":", 1)[1]
         meta_raw, b64_img = payload.rsplit(":", 1)
         meta = json.loads(meta_raw)
+        return _decode_expert_event(meta, base64.b64decode(b64_img))
+    except Exception as exc:
+        return None, str(exc)
+
+
+def parse_pi_expert_frame(packet: bytes) -> Tuple[Optional[ExpertEvent], Optional[str]]:
+    """解析 PI 端以二进制帧上报的事件，关键帧直接以原始 JPEG 字节传输。"""
+    if len(packet) < _PI_FRAME_HEADER.size or packet[0] not in PI_EVENT_FRAME_OPCODES:
+        return None, "unsupported opcode"
 
-        import cv2
-        import numpy as np
-
-        image_bytes = base64.b64decode(b64_img)
-        arr = np.frombuffer(image_bytes, np.uint8)
-        frame = cv2.imdecode(arr, cv2.IMREAD_COLOR)
-        if frame is None:
-            return None, "failed to decode frame"
-
-        event_id = str(meta.get("event_id") or uuid.uuid4())
-        capture_metrics = meta.get("capture_metrics", {})
-        if not isinstance(capture_metrics, dict):
-            capture_metrics = {}
-
-        return ExpertEvent(
-            event_id=event_id,
-            event_name=str(meta.get("event_name", "未知事件") or "未知事件"),
-            expert_code=str(meta.get("expert_code", "") or ""),
-            detected_classes=str(meta.get("detected_classes", "") or ""),
-            timestamp=float(meta.get("timestamp", 0.0)),
-            frame=frame,
-            capture_metrics=capture_metrics,
-            policy_name=str(meta.get("policy_name", "") or ""),
-            policy_action=str(meta.get("policy_action", "") or ""),
-        ), None
+    try:
+        _, meta_len = _PI_FRAME_HEADER.unpack_from(packet)
+        view = memoryview(packet)
+        meta_end = _PI_FRAME_HEADER.size + meta_len
+        if meta_end > len(packet):
+            return None, "truncated frame"
+        meta = json.loads(bytes(view[_PI_FRAME_HEADER.size:meta_end]).decode("utf-8"))
+        return _decode_expert_event(meta, view[meta_end:])
     except Exception as exc:
         return None, str(exc)
 
 
+def build_pi_command(command: str, payload: Any = None) -> str:
+    """组装下发给 Pi 的 CMD 文本帧，结构化负载统一编码为紧凑 JSON。"""
+    if payload is None:
+        return f"CMD:{command}"
+    if isinstance(payload, (dict, list)):
+        payload = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return f"CMD:{command}:{payload}"
+
+
 def build_expert_result_command(result: ExpertResult) -> str:
     body: Dict[str, Any] = {
         "event_id": result.event_id,
@@ -76,7 +113,7 @@ def build_expert_result_command(result: ExpertResult) -> str:
         "speak": result.speak,
         "source": result.source,
     }
-    return f"CMD:EXPERT_RESULT:{json.dumps(body, ensure_ascii=False)}"
+    return build_pi_command("EXPERT_RESULT", body)
 
 
 def parse_pi_expert_ack(packet: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
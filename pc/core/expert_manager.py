@@ -1,31 +1,62 @@
 from __future__ import annotations
 
 import importlib
-import inspect
+import os
 import shutil
 import time
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
-from pc.core.base_expert import BaseExpert
-from pc.core.config import get_config, set_config
+from pc.core.base_expert import BaseExpert, EdgePolicy
+from pc.core.config import config_batch, get_config, set_config
 from pc.core.expert_registry import (
     expert_asset_dir,
     get_expert_definition,
     list_expert_definitions,
 )
 from pc.core.logger import console_error, console_info
+from pc.experts.utils import parse_detected_classes
 
 try:
     from pc.knowledge_base.rag_engine import knowledge_manager
 except Exception:
     knowledge_manager = None
 
+
+def _import_expert_module(module_name: str) -> Tuple[Any, Optional[BaseException]]:
+    try:
+        return importlib.import_module(module_name), None
+    except Exception as exc:
+        return None, exc
+
+
+def _scan_asset_files(root: str) -> Tuple[int, float]:
+    # os.scandir 的 DirEntry 自带文件类型，每个文件只需为 mtime 做一次 stat。
+    file_count = 0
+    latest_mtime = 0.0
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif entry.is_file():
+                        file_count += 1
+                        latest_mtime = max(latest_mtime, entry.stat().st_mtime)
+        except OSError:
+            continue
+    return file_count, latest_mtime
+
+
 class ExpertManager:
     def __init__(self) -> None:
         self.experts: Dict[str, BaseExpert] = {}
         self._expert_codes: Dict[str, str] = {}
+        # 专家集合每次重载递增，供下游缓存已序列化的边缘策略。
+        self.policy_version = 0
         self.load_experts()
 
     def load_experts(self) -> None:
@@ -33,27 +64,43 @@ class ExpertManager:
         self._expert_codes.clear()
 
         console_info("===== 正在加载专家模块 =====")
-        for definition in list_expert_definitions():
-            config_key = f"experts.{definition.code}"
-            enabled = get_config(config_key, -1)
-            if enabled == -1:
-                legacy_key = f"experts.{definition.code.split('.')[-1]}"
-                legacy_enabled = get_config(legacy_key, -1)
-                if legacy_enabled != -1:
-                    enabled = legacy_enabled
-                else:
-                    set_config(config_key, 1)
-                    enabled = 1
-
-            if str(enabled) == "0" or enabled is False:
-                console_info(f"跳过 [{definition.display_name}] ({definition.code})")
-                continue
-
+        enabled_definitions = []
+        # 新发现的专家在同一批次内登记，整个扫描只写一次 config.ini。
+        with config_batch():
+            for definition in list_expert_definitions():
+                config_key = f"experts.{definition.code}"
+                enabled = get_config(config_key, -1)
+                if enabled == -1:
+                    legacy_key = f"experts.{definition.code.rsplit('.', 1)[-1]}"
+                    legacy_enabled = get_config(legacy_key, -1)
+                    if legacy_enabled != -1:
+                        enabled = legacy_enabled
+                    else:
+                        set_config(config_key, 1)
+                        enabled = 1
+
+                if str(enabled) == "0" or enabled is False:
+                    console_info(f"跳过 [{definition.display_name}] ({definition.code})")
+                    continue
+                enabled_definitions.append(definition)
+
+        # 模块导入（可能连带加载 torch / 权重文件）并行进行；实例化与日志仍按注册顺序串行完成。
+        imported: List[Tuple[Any, Optional[BaseException]]] = []
+        if enabled_definitions:
+            with ThreadPoolExecutor(
+                max_workers=min(8, len(enabled_definitions)),
+                thread_name_prefix="ExpertImport",
+            ) as executor:
+                imported = list(executor.map(_import_expert_module, [d.module for d in enabled_definitions]))
+
+        for definition, (module, import_error) in zip(enabled_definitions, imported):
             try:
-                module = importlib.import_module(definition.module)
+                if import_error is not None:
+                    raise import_error
                 loaded = False
-                for _, obj in inspect.getmembers(module, inspect.isclass):
-                    if issubclass(obj, BaseExpert) and obj is not BaseExpert:
+                # 直接遍历模块命名空间，避免 getmembers 对整个 dir() 逐项 getattr 再排序。
+                for obj in list(vars(module).values()):
+                    if isinstance(obj, type) and issubclass(obj, BaseExpert) and obj is not BaseExpert:
                         instance = obj()
                         self.experts[instance.expert_name] = instance
                         self._expert_codes[instance.expert_name] = definition.code
@@ -66,6 +113,7 @@ class ExpertManager:
             except Exception as exc:
                 console_error(f"加载失败 [{definition.code}] 异常: {exc}")
 
+        self.policy_version += 1
         console_info(f"===== 已加载 {len(self.experts)} 个专家 =====\n")
 
     def _build_knowledge_context(self, expert: BaseExpert, event_name: str, context: Dict[str, Any]) -> Dict[str, Any]:
@@ -248,18 +296,19 @@ class ExpertManager:
             if not policy:
                 continue
 
-            raw_items: List[Dict[str, Any]] = []
-            if isinstance(policy, list):
-                raw_items = [item for item in policy if isinstance(item, dict)]
-            elif isinstance(policy, dict):
-                raw_items = [policy]
+            items = policy if isinstance(policy, (list, tuple)) else (policy,)
 
             allowed_names = self._allowed_closed_loop_events(expert.expert_code)
-            for item in raw_items:
-                event_name = str(item.get("event_name", "") or "").strip()
+            for item in items:
+                if isinstance(item, EdgePolicy):
+                    merged = item.as_dict()
+                elif isinstance(item, dict):
+                    merged = dict(item)
+                else:
+                    continue
+                event_name = str(merged.get("event_name", "") or "").strip()
                 if allowed_names and event_name and event_name not in allowed_names:
                     continue
-                merged = dict(item)
                 merged.setdefault("expert_code", expert.expert_code)
                 merged.setdefault("policy_name", event_name or expert.expert_code)
                 merged.setdefault("trigger_mode", getattr(definition, "trigger_mode", "resident"))
@@ -279,6 +328,10 @@ class ExpertManager:
     ) -> str:
         results: List[str] = []
         allowed_codes = {str(item).strip() for item in (allowed_expert_codes or []) if str(item).strip()}
+        base_context = dict(context or {})
+        if not isinstance(base_context.get("detected_classes_set"), frozenset):
+            # 检测类别每帧只解析一次，多个专家共享同一个 frozenset 做成员判断。
+            base_context["detected_classes_set"] = frozenset(parse_detected_classes(base_context.get("detected_classes", "")))
         for expert, definition in self._iter_loaded_with_definition():
             if allowed_codes and expert.expert_code not in allowed_codes:
                 continue
@@ -286,7 +339,7 @@ class ExpertManager:
                 continue
             if expert.match_event(event_name):
                 try:
-                    enriched = dict(context or {})
+                    enriched = dict(base_context)
                     enriched.setdefault("event_name", event_name)
                     enriched.setdefault("expert", expert.expert_name)
                     enriched.update(self._build_knowledge_context(expert, event_name, enriched))
@@ -473,12 +526,12 @@ class ExpertManager:
 
     def _asset_status(self, expert_code: str) -> Dict[str, Any]:
         asset_root = expert_asset_dir(expert_code)
-        files = [path for path in asset_root.rglob("*") if path.is_file()]
+        file_count, latest_mtime = _scan_asset_files(str(asset_root))
         return {
             "path": str(asset_root),
-            "file_count": len(files),
-            "ready": bool(files),
-            "latest_mtime": max((path.stat().st_mtime for path in files), default=0.0),
+            "file_count": file_count,
+            "ready": bool(file_count),
+            "latest_mtime": latest_mtime,
         }
 
     def list_knowledge_scopes(self) -> List[Dict[str, str]]:
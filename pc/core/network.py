@@ -1,4 +1,24 @@
 import socket
+import threading
+
+# 进程生命周期内本机出口 IP 基本不变，探测成功后缓存，扫描等循环调用不再重复建 socket。
+_CACHED_IP = None
+_CACHED_PREFIX = None
+_FALLBACK_IP = None
+_IP_LOCK = threading.Lock()
+
+
+def _probe_local_ip():
+    # 创建一个UDP socket，不实际发送数据
+    s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    try:
+        # 连接到一个公共DNS服务器（不会真正连接）
+        s.connect(("8.8.8.8", 80))
+        # 获取socket的IP地址
+        return s.getsockname()[0]
+    finally:
+        s.close()
+
 
 def get_local_ip() -> str:
     """
@@ -6,21 +26,40 @@ def get_local_ip() -> str:
     Returns:
         str: 本机IP地址
     """
-    try:
-        # 创建一个UDP socket，不实际发送数据
-        s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        # 连接到一个公共DNS服务器（不会真正连接）
-        s.connect(("8.8.8.8", 80))
-        # 获取socket的IP地址
-        ip = s.getsockname()[0]
-        s.close()
-        return ip
-    except Exception:
-        # 备用方法
+    global _CACHED_IP
+    if _CACHED_IP is not None:
+        return _CACHED_IP
+    with _IP_LOCK:
+        if _CACHED_IP is not None:
+            return _CACHED_IP
+        try:
+            _CACHED_IP = _probe_local_ip()
+            return _CACHED_IP
+        except Exception:
+            pass
+    # 备用方法；探测失败不缓存，网络恢复后的下一次调用会重新探测
+    return _fallback_ip()
+
+
+def _fallback_ip() -> str:
+    # 主机名解析走 getaddrinfo，解析器异常时可能卡顿数秒；结果（包括解析失败）只求一次。
+    global _FALLBACK_IP
+    if _FALLBACK_IP is None:
         try:
-            return socket.gethostbyname(socket.gethostname())
+            _FALLBACK_IP = socket.gethostbyname(socket.gethostname())
         except:
-            return "127.0.0.1"
+            _FALLBACK_IP = "127.0.0.1"
+    return _FALLBACK_IP
+
+
+def invalidate_local_ip() -> None:
+    """网卡或 DHCP 地址变化后清除缓存，下一次调用重新探测。"""
+    global _CACHED_IP, _CACHED_PREFIX, _FALLBACK_IP
+    with _IP_LOCK:
+        _CACHED_IP = None
+        _CACHED_PREFIX = None
+        _FALLBACK_IP = None
+
 
 def get_network_prefix() -> str:
     """
@@ -28,6 +67,12 @@ def get_network_prefix() -> str:
     Returns:
         str: 网络前缀
     """
+    global _CACHED_PREFIX
     local_ip = get_local_ip()
+    if _CACHED_PREFIX is not None and _CACHED_IP == local_ip:
+        return _CACHED_PREFIX
     # 假设是C类网络，前三个部分是网络前缀
-    return '.'.join(local_ip.split('.')[:3]) + '.'
\ No newline at end of file
+    prefix = local_ip.rsplit('.', 1)[0] + '.'
+    if _CACHED_IP == local_ip:
+        _CACHED_PREFIX = prefix
+    return prefix
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared EasyOCR readers keyed by language set."""
+
+from __future__ import annotations
+
+import importlib
+import threading
+from typing import Any, Dict, Tuple
+
+import cv2
+import numpy as np
+
+DEFAULT_OCR_LANGS: Tuple[str, ...] = ("ch_sim", "en")
+OCR_MAX_SIDE = 960
+
+_POOL_LOCK = threading.Lock()
+_READERS: Dict[Tuple[Tuple[str, ...], bool], Any] = {}
+_READER_USERS: Dict[Tuple[Tuple[str, ...], bool], int] = {}
+
+
+def _cuda_available() -> bool:
+    try:
+        torch = importlib.import_module("torch")
+        return bool(torch.cuda.is_available())
+    except Exception:
+        return False
+
+
+def _empty_cuda_cache() -> None:
+    try:
+        torch = importlib.import_module("torch")
+        if torch.cuda.is_available():
+            torch.cuda.empty_cache()
+    except Exception:
+        pass
+
+
+def acquire_reader(langs: Tuple[str, ...] = DEFAULT_OCR_LANGS, gpu: bool | None = None) -> Any:
+    """按语言组合返回进程内共享的 Reader 并登记一个使用者，首次调用时才构建；["ch_sim", "en"] 已覆盖纯英文场景。
+
+    依赖缺失时抛出异常且不缓存，补齐依赖后再次调用即可重新加载。用完后调用 release_reader 归还。
+    """
+    if gpu is None:
+        gpu = _cuda_available()
+    key = (tuple(langs), bool(gpu))
+    with _POOL_LOCK:
+        reader = _READERS.get(key)
+        if reader is None:
+            easyocr = importlib.import_module("easyocr")
+            reader = easyocr.Reader(list(key[0]), gpu=key[1])
+            _READERS[key] = reader
+        _READER_USERS[key] = _READER_USERS.get(key, 0) + 1
+        return reader
+
+
+def release_reader(reader: Any) -> None:
+    """归还 acquire_reader 取得的 Reader；最后一个使用者归还后才真正释放并回收显存。"""
+    with _POOL_LOCK:
+        key = next((item for item, cached in _READERS.items() if cached is reader), None)
+        if key is None:
+            return
+        remaining = _READER_USERS.get(key, 0) - 1
+        if remaining > 0:
+            _READER_USERS[key] = remaining
+            return
+        _READER_USERS.pop(key, None)
+        del _READERS[key]
+    _empty_cuda_cache()
+
+
+def release_readers() -> None:
+    """不论是否仍有使用者，释放全部共享 Reader 并回收显存。"""
+    with _POOL_LOCK:
+        _READERS.clear()
+        _READER_USERS.clear()
+    _empty_cuda_cache()
+
+
+def prepare_ocr_frame(frame: Any, max_side: int = OCR_MAX_SIDE) -> Any:
+    """OCR 前的预处理：长边缩到 max_side 以内并转单通道灰度；CRAFT 检测耗时随像素数增长。"""
+    height, width = frame.shape[:2]
+    scale = max_side / float(max(height, width))
+    if scale < 1.0:
+        frame = cv2.resize(frame, (max(1, int(width * scale)), max(1, int(height * scale))), interpolation=cv2.INTER_AREA)
+    if frame.ndim == 3:
+        code = cv2.COLOR_BGRA2GRAY if frame.shape[2] == 4 else cv2.COLOR_BGR2GRAY
+        frame = cv2.cvtColor(frame, code)
+    return np.ascontiguousarray(frame)
@@ -1,13 +1,30 @@
 # pc/core/scheduler_manager.py
-from apscheduler.schedulers.background import BackgroundScheduler
+import threading
+from datetime import datetime, timedelta
+
 from pc.core.logger import console_info
 from pc.core.tts import speak_async
 
+
+def _secs_until(hour, minute, now=None):
+    now = now or datetime.now()
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    if target <= now:
+        target += timedelta(days=1)
+    return (target - now).total_seconds()
+
+
 class SchedulerManager:
+    # 每天只有两次定时广播，用一次性 Timer 到点触发后重新挂载即可，不需要常驻调度线程池。
+    JOBS = (
+        ("morning", 8, 30),
+        ("evening", 17, 30),
+    )
+
     def __init__(self):
-        self.scheduler = BackgroundScheduler()
-        self.scheduler.add_job(self._morning_routine, 'cron', hour=8, minute=30)
-        self.scheduler.add_job(self._evening_routine, 'cron', hour=17, minute=30)
+        self._lock = threading.Lock()
+        self._timers = {}
+        self._running = False
 
     def _morning_routine(self):
         msg = "早上好，今天进行实验时，请务必佩戴护目镜和手套。"
@@ -19,11 +36,36 @@ class SchedulerManager:
         console_info(f"定时广播: {msg}")
         speak_async(msg)
 
+    def _arm(self, name, hour, minute):
+        timer = threading.Timer(_secs_until(hour, minute), self._run_and_rearm, args=(name, hour, minute))
+        timer.daemon = True
+        timer.name = f"Scheduler-{name}"
+        self._timers[name] = timer
+        timer.start()
+
+    def _run_and_rearm(self, name, hour, minute):
+        try:
+            getattr(self, f"_{name}_routine")()
+        finally:
+            with self._lock:
+                if self._running:
+                    self._arm(name, hour, minute)
+
     def start(self):
-        self.scheduler.start()
+        with self._lock:
+            if self._running:
+                return
+            self._running = True
+            for name, hour, minute in self.JOBS:
+                self._arm(name, hour, minute)
         console_info("主动安全定时广播任务引擎已启动")
 
     def stop(self):
-        self.scheduler.shutdown()
+        with self._lock:
+            self._running = False
+            timers = list(self._timers.values())
+            self._timers.clear()
+        for timer in timers:
+            timer.cancel()
 
-scheduler_manager = SchedulerManager()
\ No newline at end of file
+scheduler_manager = SchedulerManager()
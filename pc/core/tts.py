@@ -4,11 +4,13 @@
 
 from __future__ import annotations
 
+import queue
 import shutil
 import subprocess
 import sys
 import threading
-from typing import Any
+import time
+from typing import Any, Callable
 
 from pc.core.logger import console_error, console_info
 
@@ -16,11 +18,20 @@ from pc.core.logger import console_error, console_info
 class TTSManager:
     """Provide a small cross-platform TTS wrapper with debug-friendly logs."""
 
+    DEDUP_WINDOW_SECONDS = 3.0
+
     def __init__(self) -> None:
         self.speaker: Any | None = None
         self.backend_name = "none"
-        self._speak_lock = threading.Lock()
+        self._queue: queue.Queue[str] = queue.Queue(maxsize=8)
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        self._thread_speaker: Any | None = None
+        self._dedup_lock = threading.Lock()
+        self._last_text = ""
+        self._last_time = 0.0
         self._init_tts()
+        self._speak_sync = self._pick_backend()
 
     def _init_tts(self) -> None:
         try:
@@ -90,50 +101,107 @@ class TTSManager:
         speaker.Rate = 0
         return speaker
 
-    def speak_async(self, text: str) -> None:
-        def _speak() -> None:
-            message = str(text or "").strip()
-            if not message:
-                console_error("[TTS] 收到空文本，已跳过播报")
-                return
-            if not self.speaker:
-                console_error(f"[TTS] 无可用语音引擎，无法播报: {message}")
-                return
+    def _pick_backend(self) -> Callable[[str], None]:
+        if sys.platform == "win32" and self.backend_name == "sapi":
+            return self._speak_sapi
+        if self.speaker == "espeak":
+            return self._speak_espeak
+        if hasattr(self.speaker, "say"):
+            return self._speak_pyttsx3
+        return self._speak_unsupported
+
+    def _speak_sapi(self, message: str) -> None:
+        # COM 对象只能在创建它的线程使用，因此在播报线程内构建一次并复用。
+        if self._thread_speaker is None:
+            self._thread_speaker = self._build_sapi_speaker()
+        self._thread_speaker.Speak(message)
+
+    @staticmethod
+    def _speak_espeak(message: str) -> None:
+        subprocess.Popen(["espeak", "-v", "zh", "-s", "150", message])
+
+    def _speak_pyttsx3(self, message: str) -> None:
+        self.speaker.say(message)
+        self.speaker.runAndWait()
 
+    @staticmethod
+    def _speak_unsupported(message: str) -> None:
+        console_error("[TTS] 当前语音引擎不支持播报接口")
+
+    def _ensure_worker(self) -> None:
+        if self._worker is not None:
+            return
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run_worker, daemon=True, name="TTSPlayback")
+                self._worker.start()
+
+    def _run_worker(self) -> None:
+        pythoncom = None
+        if sys.platform == "win32" and self.backend_name == "sapi":
             try:
-                console_info(f"[TTS] 使用 {self.backend_name} 播报: {message}")
-                with self._speak_lock:
-                    if sys.platform == "win32" and self.backend_name == "sapi":
-                        try:
-                            import pythoncom
-
-                            pythoncom.CoInitialize()
-                            try:
-                                speaker = self._build_sapi_speaker()
-                                speaker.Speak(message)
-                            finally:
-                                pythoncom.CoUninitialize()
-                        except Exception as exc:
-                            console_error(f"[TTS] SAPI 子线程播报失败: {exc}")
-                    elif self.speaker == "espeak":
-                        subprocess.Popen(["espeak", "-v", "zh", "-s", "150", message])
-                    elif hasattr(self.speaker, "say"):
-                        self.speaker.say(message)
-                        self.speaker.runAndWait()
-                    else:
-                        console_error("[TTS] 当前语音引擎不支持播报接口")
+                import pythoncom
+
+                pythoncom.CoInitialize()
             except Exception as exc:
-                console_error(f"[TTS] 播报失败: {exc}")
+                pythoncom = None
+                console_error(f"[TTS] SAPI 子线程初始化失败: {exc}")
+        try:
+            while True:
+                message = self._queue.get()
+                try:
+                    console_info(f"[TTS] 使用 {self.backend_name} 播报: {message}")
+                    self._speak_sync(message)
+                except Exception as exc:
+                    console_error(f"[TTS] 播报失败: {exc}")
+                finally:
+                    self._queue.task_done()
+        finally:
+            self._thread_speaker = None
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+
+    def speak_async(self, text: str) -> None:
+        message = str(text or "").strip()
+        if not message:
+            console_error("[TTS] 收到空文本，已跳过播报")
+            return
+        if not self.speaker:
+            console_error(f"[TTS] 无可用语音引擎，无法播报: {message}")
+            return
+        # 多个专家同帧告警时常连发相同文本，窗口期内的重复播报直接丢弃。
+        now = time.monotonic()
+        with self._dedup_lock:
+            if message == self._last_text and now - self._last_time < self.DEDUP_WINDOW_SECONDS:
+                return
+            self._last_text = message
+            self._last_time = now
+        # 所有播报交给同一个常驻线程顺序执行；队列满时丢弃，播报属于尽力而为的通道。
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            console_error(f"[TTS] 播报队列已满，已丢弃: {message}")
+
 
-        threading.Thread(target=_speak, daemon=True, name="TTSPlayback").start()
+_tts_manager: TTSManager | None = None
+_tts_manager_lock = threading.Lock()
 
 
-_tts_manager = TTSManager()
+def _get_tts_manager() -> TTSManager:
+    # SAPI / pyttsx3 在第一次播报时才初始化，导入本模块不再加载 COM 或语音驱动。
+    global _tts_manager
+    if _tts_manager is None:
+        with _tts_manager_lock:
+            if _tts_manager is None:
+                _tts_manager = TTSManager()
+    return _tts_manager
 
 
 def speak_async(text: str) -> None:
-    _tts_manager.speak_async(text)
+    _get_tts_manager().speak_async(text)
 
 
 def stop_tts() -> None:
-    _tts_manager.stop()
+    if _tts_manager is not None:
+        _tts_manager.stop()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Short-term energy gate placed in front of wake-word / ASR recognition."""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+except Exception:  # pragma: no cover - optional dependency
+    njit = None
+
+
+FRAME_SAMPLES = 320  # 16 kHz 下 20 ms 一帧
+
+
+def _frame_energy_loop(samples, frame):
+    # 单次遍历累计各帧能量，不产生浮点中间数组；安装 numba 时编译为机器码。
+    count = samples.shape[0] // frame
+    energies = np.zeros(count, dtype=np.float64)
+    for index in range(count * frame):
+        value = float(samples[index])
+        energies[index // frame] += value * value
+    return energies / frame
+
+
+_frame_energy_kernel = njit(cache=True, fastmath=True)(_frame_energy_loop) if njit is not None else None
+
+
+def frame_rms(samples: np.ndarray, frame: int = FRAME_SAMPLES) -> np.ndarray:
+    """按 frame 个采样分帧，返回每帧的 RMS；不足一帧的录音整体算作一帧，末尾残余采样丢弃。"""
+    if samples.shape[0] == 0:
+        return np.zeros(0, dtype=np.float32)
+    frame = min(frame, samples.shape[0])
+    if _frame_energy_kernel is not None:
+        return np.sqrt(_frame_energy_kernel(samples, frame))
+    count = samples.shape[0] // frame
+    values = samples[: count * frame].reshape(count, frame).astype(np.float32)
+    return np.sqrt(np.einsum("ij,ij->i", values, values) / frame)
+
+
+class EnergyGate:
+    """根据静音片段的能量底噪判断一段录音是否值得送入识别。
+
+    按 20 ms 分帧计算 RMS，至少 min_frames 帧超过 ratio 倍底噪即视为有语音；整段平均会被
+    前后的静音稀释，短促的唤醒词也可能被滤掉，因此不用整段均值判断。
+    底噪只用没有任何一帧超过阈值的录音做滑动平均更新，被拒绝的疑似语音不会把底噪越抬越高。
+    尚未获得底噪（未校准且没有静音样本）时一律放行。
+    """
+
+    def __init__(self, ratio: float = 2.0, history: int = 50, min_frames: int = 3) -> None:
+        self.ratio = float(ratio)
+        self.history = int(history)
+        self.min_frames = max(1, int(min_frames))
+        self._floor_rms: float | None = None
+        self._silence_count = 0
+
+    @property
+    def floor_rms(self) -> float | None:
+        return self._floor_rms
+
+    def seed_rms(self, rms: float) -> None:
+        if rms > 0:
+            self._floor_rms = float(rms)
+            self._silence_count = 1
+
+    def is_speech(self, samples: np.ndarray) -> bool:
+        if self._floor_rms is None:
+            return True
+        rms = frame_rms(samples)
+        if rms.size == 0:
+            return False
+        voiced = int(np.count_nonzero(rms >= self._floor_rms * self.ratio))
+        if voiced >= self.min_frames:
+            return True
+        if voiced == 0:
+            clip_rms = math.sqrt(float(np.mean(np.square(rms, dtype=np.float64))))
+            count = min(self._silence_count, self.history)
+            self._floor_rms = (count * self._floor_rms + clip_rms) / (count + 1)
+            self._silence_count += 1
+        return False
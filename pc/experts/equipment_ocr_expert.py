@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-import importlib
 from typing import Dict, List
 
 from pc.core.base_expert import BaseExpert
+from pc.core.ocr_pool import acquire_reader, prepare_ocr_frame, release_reader
 
 
 class EquipmentOCRExpert(BaseExpert):
@@ -37,9 +37,8 @@ class EquipmentOCRExpert(BaseExpert):
             from pc.core.logger import console_info
 
             console_info("正在唤起 [设备 OCR 识别专家]，按需加载 OCR 依赖。")
-            easyocr = importlib.import_module("easyocr")
-            torch = importlib.import_module("torch")
-            self.reader = easyocr.Reader(["ch_sim", "en"], gpu=bool(torch.cuda.is_available()))
+            # 与危化品专家共用同一个 ["ch_sim", "en"] Reader，首次调用后常驻，避免每次识别重建模型。
+            self.reader = acquire_reader()
             self.is_loaded = True
         except Exception:
             from pc.core.logger import console_error
@@ -51,13 +50,9 @@ class EquipmentOCRExpert(BaseExpert):
     def _lazy_unload(self) -> None:
         if not self.is_loaded:
             return
+        # 只归还本专家持有的引用，危化品专家等其他使用者仍在用时 Reader 保留。
+        release_reader(self.reader)
         self.reader = None
-        try:
-            torch = importlib.import_module("torch")
-            if torch.cuda.is_available():
-                torch.cuda.empty_cache()
-        except Exception:
-            pass
         self.is_loaded = False
 
     def analyze(self, frame, context) -> str:
@@ -66,13 +61,11 @@ class EquipmentOCRExpert(BaseExpert):
         text_extracted = ""
         if self.reader is not None and frame is not None:
             try:
-                results = self.reader.readtext(frame)
+                results = self.reader.readtext(prepare_ocr_frame(frame))
                 text_extracted = " ".join(res[1] for res in results if len(res) > 1)
             except Exception:
                 text_extracted = ""
 
-        self._lazy_unload()
-
         if text_extracted.strip():
             return f"设备 OCR 识别结果：{text_extracted}"
         return "当前未能稳定识别画面中的仪表读数或设备文字。"
@@ -8,6 +8,9 @@ from pc.app_identity import resource_path
 from pc.core.base_expert import BaseExpert
 
 
+_HISTORY_KEYWORDS = ("刚才", "回放", "记录", "异常", "上一组", "发生什么", "提示了什么", "日志")
+
+
 class LabQAExpert(BaseExpert):
     """实验室智能问答专家。"""
 
@@ -32,8 +35,7 @@ class LabQAExpert(BaseExpert):
 
     @staticmethod
     def _is_history_query(query: str) -> bool:
-        keywords = ["刚才", "回放", "记录", "异常", "上一组", "发生什么", "提示了什么", "日志"]
-        return any(keyword in query for keyword in keywords)
+        return any(keyword in query for keyword in _HISTORY_KEYWORDS)
 
     @staticmethod
     def _query_recent_history() -> str:
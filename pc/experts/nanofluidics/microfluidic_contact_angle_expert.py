@@ -1,7 +1,16 @@
 import math
-from typing import Dict, List, Tuple
+from typing import List, Tuple
 
-from pc.core.base_expert import BaseExpert
+from pc.core.base_expert import BaseExpert, EdgePolicy
+
+
+_EDGE_POLICY = EdgePolicy(
+    event_name="接触角检测",
+    trigger_classes=("droplet", "petri dish", "slide"),
+    condition="any",
+    action="crop_target",
+    cooldown=2.0,
+)
 
 
 class MicrofluidicContactAngleExpert(BaseExpert):
@@ -18,14 +27,8 @@ class MicrofluidicContactAngleExpert(BaseExpert):
     def supported_events(self) -> List[str]:
         return ["接触角检测", "microfluidic_contact_angle"]
 
-    def get_edge_policy(self) -> Dict:
-        return {
-            "event_name": "接触角检测",
-            "trigger_classes": ["droplet", "petri dish", "slide"],
-            "condition": "any",
-            "action": "crop_target",
-            "cooldown": 2.0,
-        }
+    def get_edge_policy(self) -> EdgePolicy:
+        return _EDGE_POLICY
 
     def match_event(self, event_name: str) -> bool:
         return event_name in self.supported_events()
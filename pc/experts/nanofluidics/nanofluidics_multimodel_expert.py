@@ -1,9 +1,27 @@
-from typing import Dict, List
+from typing import List, Tuple
 
-from pc.core.base_expert import BaseExpert
+from pc.core.base_expert import BaseExpert, EdgePolicy
 from pc.experts.nanofluidics.nanofluidics_models import run_nanofluidics_suite, run_nanomechanics_bubble_suite
 
 
+_EDGE_POLICIES = (
+    EdgePolicy(
+        event_name="微纳流体多模型巡检",
+        trigger_classes=("slide", "droplet", "chip"),
+        condition="any",
+        action="crop_target",
+        cooldown=2.0,
+    ),
+    EdgePolicy(
+        event_name="纳米力学气泡巡检",
+        trigger_classes=("bubble", "capillary", "microchannel", "chip"),
+        condition="any",
+        action="crop_target",
+        cooldown=1.0,
+    ),
+)
+
+
 class NanoFluidicsMultiModelExpert(BaseExpert):
     """微纳力学多模型专家（气泡追踪/接触线/钉扎 + 接触角/弯月面/粒子速度）。"""
 
@@ -24,23 +42,8 @@ class NanoFluidicsMultiModelExpert(BaseExpert):
             "电渗电泳气泡跟踪",
         ]
 
-    def get_edge_policy(self) -> List[Dict]:
-        return [
-            {
-                "event_name": "微纳流体多模型巡检",
-                "trigger_classes": ["slide", "droplet", "chip"],
-                "condition": "any",
-                "action": "crop_target",
-                "cooldown": 2.0,
-            },
-            {
-                "event_name": "纳米力学气泡巡检",
-                "trigger_classes": ["bubble", "capillary", "microchannel", "chip"],
-                "condition": "any",
-                "action": "crop_target",
-                "cooldown": 1.0,
-            },
-        ]
+    def get_edge_policy(self) -> Tuple[EdgePolicy, ...]:
+        return _EDGE_POLICIES
 
     def match_event(self, event_name: str) -> bool:
         return event_name in self.supported_events()
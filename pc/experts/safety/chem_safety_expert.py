@@ -1,15 +1,41 @@
 ﻿from __future__ import annotations
 
-import importlib
-from typing import Dict, List
+import re
+from typing import List
 
-from pc.core.base_expert import BaseExpert
-from pc.experts.utils import parse_detected_classes, safe_upper_tokens
+from pc.core.base_expert import BaseExpert, EdgePolicy
+from pc.core.ocr_pool import acquire_reader, prepare_ocr_frame
+from pc.experts.utils import detected_class_set, safe_upper_tokens
+
+
+_HAZARD_TIPS = {
+    "HF": "高危：检测到氢氟酸（HF），必须佩戴面罩和耐酸手套。",
+    "H2SO4": "警告：检测到硫酸，请检查护目镜与防酸围裙。",
+    "HNO3": "警告：检测到硝酸，注意通风柜操作并远离有机物。",
+    "NAOH": "警告：检测到氢氧化钠，注意碱液飞溅风险。",
+    "METHANOL": "警告：检测到甲醇，注意易燃与吸入危害。",
+    "ETHANOL": "提示：检测到乙醇，注意明火与静电点火风险。",
+    "ACETONE": "警告：检测到丙酮，需加强通风并远离热源。",
+}
+# 使用前瞻让重叠关键词（如 METHANOL 中的 ETHANOL）都能被找到。
+_HAZARD_PATTERN = re.compile("(?=(" + "|".join(re.escape(key) for key in _HAZARD_TIPS) + "))")
+
+
+_EDGE_POLICY = EdgePolicy(
+    event_name="危化品识别",
+    trigger_classes=("bottle", "chemical bottle", "reagent bottle"),
+    condition="any",
+    action="crop_target",
+    cooldown=4.0,
+)
 
 
 class ChemSafetyExpert(BaseExpert):
     """实验室危化品识别提醒专家。"""
 
+    def __init__(self) -> None:
+        self._reader = None
+
     @property
     def expert_name(self) -> str:
         return "实验室危化品识别提醒专家"
@@ -21,45 +47,34 @@ class ChemSafetyExpert(BaseExpert):
     def supported_events(self) -> List[str]:
         return ["危化品识别", "化学品容器识别"]
 
-    def get_edge_policy(self) -> Dict:
-        return {
-            "event_name": "危化品识别",
-            "trigger_classes": ["bottle", "chemical bottle", "reagent bottle"],
-            "condition": "any",
-            "action": "crop_target",
-            "cooldown": 4.0,
-        }
+    def get_edge_policy(self) -> EdgePolicy:
+        return _EDGE_POLICY
 
     def match_event(self, event_name: str) -> bool:
         return event_name in self.supported_events()
 
     def _load_hazard_map(self):
-        return {
-            "HF": "高危：检测到氢氟酸（HF），必须佩戴面罩和耐酸手套。",
-            "H2SO4": "警告：检测到硫酸，请检查护目镜与防酸围裙。",
-            "HNO3": "警告：检测到硝酸，注意通风柜操作并远离有机物。",
-            "NAOH": "警告：检测到氢氧化钠，注意碱液飞溅风险。",
-            "METHANOL": "警告：检测到甲醇，注意易燃与吸入危害。",
-            "ETHANOL": "提示：检测到乙醇，注意明火与静电点火风险。",
-            "ACETONE": "警告：检测到丙酮，需加强通风并远离热源。",
-        }
-
-    def _extract_text(self, frame) -> str:
+        return dict(_HAZARD_TIPS)
+
+    def _extract_fragments(self, frame) -> List[str]:
+        # 逐段转大写后直接匹配，不再拼接整段文本再对每个化学品重复 upper()。
         try:
-            easyocr = importlib.import_module("easyocr")
-            reader = easyocr.Reader(["ch_sim", "en"], gpu=False)
-            return " ".join(reader.readtext(frame, detail=0))
+            # 首次识别时登记为共享 Reader 的使用者并常驻，其他专家卸载时不会把它一并释放。
+            if self._reader is None:
+                self._reader = acquire_reader()
+            return [str(item).upper() for item in self._reader.readtext(prepare_ocr_frame(frame), detail=0)]
         except Exception:
-            return ""
+            return []
 
     def analyze(self, frame, context) -> str:
-        detected = parse_detected_classes(context.get("detected_classes", ""))
-        text = self._extract_text(frame)
-        token_set = set(safe_upper_tokens(text))
-
-        hazard_map = self._load_hazard_map()
-        for chem, tip in hazard_map.items():
-            if chem in token_set or chem in text.upper():
+        detected = detected_class_set(context)
+        fragments = self._extract_fragments(frame)
+        token_set = {token for fragment in fragments for token in safe_upper_tokens(fragment)}
+
+        # 所有关键词合成一个预编译正则，每段文本只扫描一遍；命中后仍按危险等级顺序取第一条。
+        matched = {match.group(1) for fragment in fragments for match in _HAZARD_PATTERN.finditer(fragment)}
+        for chem, tip in _HAZARD_TIPS.items():
+            if chem in matched:
                 if chem == "HF" and "glove" not in detected and "gloves" not in detected:
                     return "极度危险：识别到 HF 且未检测到手套，请立即停止操作并上报。"
                 return tip
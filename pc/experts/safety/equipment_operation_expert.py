@@ -1,7 +1,16 @@
-from typing import Dict, List
+from typing import List
 
-from pc.core.base_expert import BaseExpert
-from pc.experts.utils import has_any, parse_detected_classes
+from pc.core.base_expert import BaseExpert, EdgePolicy
+from pc.experts.utils import detected_class_set, has_any
+
+
+_EDGE_POLICY = EdgePolicy(
+    event_name="仪器操作巡检",
+    trigger_classes=("microscope", "centrifuge", "pipette", "hot plate", "person"),
+    condition="any",
+    action="full_frame",
+    cooldown=6.0,
+)
 
 
 class EquipmentOperationExpert(BaseExpert):
@@ -18,20 +27,14 @@ class EquipmentOperationExpert(BaseExpert):
     def supported_events(self) -> List[str]:
         return ["仪器操作巡检", "Equipment_Status_Sync"]
 
-    def get_edge_policy(self) -> Dict:
-        return {
-            "event_name": "仪器操作巡检",
-            "trigger_classes": ["microscope", "centrifuge", "pipette", "hot plate", "person"],
-            "condition": "any",
-            "action": "full_frame",
-            "cooldown": 6.0,
-        }
+    def get_edge_policy(self) -> EdgePolicy:
+        return _EDGE_POLICY
 
     def match_event(self, event_name):
         return event_name in self.supported_events()
 
     def analyze(self, frame, context):
-        detected = parse_detected_classes(context.get("detected_classes", ""))
+        detected = detected_class_set(context)
 
         if has_any(detected, ["centrifuge", "centrifuge lid open"]):
             if "person" in detected and "glove" not in detected:
@@ -1,6 +1,15 @@
-from typing import Dict, List
+from typing import List
 
-from pc.core.base_expert import BaseExpert
+from pc.core.base_expert import BaseExpert, EdgePolicy
+
+
+_EDGE_POLICY = EdgePolicy(
+    event_name="明火烟雾巡检",
+    trigger_classes=("fire", "flame", "smoke", "burner"),
+    condition="any",
+    action="full_frame",
+    cooldown=3.0,
+)
 
 
 class FlameFireExpert(BaseExpert):
@@ -17,14 +26,8 @@ class FlameFireExpert(BaseExpert):
     def supported_events(self) -> List[str]:
         return ["明火烟雾巡检", "一般安全巡检"]
 
-    def get_edge_policy(self) -> Dict:
-        return {
-            "event_name": "明火烟雾巡检",
-            "trigger_classes": ["fire", "flame", "smoke", "burner"],
-            "condition": "any",
-            "action": "full_frame",
-            "cooldown": 3.0,
-        }
+    def get_edge_policy(self) -> EdgePolicy:
+        return _EDGE_POLICY
 
     def match_event(self, event_name: str) -> bool:
         return event_name in self.supported_events()
@@ -9,7 +9,7 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from pc.app_identity import resource_path
-from pc.core.base_expert import BaseExpert
+from pc.core.base_expert import BaseExpert, EdgePolicy
 
 
 _HAND_TASK_URL = (
@@ -29,6 +29,15 @@ _TASKS_GESTURE_RECOGNIZER: Any = None
 _TASKS_GESTURE_ERROR = ""
 
 
+_EDGE_POLICY = EdgePolicy(
+    event_name="hand_pose_analysis",
+    trigger_classes=("person", "hand", "glove"),
+    condition="any",
+    action="full_frame",
+    cooldown=1.5,
+)
+
+
 class HandPoseExpert(BaseExpert):
     """Hand pose expert for high-precision lab action capture."""
 
@@ -57,14 +66,8 @@ class HandPoseExpert(BaseExpert):
             "手势分析",
         ]
 
-    def get_edge_policy(self) -> Dict[str, Any]:
-        return {
-            "event_name": "hand_pose_analysis",
-            "trigger_classes": ["person", "hand", "glove"],
-            "condition": "any",
-            "action": "full_frame",
-            "cooldown": 1.5,
-        }
+    def get_edge_policy(self) -> EdgePolicy:
+        return _EDGE_POLICY
 
     def match_event(self, event_name: str) -> bool:
         normalized = (event_name or "").strip().lower()
@@ -1,10 +1,29 @@
-from typing import Dict, List
+from typing import List
 
-from pc.core.base_expert import BaseExpert
-from pc.experts.utils import has_any, parse_detected_classes
+from pc.core.base_expert import BaseExpert, EdgePolicy
+from pc.experts.utils import class_set, detected_class_set, has_any
 from pc.experts.safety.semantic_risk_mapper import build_semantic_observation, map_semantic_risk
 
 
+# 逐帧判断用到的类名集合在导入时构建一次。
+_COAT = class_set("lab coat", "coat", "apron")
+_GLOVES = class_set("glove", "gloves")
+_EYE_PROTECTION = class_set("goggles", "safety glasses", "face shield")
+_PHONE = class_set("cell", "phone", "cell phone")
+_HEAT_SOURCES = class_set("hot plate", "burner", "flame", "fire")
+_COMBUSTIBLES = class_set("paper", "book")
+_BOTTLES = class_set("bottle", "reagent bottle")
+
+
+_EDGE_POLICY = EdgePolicy(
+    event_name="综合安全巡检",
+    trigger_classes=("person", "bottle", "cell phone", "hot plate", "burner"),
+    condition="any",
+    action="full_frame",
+    cooldown=3.0,
+)
+
+
 class IntegratedLabSafetyExpert(BaseExpert):
     """聚合式综合安全专家：整合危化/PPE/行为/热源风险。"""
 
@@ -19,37 +38,31 @@ class IntegratedLabSafetyExpert(BaseExpert):
     def supported_events(self) -> List[str]:
         return ["综合安全巡检"]
 
-    def get_edge_policy(self) -> Dict:
-        return {
-            "event_name": "综合安全巡检",
-            "trigger_classes": ["person", "bottle", "cell phone", "hot plate", "burner"],
-            "condition": "any",
-            "action": "full_frame",
-            "cooldown": 3.0,
-        }
+    def get_edge_policy(self) -> EdgePolicy:
+        return _EDGE_POLICY
 
     def match_event(self, event_name: str) -> bool:
         return event_name in self.supported_events()
 
     def analyze(self, frame, context) -> str:
-        d = parse_detected_classes(context.get("detected_classes", ""))
+        d = detected_class_set(context)
         alerts = []
 
         if "person" in d:
-            if not has_any(d, ["lab coat", "coat", "apron"]):
+            if not has_any(d, _COAT):
                 alerts.append("实验服缺失")
-            if not has_any(d, ["glove", "gloves"]):
+            if not has_any(d, _GLOVES):
                 alerts.append("手套缺失")
-            if not has_any(d, ["goggles", "safety glasses", "face shield"]):
+            if not has_any(d, _EYE_PROTECTION):
                 alerts.append("护目镜缺失")
 
-        if "person" in d and has_any(d, ["cell", "phone", "cell phone"]):
+        if "person" in d and has_any(d, _PHONE):
             alerts.append("操作时使用手机")
 
-        if has_any(d, ["hot plate", "burner", "flame", "fire"]) and has_any(d, ["paper", "book"]):
+        if has_any(d, _HEAT_SOURCES) and has_any(d, _COMBUSTIBLES):
             alerts.append("热源邻近可燃物")
 
-        if has_any(d, ["bottle", "reagent bottle"]) and not has_any(d, ["glove", "gloves"]):
+        if has_any(d, _BOTTLES) and not has_any(d, _GLOVES):
             alerts.append("试剂操作未佩戴手套")
 
         sem = build_semantic_observation(
@@ -1,7 +1,25 @@
-from typing import Dict, List
-
-from pc.core.base_expert import BaseExpert
-from pc.experts.utils import has_any, parse_detected_classes
+from typing import List, Tuple
+
+from pc.core.base_expert import BaseExpert, EdgePolicy
+from pc.experts.utils import detected_class_set, has_any
+
+
+_EDGE_POLICIES = (
+    EdgePolicy(
+        event_name="PPE穿戴检查",
+        trigger_classes=("person",),
+        condition="any",
+        action="full_frame",
+        cooldown=8.0,
+    ),
+    EdgePolicy(
+        event_name="危化品识别",
+        trigger_classes=("person", "bottle"),
+        condition="all",
+        action="full_frame",
+        cooldown=5.0,
+    ),
+)
 
 
 class PPEExpert(BaseExpert):
@@ -18,29 +36,14 @@ class PPEExpert(BaseExpert):
     def supported_events(self) -> List[str]:
         return ["PPE穿戴检查", "危化品识别", "仪器操作巡检"]
 
-    def get_edge_policy(self) -> List[Dict]:
-        return [
-            {
-                "event_name": "PPE穿戴检查",
-                "trigger_classes": ["person"],
-                "condition": "any",
-                "action": "full_frame",
-                "cooldown": 8.0,
-            },
-            {
-                "event_name": "危化品识别",
-                "trigger_classes": ["person", "bottle"],
-                "condition": "all",
-                "action": "full_frame",
-                "cooldown": 5.0,
-            },
-        ]
+    def get_edge_policy(self) -> Tuple[EdgePolicy, ...]:
+        return _EDGE_POLICIES
 
     def match_event(self, event_name):
         return event_name in self.supported_events()
 
     def analyze(self, frame, context):
-        detected = parse_detected_classes(context.get("detected_classes", ""))
+        detected = detected_class_set(context)
         if "person" not in detected:
             return ""
 
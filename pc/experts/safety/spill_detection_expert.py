@@ -1,6 +1,15 @@
-from typing import Dict, List
+from typing import List
 
-from pc.core.base_expert import BaseExpert
+from pc.core.base_expert import BaseExpert, EdgePolicy
+
+
+_EDGE_POLICY = EdgePolicy(
+    event_name="液体洒漏巡检",
+    trigger_classes=("table", "desk", "lab bench"),
+    condition="any",
+    action="full_frame",
+    cooldown=6.0,
+)
 
 
 class SpillDetectionExpert(BaseExpert):
@@ -17,14 +26,8 @@ class SpillDetectionExpert(BaseExpert):
     def supported_events(self) -> List[str]:
         return ["液体洒漏巡检"]
 
-    def get_edge_policy(self) -> Dict:
-        return {
-            "event_name": "液体洒漏巡检",
-            "trigger_classes": ["table", "desk", "lab bench"],
-            "condition": "any",
-            "action": "full_frame",
-            "cooldown": 6.0,
-        }
+    def get_edge_policy(self) -> EdgePolicy:
+        return _EDGE_POLICY
 
     def match_event(self, event_name: str) -> bool:
         return event_name in self.supported_events()
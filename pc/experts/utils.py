@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import re
-from typing import Iterable, List, Set
+from typing import AbstractSet, FrozenSet, Iterable, List, Set
 
 
 def parse_detected_classes(raw) -> Set[str]:
@@ -14,14 +14,31 @@ def parse_detected_classes(raw) -> Set[str]:
     return {p.strip() for p in parts if p.strip()}
 
 
+def detected_class_set(context) -> FrozenSet[str]:
+    """优先复用调度层预先解析好的 detected_classes_set，缺失时再就地解析一次。"""
+    cached = context.get("detected_classes_set")
+    if isinstance(cached, frozenset):
+        return cached
+    return frozenset(parse_detected_classes(context.get("detected_classes", "")))
+
+
+def class_set(*names: str) -> FrozenSet[str]:
+    """预先构建小写类名集合，供专家在模块级复用，避免逐帧重建。"""
+    return frozenset(x.lower() for x in names)
+
+
+def _normalize(candidates: Iterable[str]) -> AbstractSet[str]:
+    if isinstance(candidates, frozenset):
+        return candidates
+    return {x.lower() for x in candidates}
+
+
 def has_any(classes: Set[str], candidates: Iterable[str]) -> bool:
-    cands = {x.lower() for x in candidates}
-    return any(c in classes for c in cands)
+    return not _normalize(candidates).isdisjoint(classes)
 
 
 def has_all(classes: Set[str], candidates: Iterable[str]) -> bool:
-    cands = {x.lower() for x in candidates}
-    return cands.issubset(classes)
+    return _normalize(candidates).issubset(classes)
 
 
 def safe_upper_tokens(text: str) -> List[str]:
@@ -0,0 +1,87 @@
+"""INT8-quantized ONNX Runtime embeddings for the knowledge-base text2vec model."""
+
+from __future__ import annotations
+
+import importlib
+import platform
+from pathlib import Path
+from typing import Any, List, Optional
+
+import numpy as np
+
+from pc.core.logger import console_error, console_info
+
+try:
+    from langchain_core.embeddings import Embeddings
+except Exception:
+    Embeddings = object
+
+QUANTIZED_FILE_NAME = "model_quantized.onnx"
+
+
+def _mean_pool(hidden: np.ndarray, attention_mask: np.ndarray) -> np.ndarray:
+    # 与 sentence-transformers 的 mean pooling 一致：按 attention_mask 对 token 向量求平均。
+    mask = attention_mask[..., None].astype(np.float32)
+    summed = (hidden * mask).sum(axis=1)
+    counts = np.clip(mask.sum(axis=1), 1e-9, None)
+    return summed / counts
+
+
+class OnnxInt8Embeddings(Embeddings):
+    """与 HuggingFaceEmbeddings 相同的 embed_query / embed_documents 接口，底层为动态 INT8 量化的 ONNX 模型。"""
+
+    def __init__(self, model: Any, tokenizer: Any, batch_size: int = 32, max_length: int = 512) -> None:
+        self.model = model
+        self.tokenizer = tokenizer
+        self.batch_size = max(1, int(batch_size))
+        self.max_length = int(max_length)
+
+    def _encode(self, texts: List[str]) -> List[List[float]]:
+        vectors: List[List[float]] = []
+        for start in range(0, len(texts), self.batch_size):
+            batch = [text.replace("\n", " ") for text in texts[start:start + self.batch_size]]
+            tokens = self.tokenizer(batch, padding=True, truncation=True, max_length=self.max_length, return_tensors="np")
+            outputs = self.model(**tokens)
+            hidden = np.asarray(outputs.last_hidden_state, dtype=np.float32)
+            vectors.extend(_mean_pool(hidden, np.asarray(tokens["attention_mask"])).tolist())
+        return vectors
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._encode(list(texts))
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._encode([text])[0]
+
+
+def _quantization_config(configuration_module: Any) -> Any:
+    auto_config = getattr(configuration_module, "AutoQuantizationConfig")
+    if platform.machine().lower() in {"arm64", "aarch64"}:
+        return auto_config.arm64(is_static=False, per_channel=False)
+    return auto_config.avx512_vnni(is_static=False, per_channel=False)
+
+
+def load_int8_embeddings(model_name: str, cache_dir: Path) -> Optional[OnnxInt8Embeddings]:
+    """首次调用时导出并量化模型到 cache_dir，之后直接加载；未安装 optimum[onnxruntime] 时返回 None。"""
+    if Embeddings is object:
+        return None
+    try:
+        ort_module = importlib.import_module("optimum.onnxruntime")
+        configuration_module = importlib.import_module("optimum.onnxruntime.configuration")
+        transformers_module = importlib.import_module("transformers")
+    except Exception:
+        return None
+    model_cls = getattr(ort_module, "ORTModelForFeatureExtraction")
+    tokenizer_cls = getattr(transformers_module, "AutoTokenizer")
+    try:
+        if not (cache_dir / QUANTIZED_FILE_NAME).exists():
+            console_info("正在将向量模型导出为 INT8 ONNX，仅首次需要，可能耗时数分钟。")
+            exported = model_cls.from_pretrained(model_name, export=True)
+            quantizer = getattr(ort_module, "ORTQuantizer").from_pretrained(exported)
+            quantizer.quantize(save_dir=str(cache_dir), quantization_config=_quantization_config(configuration_module))
+            tokenizer_cls.from_pretrained(model_name).save_pretrained(str(cache_dir))
+        model = model_cls.from_pretrained(str(cache_dir), file_name=QUANTIZED_FILE_NAME)
+        tokenizer = tokenizer_cls.from_pretrained(str(cache_dir))
+        return OnnxInt8Embeddings(model, tokenizer)
+    except Exception as exc:
+        console_error(f"INT8 向量模型加载失败，改用原始精度模型: {exc}")
+        return None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import atexit
 import importlib
 import json
 import logging
@@ -7,6 +8,7 @@ import os
 import shutil
 import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Iterable, List, Optional, Tuple
 
@@ -18,6 +20,8 @@ from pc.knowledge_base.media_ingestion import (
     TEXT_EXTENSIONS,
     prepare_knowledge_asset,
 )
+from pc.knowledge_base.onnx_embeddings import load_int8_embeddings
+from pc.knowledge_base.semantic_cache import SemanticQueryCache
 from pc.knowledge_base.structured_kb import StructuredKnowledgeBase, get_default_structured_kb
 
 os.environ["HF_HUB_DISABLE_SYMLINKS_WARNING"] = "1"
@@ -26,12 +30,51 @@ logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("sentence_transformers").setLevel(logging.WARNING)
 logging.getLogger("huggingface_hub").setLevel(logging.ERROR)
 
+_EMBEDDING_MODEL = "shibing624/text2vec-base-chinese"
+
+# 语音笔记只写入内存索引，攒够一批或超时后再整体 save_local，避免每条笔记都把整个索引重写到磁盘。
+_NOTE_FLUSH_BATCH = 32
+_NOTE_FLUSH_DELAY = 30.0
+
+# 向量条数达到阈值后把精确检索的 IndexFlat 换成 HNSW 图索引，检索耗时不再随语音笔记累积线性增长。
+_HNSW_MIN_VECTORS = 1000
+_HNSW_M = 32
+_HNSW_EF_CONSTRUCTION = 80
+_HNSW_EF_SEARCH = 32
+
+
+def _upgrade_to_hnsw(vector_db) -> bool:
+    index = getattr(vector_db, "index", None)
+    if index is None or int(getattr(index, "ntotal", 0) or 0) < _HNSW_MIN_VECTORS:
+        return False
+    try:
+        faiss = importlib.import_module("faiss")
+    except Exception:
+        return False
+    if not isinstance(index, faiss.IndexFlat):
+        return False
+    hnsw = faiss.IndexHNSWFlat(index.d, _HNSW_M, index.metric_type)
+    hnsw.hnsw.efConstruction = _HNSW_EF_CONSTRUCTION
+    hnsw.hnsw.efSearch = _HNSW_EF_SEARCH
+    # 按原顺序重新写入，docstore 的位置映射保持不变。
+    hnsw.add(index.reconstruct_n(0, index.ntotal))
+    vector_db.index = hnsw
+    return True
+
 
 class ScopedRAGEngine:
     SUPPORTED_EXTENSIONS = set(ALL_IMPORTABLE_EXTENSIONS)
     _shared_embeddings = None
     _vector_components: Optional[Tuple[object, object, object, object]] = None
     _vector_import_failed = False
+    _text_cache: Dict[str, Tuple[Tuple[int, int], str]] = {}
+    _text_cache_lock = threading.Lock()
+    _index_lock = threading.RLock()
+    _pending_notes = 0
+    _flush_timer: Optional[threading.Timer] = None
+    _QUERY_VECTOR_CAPACITY = 256
+    _query_vectors: "OrderedDict[str, list]" = OrderedDict()
+    _query_vectors_lock = threading.Lock()
 
     def __init__(self, scope_name: str, docs_dir: Path, db_path: Path, title: str = ""):
         self.scope_name = scope_name
@@ -41,7 +84,9 @@ class ScopedRAGEngine:
         self.docs_dir.mkdir(parents=True, exist_ok=True)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         self.vector_db = None
+        self._query_cache = SemanticQueryCache()
         self._init_db()
+        atexit.register(self.flush_index)
 
     @classmethod
     def _load_vector_components(cls) -> Optional[Tuple[object, object, object, object]]:
@@ -75,14 +120,35 @@ class ScopedRAGEngine:
         _, _, embeddings_cls, _ = components
         try:
             console_info("正在加载轻量向量检索组件，首次初始化可能需要数十秒。")
-            cls._shared_embeddings = embeddings_cls(model_name="shibing624/text2vec-base-chinese")
+            # 安装了 optimum[onnxruntime] 时优先使用 INT8 量化模型，CPU 上查询嵌入明显更快、内存更省。
+            cls._shared_embeddings = load_int8_embeddings(
+                _EMBEDDING_MODEL,
+                Path(resource_path("pc/knowledge_base/models/text2vec-int8")),
+            ) or embeddings_cls(model_name=_EMBEDDING_MODEL)
             return cls._shared_embeddings
         except Exception as exc:
             console_error(f"向量检索组件初始化失败，已回退为轻量文本检索: {exc}")
             cls._vector_import_failed = True
             return None
 
+    @classmethod
+    def _embed_query(cls, embeddings, query: str) -> list:
+        # 告警事件描述来自少量固定文案；嵌入模型全局共享，按原文记忆查询向量即可跳过重复的 BERT 前向。
+        with cls._query_vectors_lock:
+            vector = cls._query_vectors.get(query)
+            if vector is not None:
+                cls._query_vectors.move_to_end(query)
+                return vector
+        vector = embeddings.embed_query(query)
+        with cls._query_vectors_lock:
+            cls._query_vectors[query] = vector
+            if len(cls._query_vectors) > cls._QUERY_VECTOR_CAPACITY:
+                cls._query_vectors.popitem(last=False)
+        return vector
+
     def _init_db(self) -> None:
+        self._cancel_pending_flush()
+        self._query_cache.clear()
         components = self._load_vector_components()
         embeddings = self._get_embeddings()
         if components is None or embeddings is None:
@@ -96,6 +162,8 @@ class ScopedRAGEngine:
                     embeddings,
                     allow_dangerous_deserialization=True,
                 )
+                if _upgrade_to_hnsw(self.vector_db):
+                    self.vector_db.save_local(str(self.db_path))
                 return
             self.vector_db = faiss_cls.from_texts(["知识库初始化完成"], embeddings)
             self.vector_db.save_local(str(self.db_path))
@@ -109,6 +177,20 @@ class ScopedRAGEngine:
         self._init_db()
 
     def _read_text_content(self, filepath: str) -> str:
+        # 检索时每次都会遍历文档目录；按 (mtime_ns, size) 缓存解析结果，Excel 等慢格式只在文件变化后重新解析。
+        stat = os.stat(filepath)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._text_cache_lock:
+            cached = self._text_cache.get(filepath)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        content = self._parse_text_content(filepath)
+        with self._text_cache_lock:
+            self._text_cache[filepath] = (stamp, content)
+        return content
+
+    @staticmethod
+    def _parse_text_content(filepath: str) -> str:
         ext = os.path.splitext(filepath)[1].lower()
         if ext == ".json":
             with open(filepath, "r", encoding="utf-8") as handle:
@@ -130,7 +212,39 @@ class ScopedRAGEngine:
                 return ""
         return ""
 
-    def _split_and_store_text(self, text: str, source: str) -> bool:
+    def _cancel_pending_flush(self) -> None:
+        with self._index_lock:
+            timer, self._flush_timer = self._flush_timer, None
+            self._pending_notes = 0
+        if timer is not None:
+            timer.cancel()
+
+    def _persist_index(self) -> None:
+        with self._index_lock:
+            self._cancel_pending_flush()
+            self.vector_db.save_local(str(self.db_path))
+
+    def _schedule_flush(self) -> None:
+        with self._index_lock:
+            self._pending_notes += 1
+            if self._pending_notes >= _NOTE_FLUSH_BATCH:
+                self._persist_index()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(_NOTE_FLUSH_DELAY, self.flush_index)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush_index(self) -> None:
+        """立即把尚未落盘的语音笔记向量写回索引目录；进程退出时自动调用。"""
+        with self._index_lock:
+            if not self._pending_notes or self.vector_db is None:
+                return
+            try:
+                self._persist_index()
+            except Exception as exc:
+                console_error(f"向量索引落盘失败: {exc}")
+
+    def _split_and_store_text(self, text: str, source: str, persist: bool = True) -> bool:
         if not text.strip():
             return False
         if self.vector_db is None:
@@ -143,14 +257,20 @@ class ScopedRAGEngine:
             splitter = splitter_cls(chunk_size=300, chunk_overlap=20)
             docs = [document_cls(page_content=text, metadata={"source": source, "scope": self.scope_name})]
             splits = splitter.split_documents(docs)
-            self.vector_db.add_documents(splits)
-            self.vector_db.save_local(str(self.db_path))
+            with self._index_lock:
+                self.vector_db.add_documents(splits)
+                _upgrade_to_hnsw(self.vector_db)
+                self._query_cache.clear()
+                if persist:
+                    self._persist_index()
+                else:
+                    self._schedule_flush()
             return True
         except Exception as exc:
             console_error(f"向量索引写入失败，已保留原始文档: {exc}")
             return True
 
-    def ingest_knowledge_file(self, filepath: str) -> bool:
+    def ingest_knowledge_file(self, filepath: str, persist: bool = True) -> bool:
         if not os.path.isfile(filepath):
             console_error(f"知识文件不存在: {filepath}")
             return False
@@ -159,7 +279,7 @@ class ScopedRAGEngine:
             return filepath.startswith(str(self.docs_dir))
         try:
             content = self._read_text_content(filepath)
-            return self._split_and_store_text(content, source=os.path.basename(filepath))
+            return self._split_and_store_text(content, source=os.path.basename(filepath), persist=persist)
         except Exception as exc:
             console_error(f"知识文件导入失败 [{filepath}]: {exc}")
             return False
@@ -170,7 +290,7 @@ class ScopedRAGEngine:
         filename = f"VoiceNote_{time.strftime('%Y%m%d_%H%M%S')}.txt"
         filepath = self.docs_dir / filename
         filepath.write_text(text_content, encoding="utf-8")
-        return self.ingest_knowledge_file(str(filepath))
+        return self.ingest_knowledge_file(str(filepath), persist=False)
 
     def _keyword_score(self, query: str, content: str) -> int:
         query = (query or "").strip().lower()
@@ -209,12 +329,28 @@ class ScopedRAGEngine:
         hits.sort(key=lambda item: int(item.get("_score", "0")), reverse=True)
         return hits[:top_k]
 
+    def _vector_search(self, query: str, top_k: int) -> list:
+        embeddings = self._get_embeddings()
+        if embeddings is None:
+            return self.vector_db.similarity_search(query, k=top_k)
+        # 查询向量本就要计算一次；语义近似的重复查询直接复用上次的检索结果，索引写入后缓存失效。
+        return self.query_by_vector(self._embed_query(embeddings, query), top_k)
+
+    def query_by_vector(self, vector, top_k: int = 3) -> list:
+        if self.vector_db is None:
+            return []
+        docs = self._query_cache.lookup(vector, top_k)
+        if docs is None:
+            docs = self.vector_db.similarity_search_by_vector(vector, k=top_k)
+            self._query_cache.store(vector, top_k, docs)
+        return docs
+
     def retrieve_context(self, query: str, top_k: int = 3) -> str:
         if not query.strip():
             return ""
         if self.vector_db is not None:
             try:
-                docs = self.vector_db.similarity_search(query, k=top_k)
+                docs = self._vector_search(query, top_k)
                 return "\n---\n".join(doc.page_content for doc in docs)
             except Exception:
                 pass
@@ -226,7 +362,7 @@ class ScopedRAGEngine:
             return []
         if self.vector_db is not None:
             try:
-                docs = self.vector_db.similarity_search(query, k=top_k)
+                docs = self._vector_search(query, top_k)
                 return [
                     {
                         "scope": self.scope_name,
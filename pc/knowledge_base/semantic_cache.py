@@ -0,0 +1,60 @@
+"""Near-duplicate query cache for vector retrieval, keyed by query embedding."""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, List, Optional
+
+import numpy as np
+
+
+class SemanticQueryCache:
+    """按查询向量的余弦相似度复用检索结果；闭环告警的查询高度重复，命中时跳过 FAISS 检索。"""
+
+    def __init__(self, threshold: float = 0.95, capacity: int = 128) -> None:
+        self.threshold = float(threshold)
+        self.capacity = max(1, int(capacity))
+        self._lock = threading.Lock()
+        self._vectors: Optional[np.ndarray] = None
+        self._entries: List[tuple[int, Any]] = []
+
+    @staticmethod
+    def _normalize(vector: Any) -> np.ndarray:
+        array = np.asarray(vector, dtype=np.float32).ravel()
+        norm = float(np.linalg.norm(array))
+        return array / norm if norm > 0 else array
+
+    def lookup(self, vector: Any, top_k: int) -> Any:
+        unit = self._normalize(vector)
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != unit.shape[0]:
+                return None
+            scores = self._vectors @ unit
+            for index in np.argsort(scores)[::-1]:
+                if scores[index] < self.threshold:
+                    break
+                cached_k, value = self._entries[index]
+                if cached_k == top_k:
+                    return value
+        return None
+
+    def store(self, vector: Any, top_k: int, value: Any) -> None:
+        unit = self._normalize(vector)[None, :]
+        with self._lock:
+            if self._vectors is None or self._vectors.shape[1] != unit.shape[1]:
+                self._vectors = unit
+                self._entries = [(top_k, value)]
+                return
+            if len(self._entries) >= self.capacity:
+                self._vectors = self._vectors[1:]
+                self._entries.pop(0)
+            self._vectors = np.vstack((self._vectors, unit))
+            self._entries.append((top_k, value))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._vectors = None
+            self._entries = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,8 +3,8 @@
 """
 main.py - PC端主程序 (多节点独立重连 + 本机专家统合优化版)
 """
-import asyncio
 import cv2
+import functools
 import numpy as np
 import threading
 import subprocess
@@ -69,6 +69,7 @@ except ImportError as e:
     print(f"\n\033[91m[致命错误] 模块导入失败: {e}\033[0m")
     sys.exit(1)
 
+# 需要联动的多个字段用一次 _STATE.update 写入，避免其他线程读到只改了一半的组合状态。
 _STATE: Dict[str, Any] = {
     "running": True,
     "video_running": False,
@@ -164,6 +165,12 @@ class InferenceThread(threading.Thread):
         self.interval = interval
         self.backend = backend
         self.model = model
+        # 本机推理的节点身份与能力在线程生命周期内固定，预先绑定，循环内只传每帧变化的参数。
+        self._plan_local_event = functools.partial(
+            orchestrator.plan_edge_event,
+            pi_id="pc_local",
+            node_caps={"has_speaker": True},
+        )
 
     def run(self) -> None:
         last_infer_time = 0.0
@@ -203,11 +210,9 @@ class InferenceThread(threading.Thread):
                     policy_name="",
                     policy_action="",
                 )
-                orchestrated = orchestrator.plan_edge_event(
-                    pi_id="pc_local",
+                orchestrated = self._plan_local_event(
                     event=local_event,
                     selected_model=_STATE.get("selected_model", "") or get_config("qwen.model", "qwen-vl-max"),
-                    node_caps={"has_speaker": True},
                 )
                 result = orchestrated.text
 
@@ -362,8 +367,7 @@ def select_run_mode() -> bool:
 
 
 def signal_handler(sig_num: Any, frame_data: Any) -> None:
-    _STATE["running"] = False
-    _STATE["video_running"] = False
+    _STATE.update(running=False, video_running=False)
 
 
 # ==================== 主程序入口 ====================
@@ -420,8 +424,7 @@ def main() -> None:
 
         # ★ 第二层循环：模式选择与运行 (这是主循环)
         while _STATE["running"]:
-            _STATE["connection_lost"] = False
-            _STATE["video_running"] = False
+            _STATE.update(connection_lost=False, video_running=False)
 
             while not inference_queue.empty():
                 try:
@@ -438,7 +441,7 @@ def main() -> None:
                 if not pi_topology: continue
 
                 manager = MultiPiManager(pi_topology)
-                threading.Thread(target=lambda: asyncio.run(manager.start()), daemon=True).start()
+                threading.Thread(target=manager.run, daemon=True).start()
 
                 _STATE["video_running"] = True
                 safe_console_info(f"已启动多节点监控，共计 {len(pi_topology)} 个站点。按 ESC 退出监控。")
@@ -483,8 +486,7 @@ def main() -> None:
                             getattr(manager, 'node_status', {}).get(pid) == "offline" for pid in pi_topology.keys())
                         if all_offline:
                             safe_console_info("所有节点均已断开，自动回退到网络配置...")
-                            _STATE["connection_lost"] = True
-                            _STATE["video_running"] = False
+                            _STATE.update(connection_lost=True, video_running=False)
                             break
 
                 finally:
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+import configparser
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pc.core import config
+
+
+class ConfigWriteBackTests(unittest.TestCase):
+    def test_set_config_batches_writes_until_flush(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pc_config_") as temp_dir:
+            config_path = Path(temp_dir) / "config.ini"
+            with patch.object(config, "config_file", str(config_path)), \
+                 patch.object(config, "_config", configparser.ConfigParser()), \
+                 patch.object(config, "_value_cache", {}), \
+                 patch.object(config, "_initialized", True), \
+                 patch.object(config, "_FLUSH_DELAY", 60.0), \
+                 patch.object(config, "_save_config", wraps=config._save_config) as save:
+                config.set_config("session_defaults.operator_name", "张三")
+                config.set_config("session_defaults.tags", "实验室")
+                self.assertEqual(config.get_config("session_defaults.operator_name"), "张三")
+                self.assertFalse(config_path.exists())
+
+                config.flush_config()
+                config.flush_config()
+
+            self.assertEqual(save.call_count, 1)
+            parser = configparser.ConfigParser()
+            parser.read(config_path, encoding="utf-8-sig")
+            self.assertEqual(parser.get("session_defaults", "operator_name"), "张三")
+            self.assertEqual(parser.get("session_defaults", "tags"), "实验室")
+
+    def test_config_batch_writes_once_on_exit(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pc_config_") as temp_dir:
+            config_path = Path(temp_dir) / "config.ini"
+            with patch.object(config, "config_file", str(config_path)), \
+                 patch.object(config, "_config", configparser.ConfigParser()), \
+                 patch.object(config, "_value_cache", {}), \
+                 patch.object(config, "_initialized", True), \
+                 patch.object(config, "_dirty", False), \
+                 patch.object(config, "_save_config", wraps=config._save_config) as save:
+                with config.config_batch():
+                    with config.config_batch():
+                        config.set_config("experts.safety.ppe_expert", 1)
+                    config.set_config("experts.safety.chem_safety_expert", 1)
+                    self.assertIsNone(config._flush_timer)
+                    self.assertFalse(config_path.exists())
+                self.assertEqual(save.call_count, 1)
+                self.assertTrue(config_path.exists())
+
+    def test_save_config_skips_identical_content(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pc_config_") as temp_dir:
+            config_path = Path(temp_dir) / "config.ini"
+            parser = configparser.ConfigParser()
+            parser.read_dict({"network": {"ws_port": "8001"}})
+            with patch.object(config, "config_file", str(config_path)), \
+                 patch.object(config, "_config", parser):
+                config._save_config()
+                os.utime(config_path, ns=(0, 0))
+                config._save_config()
+                self.assertEqual(config_path.stat().st_mtime_ns, 0)
+
+                parser.set("network", "ws_port", "9012")
+                config._save_config()
+                self.assertNotEqual(config_path.stat().st_mtime_ns, 0)
+
+    def test_config_file_is_parsed_on_first_access(self) -> None:
+        with patch.object(config, "_initialized", False), \
+             patch.object(config, "_init_config") as init_config:
+            config._value_cache.pop("inference.interval", None)
+            config.get_config("inference.interval")
+            config.get_config("inference.timeout")
+        init_config.assert_called_once()
+
+    def test_read_ini_matches_configparser_for_project_files(self) -> None:
+        content = (
+            "[network]\n"
+            "; 注释行\n"
+            "WS_Port = 8001\n"
+            "known_nodes = [{\"endpoint\": \"192.168.1.5:8001\"}]\n"
+            "\n"
+            "[voice_interaction]\n"
+            "wake_word: 小爱同学\n"
+            "wake_aliases = 小爱同学,\n"
+            "    小爱\n"
+        )
+        with tempfile.TemporaryDirectory(prefix="neurolab_pc_config_") as temp_dir:
+            config_path = Path(temp_dir) / "config.ini"
+            config_path.write_text(content, encoding="utf-8-sig")
+            expected = configparser.ConfigParser()
+            expected.read(config_path, encoding="utf-8-sig")
+
+            parsed = config._read_ini(str(config_path))
+
+        self.assertEqual(parsed, {name: dict(expected[name]) for name in expected.sections()})
+
+    def test_missing_config_file_parses_as_none(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pc_config_") as temp_dir:
+            self.assertIsNone(config._parse_config_file(str(Path(temp_dir) / "config.ini")))
+
+    def test_init_merges_only_missing_defaults(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pc_config_") as temp_dir:
+            config_path = Path(temp_dir) / "config.ini"
+            config_path.write_text(
+                "[ollama]\ndefault_models = custom:7b\n\n[qwen]\napi_key = sk-50%off\n",
+                encoding="utf-8-sig",
+            )
+            parser = configparser.ConfigParser(interpolation=None)
+            with patch.object(config, "config_file", str(config_path)), \
+                 patch.object(config, "_config", parser):
+                config._init_config()
+
+            self.assertEqual(parser.get("qwen", "api_key"), "sk-50%off")
+            self.assertEqual(parser.get("qwen", "model"), "qwen-vl-max")
+            self.assertTrue(parser.get("ollama", "default_models").startswith("custom:7b, "))
+            self.assertTrue(parser.has_section("experts"))
+            saved = configparser.ConfigParser(interpolation=None)
+            saved.read(config_path, encoding="utf-8-sig")
+            self.assertEqual(saved.get("inference", "interval"), "5")
+
+    def test_list_values_are_split_once_until_next_set(self) -> None:
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read_dict({"ollama": {"default_models": "qwen3.5:4b, gemma3:4b"}})
+        with patch.object(config, "_config", parser), \
+             patch.object(config, "_value_cache", {}), \
+             patch.object(config, "_list_cache", {}), \
+             patch.object(config, "_initialized", True), \
+             patch.object(config, "_FLUSH_DELAY", 60.0), \
+             patch.object(config, "_save_config"):
+            first = config.get_config_list("ollama.default_models")
+            first.append("mutated")
+            self.assertEqual(config.get_config_list("ollama.default_models"), ["qwen3.5:4b", "gemma3:4b"])
+            self.assertEqual(config.get_config_list("ollama.missing_models", "a, b"), ["a", "b"])
+
+            config.set_config("ollama.default_models", "phi4:14b")
+            self.assertEqual(config.get_config_list("ollama.default_models"), ["phi4:14b"])
+            config.flush_config()
+
+    def test_read_racing_with_set_config_does_not_cache_stale_value(self) -> None:
+        parser = configparser.ConfigParser(interpolation=None)
+        parser.read_dict({"network": {"ws_port": "8001", "virtual_pi_hosts": "a, b"}})
+        coerce = config._coerce_value
+        raced = []
+
+        def _coerce_during_write(raw):
+            # 模拟另一线程在读取与写缓存之间调用 set_config。
+            if not raced:
+                raced.append(raw)
+                config.set_config("network.ws_port", "9012")
+                config.set_config("network.virtual_pi_hosts", "c")
+            return coerce(raw)
+
+        with patch.object(config, "_config", parser), \
+             patch.object(config, "_value_cache", {}), \
+             patch.object(config, "_list_cache", {}), \
+             patch.object(config, "_initialized", True), \
+             patch.object(config, "_FLUSH_DELAY", 60.0), \
+             patch.object(config, "_save_config"):
+            with patch.object(config, "_coerce_value", side_effect=_coerce_during_write):
+                self.assertEqual(config.get_config("network.ws_port"), 8001)
+            self.assertEqual(config.get_config("network.ws_port"), 9012)
+
+            config.set_config("network.virtual_pi_hosts", "a, b")
+            raced.clear()
+            with patch.object(config, "_coerce_value", side_effect=_coerce_during_write):
+                self.assertEqual(config.get_config_list("network.virtual_pi_hosts"), ["a", "b"])
+            self.assertEqual(config.get_config_list("network.virtual_pi_hosts"), ["c"])
+            config.flush_config()
+
+    def test_coerce_value_keeps_existing_conversions(self) -> None:
+        cases = {"True": True, "off": False, "": "", "12": 12, "-3": -3, "0.4": 0.4, "1.2.3": "1.2.3", "http://127.0.0.1:11434": "http://127.0.0.1:11434"}
+        for raw, expected in cases.items():
+            self.assertEqual(config._coerce_value(raw), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
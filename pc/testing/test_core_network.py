@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from pc.core import network
+
+
+class LocalIpCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        network.invalidate_local_ip()
+        self.addCleanup(network.invalidate_local_ip)
+
+    def test_probe_runs_once_until_invalidated(self) -> None:
+        with patch.object(network, "_probe_local_ip", side_effect=["192.168.10.2", "10.0.0.7"]) as probe:
+            self.assertEqual(network.get_local_ip(), "192.168.10.2")
+            self.assertEqual(network.get_network_prefix(), "192.168.10.")
+            self.assertEqual(network.get_local_ip(), "192.168.10.2")
+            self.assertEqual(probe.call_count, 1)
+
+            network.invalidate_local_ip()
+            self.assertEqual(network.get_network_prefix(), "10.0.0.")
+            self.assertEqual(probe.call_count, 2)
+
+    def test_failed_probe_is_retried(self) -> None:
+        with patch.object(network, "_FALLBACK_IP", None), \
+             patch.object(network, "_probe_local_ip", side_effect=[OSError("no route"), OSError("no route"), "192.168.10.2"]), \
+             patch.object(network.socket, "gethostbyname", side_effect=OSError("resolver down")) as resolve:
+            self.assertEqual(network.get_local_ip(), "127.0.0.1")
+            self.assertEqual(network.get_local_ip(), "127.0.0.1")
+            self.assertEqual(resolve.call_count, 1)
+            self.assertEqual(network.get_local_ip(), "192.168.10.2")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import dataclasses
+import json
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pc.core.base_expert import EdgePolicy
+from pc.core.expert_manager import ExpertManager
+from pc.experts.safety.chem_safety_expert import ChemSafetyExpert
+from pc.experts.safety.general_safety_expert import GeneralSafetyExpert
+
+
+class EdgePolicyTests(unittest.TestCase):
+    def test_experts_return_shared_frozen_policies(self) -> None:
+        expert = GeneralSafetyExpert()
+        self.assertIs(expert.get_edge_policy(), GeneralSafetyExpert().get_edge_policy())
+        policy = expert.get_edge_policy()[0]
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            policy.cooldown = 0.0
+        self.assertFalse(hasattr(policy, "__dict__"))
+
+    def test_aggregated_policies_stay_plain_json_dicts(self) -> None:
+        definition = SimpleNamespace(trigger_mode="resident", stream_group="safety", default_speak_policy="speak")
+        legacy = SimpleNamespace(expert_code="legacy", get_edge_policy=lambda: [{"event_name": "旧策略", "cooldown": 1.0}])
+        chem = ChemSafetyExpert()
+        manager = ExpertManager.__new__(ExpertManager)
+        rows = [(chem, definition), (legacy, definition)]
+        with patch.object(ExpertManager, "_sorted_loaded_with_definition", return_value=rows), \
+             patch.object(ExpertManager, "_allowed_closed_loop_events", return_value=set()):
+            first = manager.get_aggregated_edge_policy()
+            first["event_policies"][0]["trigger_classes"].append("mutated")
+            second = manager.get_aggregated_edge_policy()
+
+        policies = second["event_policies"]
+        self.assertEqual([row["event_name"] for row in policies], ["危化品识别", "旧策略"])
+        self.assertEqual(policies[0]["trigger_classes"], ["bottle", "chemical bottle", "reagent bottle"])
+        self.assertEqual(policies[0]["expert_code"], chem.expert_code)
+        self.assertEqual(policies[1]["stream_group"], "safety")
+        json.dumps(second, ensure_ascii=False)
+        self.assertIsInstance(chem.get_edge_policy(), EdgePolicy)
+
+
+if __name__ == "__main__":
+    unittest.main()
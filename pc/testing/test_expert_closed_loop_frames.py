@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import unittest
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+
+from pc.core.expert_closed_loop import (
+    PI_FRAME_YOLO_EVENT,
+    build_pi_command,
+    parse_pi_expert_frame,
+    parse_pi_expert_packet,
+)
+from pi import pisend_receive
+
+
+def _jpeg_bytes() -> bytes:
+    frame = np.full((32, 48, 3), 128, dtype=np.uint8)
+    ok, encoded = cv2.imencode(".jpg", frame)
+    assert ok
+    return encoded.tobytes()
+
+
+class ExpertClosedLoopFrameTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.meta = {
+            "event_id": "evt-1",
+            "event_name": "危化品识别",
+            "expert_code": "safety.chem_safety_expert",
+            "detected_classes": "bottle,person",
+            "timestamp": 12.5,
+            "capture_metrics": {"source": "unit"},
+        }
+
+    def test_pi_binary_event_frame_is_parsed_on_pc(self) -> None:
+        packet = pisend_receive.build_expert_event_frame(self.meta, _jpeg_bytes())
+
+        event, error = parse_pi_expert_frame(packet)
+
+        self.assertIsNone(error)
+        self.assertEqual(event.event_id, "evt-1")
+        self.assertEqual(event.event_name, "危化品识别")
+        self.assertEqual(event.capture_metrics, {"source": "unit"})
+        self.assertEqual(event.frame.shape, (32, 48, 3))
+
+    def test_yolo_opcode_and_truncated_frame(self) -> None:
+        expert_packet = pisend_receive.build_expert_event_frame(self.meta, _jpeg_bytes())
+        packet = bytes([PI_FRAME_YOLO_EVENT]) + expert_packet[1:]
+        event, error = parse_pi_expert_frame(packet)
+        self.assertIsNone(error)
+        self.assertEqual(event.expert_code, "safety.chem_safety_expert")
+
+        event, error = parse_pi_expert_frame(packet[:8])
+        self.assertIsNone(event)
+        self.assertTrue(error)
+
+    def test_preview_jpeg_is_not_mistaken_for_event(self) -> None:
+        event, error = parse_pi_expert_frame(_jpeg_bytes())
+        self.assertIsNone(event)
+        self.assertEqual(error, "unsupported opcode")
+
+    def test_legacy_base64_text_packet_still_supported(self) -> None:
+        b64_img = base64.b64encode(_jpeg_bytes()).decode("utf-8")
+        packet = f"PI_EXPERT_EVENT:{json.dumps(self.meta, ensure_ascii=False)}:{b64_img}"
+
+        event, error = parse_pi_expert_packet(packet)
+
+        self.assertIsNone(error)
+        self.assertEqual(event.event_id, "evt-1")
+
+    def test_pi_falls_back_to_text_packet_until_pc_advertises_binary(self) -> None:
+        packet = pisend_receive.build_expert_event_message(self.meta, _jpeg_bytes(), binary=False)
+        self.assertIsInstance(packet, str)
+        event, error = parse_pi_expert_packet(packet)
+        self.assertIsNone(error)
+        self.assertEqual(event.event_id, "evt-1")
+
+        packet = pisend_receive.build_expert_event_message(self.meta, _jpeg_bytes(), binary=True)
+        self.assertIsInstance(packet, bytes)
+        event, error = parse_pi_expert_frame(packet)
+        self.assertIsNone(error)
+
+    def test_pc_advertises_binary_event_frames_in_sync_config(self) -> None:
+        from pc.communication.multi_ws_manager import MultiPiManager
+
+        manager = MultiPiManager({"1": "127.0.0.1"})
+        try:
+            command = manager._sync_config_command()
+        finally:
+            manager.stop()
+        payload = json.loads(command[len("CMD:SYNC_CONFIG:"):])
+        self.assertIs(payload["binary_event_frames"], True)
+
+    def test_build_pi_command_uses_compact_json(self) -> None:
+        self.assertEqual(build_pi_command("RUN_SELF_CHECK"), "CMD:RUN_SELF_CHECK")
+        self.assertEqual(build_pi_command("SET_FPS", 15.0), "CMD:SET_FPS:15.0")
+        self.assertEqual(build_pi_command("SYNC_CONFIG", {"wake_word": "小爱同学"}), 'CMD:SYNC_CONFIG:{"wake_word":"小爱同学"}')
+
+    def test_urgent_tts_jumps_ahead_of_routine_speech(self) -> None:
+        async def _scenario() -> list:
+            with patch.object(pisend_receive, "tts_queue", asyncio.PriorityQueue()):
+                pisend_receive._enqueue_tts("例行播报一")
+                pisend_receive._enqueue_tts("例行播报二")
+                pisend_receive._enqueue_tts("危化品告警", urgent=True)
+                queue = pisend_receive.tts_queue
+                return [queue.get_nowait()[-1] for _ in range(queue.qsize())]
+
+        self.assertEqual(asyncio.run(_scenario()), ["危化品告警", "例行播报一", "例行播报二"])
+
+
+if __name__ == "__main__":
+    unittest.main()
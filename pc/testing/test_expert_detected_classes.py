@@ -0,0 +1,52 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pc.core.expert_manager import ExpertManager
+from pc.experts.safety.ppe_expert import PPEExpert
+from pc.experts.utils import detected_class_set
+
+
+class _RecordingExpert:
+    def __init__(self, code: str) -> None:
+        self.expert_code = code
+        self.expert_name = code
+        self.seen = []
+
+    def match_event(self, event_name: str) -> bool:
+        return True
+
+    def analyze(self, frame, context) -> str:
+        self.seen.append(context["detected_classes_set"])
+        return ""
+
+
+class DetectedClassSetTests(unittest.TestCase):
+    def test_route_parses_detected_classes_once_for_all_experts(self) -> None:
+        manager = ExpertManager.__new__(ExpertManager)
+        experts = [_RecordingExpert("a"), _RecordingExpert("b")]
+        definition = SimpleNamespace(trigger_mode="resident")
+        manager._iter_loaded_with_definition = lambda: [(expert, definition) for expert in experts]
+
+        context = {"detected_classes": "Person, Bottle|gloves"}
+        with patch.object(ExpertManager, "_build_knowledge_context", return_value={}):
+            manager.route_and_analyze("综合安全巡检", None, context)
+
+        first, second = experts[0].seen[0], experts[1].seen[0]
+        self.assertIs(first, second)
+        self.assertEqual(first, frozenset({"person", "bottle", "gloves"}))
+        self.assertNotIn("detected_classes_set", context)
+
+    def test_experts_fall_back_to_parsing_raw_classes(self) -> None:
+        self.assertEqual(detected_class_set({"detected_classes": ["Person", " coat "]}), frozenset({"person", "coat"}))
+        self.assertEqual(detected_class_set({}), frozenset())
+
+        expert = PPEExpert()
+        reply = expert.analyze(None, {"detected_classes": "person,coat,gloves"})
+        self.assertIn("护目镜", reply)
+        precomputed = {"detected_classes": "", "detected_classes_set": frozenset({"person", "coat", "gloves", "goggles"})}
+        self.assertEqual(expert.analyze(None, precomputed), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
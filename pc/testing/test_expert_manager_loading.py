@@ -0,0 +1,81 @@
+import os
+import tempfile
+import threading
+import types
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pc.core import expert_manager as expert_manager_module
+from pc.core.base_expert import BaseExpert
+from pc.core.expert_manager import ExpertManager
+
+
+def _expert_module(name: str) -> types.ModuleType:
+    module = types.ModuleType(name)
+
+    class _Expert(BaseExpert):
+        expert_name = name
+        expert_version = "test"
+
+        def get_edge_policy(self):
+            return {}
+
+        def match_event(self, event_name: str) -> bool:
+            return False
+
+        def analyze(self, frame, context: dict) -> str:
+            return ""
+
+    module.Expert = _Expert
+    return module
+
+
+class ExpertManagerLoadingTests(unittest.TestCase):
+    def test_modules_import_concurrently_and_register_in_order(self) -> None:
+        definitions = [
+            SimpleNamespace(code=f"demo.{name}", module=f"demo_{name}", display_name=name)
+            for name in ("alpha", "broken", "gamma")
+        ]
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _fake_import(module_name: str):
+            if module_name == "demo_broken":
+                raise ImportError("missing weights")
+            # 两个正常模块必须同时处于导入中，barrier 才能放行。
+            barrier.wait()
+            return _expert_module(module_name)
+
+        with patch.object(expert_manager_module, "list_expert_definitions", return_value=definitions), \
+             patch.object(expert_manager_module, "get_config", return_value=1), \
+             patch.object(expert_manager_module.importlib, "import_module", side_effect=_fake_import), \
+             patch.object(expert_manager_module, "console_info"), \
+             patch.object(expert_manager_module, "console_error") as console_error:
+            manager = ExpertManager()
+
+        self.assertEqual(list(manager.experts), ["demo_alpha", "demo_gamma"])
+        self.assertEqual(manager._expert_codes["demo_gamma"], "demo.gamma")
+        console_error.assert_called_once()
+        self.assertIn("demo.broken", console_error.call_args.args[0])
+
+    def test_asset_status_counts_nested_files(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_expert_assets_") as temp_dir:
+            root = Path(temp_dir)
+            (root / "docs" / "sop").mkdir(parents=True)
+            (root / "model.pt").write_bytes(b"0")
+            (root / "docs" / "sop" / "ppe.md").write_text("护目镜", encoding="utf-8")
+            os.utime(root / "model.pt", (100.0, 100.0))
+            os.utime(root / "docs" / "sop" / "ppe.md", (200.0, 200.0))
+            manager = ExpertManager.__new__(ExpertManager)
+            with patch.object(expert_manager_module, "expert_asset_dir", return_value=root):
+                status = manager._asset_status("safety.ppe_expert")
+            with patch.object(expert_manager_module, "expert_asset_dir", return_value=root / "missing"):
+                missing = manager._asset_status("safety.ppe_expert")
+
+        self.assertEqual((status["file_count"], status["ready"], status["latest_mtime"]), (2, True, 200.0))
+        self.assertEqual((missing["file_count"], missing["ready"], missing["latest_mtime"]), (0, False, 0.0))
+
+
+if __name__ == "__main__":
+    unittest.main()
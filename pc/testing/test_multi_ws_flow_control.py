@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from pc.communication.multi_ws_manager import MultiPiManager
+
+
+class PreviewFlowControlTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = MultiPiManager({"1": "127.0.0.1", "2": "127.0.0.2"})
+        self.manager.flow_window_seconds = 0.0
+
+    def tearDown(self) -> None:
+        self.manager.stop()
+
+    def _drain(self, pi_id: str) -> list:
+        pending = self.manager._send_pending[pi_id]
+        commands = list(pending)
+        pending.clear()
+        return commands
+
+    def test_heavy_drops_halve_fps_and_clean_windows_recover(self) -> None:
+        self.assertEqual(self.manager.target_fps, 15.0)
+
+        self.manager._account_preview_frame("1", dropped=True)
+        self.assertEqual(self.manager._node_fps["1"], 7.5)
+        self.assertEqual(self._drain("1"), ["CMD:SET_FPS:7.5"])
+
+        self.manager._account_preview_frame("1", dropped=False)
+        self.assertEqual(self.manager._node_fps["1"], 8.5)
+        self.assertEqual(self._drain("1"), ["CMD:SET_FPS:8.5"])
+        self.assertEqual(self._drain("2"), [])
+
+    def test_fps_stays_within_bounds(self) -> None:
+        self.manager._account_preview_frame("1", dropped=False)
+        self.assertEqual(self.manager._node_fps["1"], 15.0)
+        self.assertEqual(self._drain("1"), [])
+
+        for _ in range(10):
+            self.manager._account_preview_frame("1", dropped=True)
+        self.assertEqual(self.manager._node_fps["1"], 1.0)
+
+    def test_reconnect_delay_uses_full_jitter_and_is_capped(self) -> None:
+        with patch("pc.communication.multi_ws_manager.random.uniform", side_effect=lambda low, high: (low, high)):
+            self.assertEqual(MultiPiManager._reconnect_delay(0), (0.0, 1.0))
+            self.assertEqual(MultiPiManager._reconnect_delay(3), (0.0, 8.0))
+            for attempt in (6, 1751, 10 ** 6):
+                self.assertEqual(MultiPiManager._reconnect_delay(attempt), (0.0, 60.0))
+        for attempt in (0, 10 ** 6):
+            delay = MultiPiManager._reconnect_delay(attempt)
+            self.assertGreaterEqual(delay, 0.0)
+            self.assertLessEqual(delay, 60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import threading
+import unittest
+
+import cv2
+import numpy as np
+
+from pc.communication.multi_ws_manager import MultiPiManager
+
+
+class _FakeTurboJPEG:
+    def decode_header(self, data):
+        frame = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        height, width = frame.shape[:2]
+        return width, height, 0, 0
+
+    def decode(self, data, dst=None):
+        dst[...] = cv2.imdecode(np.frombuffer(data, np.uint8), cv2.IMREAD_COLOR)
+        return dst
+
+
+def _jpeg(height: int, width: int, value: int) -> bytes:
+    ok, encoded = cv2.imencode(".jpg", np.full((height, width, 3), value, dtype=np.uint8))
+    assert ok
+    return encoded.tobytes()
+
+
+class FramePoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.manager = MultiPiManager({"1": "127.0.0.1", "2": "127.0.0.2", "3": "127.0.0.3"})
+        self.manager._turbojpeg = _FakeTurboJPEG()
+
+    def tearDown(self) -> None:
+        self.manager.stop()
+
+    def _decode(self, pi_id: str, data: bytes) -> np.ndarray:
+        frame = self.manager._decode_preview(pi_id, data)
+        self.manager.frame_buffers[pi_id] = frame
+        return frame
+
+    def test_same_resolution_nodes_share_pool(self) -> None:
+        first = self._decode("1", _jpeg(24, 32, 10))
+        second = self._decode("2", _jpeg(24, 32, 200))
+
+        self.assertIs(first.base, self.manager._frame_pool)
+        self.assertIs(second.base, self.manager._frame_pool)
+        self.assertEqual(self.manager._frame_pool.shape, (3, 2, 24, 32, 3))
+
+        self.assertFalse(np.shares_memory(first, second))
+        self.assertLess(int(first.mean()), 50)
+        self.assertGreater(int(second.mean()), 150)
+
+    def test_double_buffer_alternates_and_outlier_falls_back(self) -> None:
+        first = self._decode("1", _jpeg(24, 32, 10))
+        second = self._decode("1", _jpeg(24, 32, 10))
+        self.assertFalse(np.shares_memory(first, second))
+
+        outlier = self._decode("3", _jpeg(16, 16, 90))
+        self.assertIsNot(outlier.base, self.manager._frame_pool)
+        self.assertEqual(outlier.shape, (16, 16, 3))
+
+    def test_concurrent_first_frames_share_one_pool(self) -> None:
+        data = _jpeg(24, 32, 10)
+        barrier = threading.Barrier(3)
+        frames = {}
+
+        def _worker(pi_id: str) -> None:
+            barrier.wait()
+            frames[pi_id] = self._decode(pi_id, data)
+
+        threads = [threading.Thread(target=_worker, args=(pid,)) for pid in ("1", "2", "3")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        pool = self.manager._frame_pool
+        self.assertEqual(sorted(frames), ["1", "2", "3"])
+        self.assertTrue(all(frame.base is pool for frame in frames.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
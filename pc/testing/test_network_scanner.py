@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import json
+import socket
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+from pc.communication import network_scanner
+
+
+class _FakeSocket:
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sent_packets = []
+
+    def setsockopt(self, *_args, **_kwargs):
+        return None
+
+    def settimeout(self, *_args, **_kwargs):
+        return None
+
+    def sendto(self, data, addr):
+        self.sent_packets.append((data, addr))
+
+    def recvfrom(self, _size):
+        if self._responses:
+            return self._responses.pop(0)
+        raise socket.timeout()
+
+    def close(self):
+        return None
+
+
+class NetworkScannerTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.config = {}
+        patchers = [
+            patch.object(network_scanner, "get_config", side_effect=lambda key, default=None: self.config.get(key, default)),
+            patch.object(network_scanner, "set_config", side_effect=self.config.__setitem__),
+            patch.object(network_scanner, "_browse_mdns", return_value=[]),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        network_scanner._DISCOVERY_SOCK = None
+        self.addCleanup(setattr, network_scanner, "_DISCOVERY_SOCK", None)
+
+    def test_scan_multi_nodes_uses_reported_ws_port(self) -> None:
+        payload = json.dumps({
+            "type": "raspberry_pi_response",
+            "ip": "192.168.10.20",
+            "ws_port": 9012,
+        }).encode("utf-8")
+        fake_socket = _FakeSocket([(payload, ("192.168.10.20", 50000))])
+
+        with patch("pc.communication.network_scanner.socket.socket", return_value=fake_socket), \
+             patch("pc.communication.network_scanner.console_info", lambda *_args, **_kwargs: None):
+            result = network_scanner.scan_multi_nodes(expected_count=1, timeout=0.01)
+
+        self.assertEqual(result, {"1": "192.168.10.20:9012"})
+        self.assertEqual([addr for _data, addr in fake_socket.sent_packets], [("<broadcast>", 50000)] * 3)
+
+    def test_scan_multi_nodes_reuses_discovery_socket(self) -> None:
+        fake_socket = _FakeSocket([])
+        with patch("pc.communication.network_scanner.socket.socket", return_value=fake_socket) as socket_factory, \
+             patch("pc.communication.network_scanner.console_info", lambda *_args, **_kwargs: None), \
+             patch("pc.communication.network_scanner._sweep_subnet", return_value={}):
+            network_scanner.scan_multi_nodes(expected_count=1, timeout=0.01)
+            network_scanner.scan_multi_nodes(expected_count=1, timeout=0.01)
+
+        socket_factory.assert_called_once()
+        self.assertEqual(len(fake_socket.sent_packets), 6)
+
+    def test_scan_multi_nodes_sweeps_subnet_when_broadcast_finds_too_few(self) -> None:
+        fake_socket = _FakeSocket([])
+        probed = []
+
+        def _fake_probe(targets, timeout=0.5, limit=0):
+            probed.extend(targets)
+            return [target for target in targets if target[0] in {"192.168.10.7", "192.168.10.30"}]
+
+        with patch("pc.communication.network_scanner.socket.socket", return_value=fake_socket), \
+             patch("pc.communication.network_scanner.console_info", lambda *_args, **_kwargs: None), \
+             patch("pc.communication.network_scanner.get_local_ip", return_value="192.168.10.2"), \
+             patch("pc.communication.network_scanner.get_network_prefix", return_value="192.168.10."), \
+             patch("pc.communication.network_scanner._live_hosts_from_arp", return_value=set()), \
+             patch("pc.communication.network_scanner._probe_ports", side_effect=_fake_probe), \
+             patch("pc.communication.network_scanner._confirm_pi_nodes", side_effect=lambda ips, _timeout: {ip: f"{ip}:8001" for ip in ips}):
+            result = network_scanner.scan_multi_nodes(expected_count=2, timeout=0.01)
+
+        self.assertEqual(result, {"1": "192.168.10.30:8001", "2": "192.168.10.7:8001"})
+        self.assertNotIn(("192.168.10.2", 8001), probed)
+
+    def test_subnet_sweep_ignores_open_ports_that_are_not_pi_nodes(self) -> None:
+        def _fake_probe(targets, timeout=0.5, limit=0):
+            return [target for target in targets if target[0] in {"192.168.10.7", "192.168.10.30"}]
+
+        with patch("pc.communication.network_scanner.socket.socket", return_value=_FakeSocket([])), \
+             patch("pc.communication.network_scanner.console_info", lambda *_args, **_kwargs: None), \
+             patch("pc.communication.network_scanner.get_local_ip", return_value="192.168.10.2"), \
+             patch("pc.communication.network_scanner.get_network_prefix", return_value="192.168.10."), \
+             patch("pc.communication.network_scanner._live_hosts_from_arp", return_value=set()), \
+             patch("pc.communication.network_scanner._probe_ports", side_effect=_fake_probe), \
+             patch("pc.communication.network_scanner._confirm_pi_nodes", return_value={"192.168.10.30": "192.168.10.30:9012"}) as confirm:
+            result = network_scanner.scan_multi_nodes(expected_count=2, timeout=0.01)
+
+        self.assertEqual(result, {"1": "192.168.10.30:9012"})
+        self.assertEqual(sorted(confirm.call_args.args[0]), ["192.168.10.30", "192.168.10.7"])
+        cached = [row["endpoint"] for row in json.loads(self.config["network.known_nodes"])]
+        self.assertEqual(cached, ["192.168.10.30:9012"])
+
+    def test_confirm_pi_nodes_requires_discovery_reply(self) -> None:
+        responder = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(responder.close)
+        responder.bind(("127.0.0.1", 0))
+        responder.settimeout(1.0)
+        reply = json.dumps({"type": "raspberry_pi_response", "ip": "127.0.0.1", "ws_port": 9012}).encode("utf-8")
+
+        def _answer() -> None:
+            data, addr = responder.recvfrom(1024)
+            if json.loads(data)["type"] == "pc_discovery":
+                responder.sendto(reply, addr)
+
+        thread = threading.Thread(target=_answer, daemon=True)
+        thread.start()
+        with patch.object(network_scanner, "_DISCOVERY_PORT", responder.getsockname()[1]):
+            confirmed = network_scanner._confirm_pi_nodes(["127.0.0.1"], timeout=1.0)
+        thread.join(1.0)
+        self.assertEqual(confirmed, {"127.0.0.1": "127.0.0.1:9012"})
+
+        silent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(silent.close)
+        silent.bind(("127.0.0.1", 0))
+        with patch.object(network_scanner, "_DISCOVERY_PORT", silent.getsockname()[1]):
+            self.assertEqual(network_scanner._confirm_pi_nodes(["127.0.0.1"], timeout=0.1), {})
+
+    def test_subnet_sweep_probes_arp_hosts_first(self) -> None:
+        batches = []
+
+        def _fake_probe(targets, timeout=0.5, limit=0):
+            batches.append([ip for ip, _port in targets])
+            return [target for target in targets if target[0] == "192.168.10.30"]
+
+        with patch("pc.communication.network_scanner.get_local_ip", return_value="192.168.10.2"), \
+             patch("pc.communication.network_scanner.get_network_prefix", return_value="192.168.10."), \
+             patch("pc.communication.network_scanner._live_hosts_from_arp", return_value={"192.168.10.1", "192.168.10.2", "192.168.10.30", "192.168.10.31"}), \
+             patch("pc.communication.network_scanner._probe_ports", side_effect=_fake_probe), \
+             patch("pc.communication.network_scanner._confirm_pi_nodes", side_effect=lambda ips, _timeout: {ip: f"{ip}:8001" for ip in ips}):
+            self.assertEqual(network_scanner._sweep_subnet(1), {"192.168.10.30": "192.168.10.30:8001"})
+
+        self.assertEqual(batches, [["192.168.10.1", "192.168.10.30", "192.168.10.31"]])
+
+    def test_scan_multi_nodes_returns_cached_nodes_without_broadcast(self) -> None:
+        now = time.time()
+        self.config["network.known_nodes"] = json.dumps([
+            {"endpoint": "192.168.10.40:8001", "ts": now - 60},
+            {"endpoint": "192.168.10.41:9012", "ts": now - 8 * 24 * 3600},
+            {"endpoint": "192.168.10.42:8001", "ts": now - 120},
+        ])
+        probed = []
+
+        def _fake_probe(targets, timeout=0.5, limit=0):
+            probed.extend(targets)
+            return [target for target in targets if target[0] == "192.168.10.42"]
+
+        with patch("pc.communication.network_scanner.socket.socket") as socket_factory, \
+             patch("pc.communication.network_scanner.console_info", lambda *_args, **_kwargs: None), \
+             patch("pc.communication.network_scanner._probe_ports", side_effect=_fake_probe):
+            result = network_scanner.scan_multi_nodes(expected_count=1, timeout=0.01)
+
+        self.assertEqual(result, {"1": "192.168.10.42:8001"})
+        self.assertEqual(sorted(probed), [("192.168.10.40", 8001), ("192.168.10.42", 8001)])
+        socket_factory.assert_not_called()
+        cached = [row["endpoint"] for row in json.loads(self.config["network.known_nodes"])]
+        self.assertEqual(cached, ["192.168.10.42:8001", "192.168.10.40:8001"])
+
+    def test_mdns_answer_ends_concurrent_broadcast_early(self) -> None:
+        class _SilentSocket(_FakeSocket):
+            def recvfrom(self, _size):
+                time.sleep(0.01)
+                raise OSError("no reply yet")
+
+        fake_socket = _SilentSocket([])
+        calls = []
+
+        def _fake_browse(limit, timeout=2.0, exclude=(), done=None):
+            calls.append((limit, set(exclude)))
+            time.sleep(0.05)
+            done.set()
+            return ["192.168.10.50:9012"]
+
+        started = time.monotonic()
+        with patch("pc.communication.network_scanner.socket.socket", return_value=fake_socket), \
+             patch("pc.communication.network_scanner.console_info", lambda *_args, **_kwargs: None), \
+             patch("pc.communication.network_scanner._browse_mdns", side_effect=_fake_browse):
+            result = network_scanner.scan_multi_nodes(expected_count=1, timeout=3.0)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(result, {"1": "192.168.10.50:9012"})
+        self.assertEqual(calls, [(1, set())])
+        self.assertEqual(len(fake_socket.sent_packets), 3)
+
+    def test_broadcast_answer_stops_mdns_browse(self) -> None:
+        payload = json.dumps({"type": "raspberry_pi_response", "ip": "192.168.10.20", "ws_port": 8001}).encode("utf-8")
+        fake_socket = _FakeSocket([(payload, ("192.168.10.20", 50000))])
+        stopped = []
+
+        def _fake_browse(limit, timeout=2.0, exclude=(), done=None):
+            stopped.append(done.wait(2.0))
+            return []
+
+        started = time.monotonic()
+        with patch("pc.communication.network_scanner.socket.socket", return_value=fake_socket), \
+             patch("pc.communication.network_scanner.console_info", lambda *_args, **_kwargs: None), \
+             patch("pc.communication.network_scanner._browse_mdns", side_effect=_fake_browse):
+            result = network_scanner.scan_multi_nodes(expected_count=1, timeout=3.0)
+
+        self.assertLess(time.monotonic() - started, 1.0)
+        self.assertEqual(result, {"1": "192.168.10.20:8001"})
+        self.assertEqual(stopped, [True])
+
+    def test_probe_ports_reports_only_listening_ports(self) -> None:
+        listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.addCleanup(listener.close)
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        closed = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        closed.bind(("127.0.0.1", 0))
+        closed_port = closed.getsockname()[1]
+        closed.close()
+
+        opened = network_scanner._probe_ports([listener.getsockname(), ("127.0.0.1", closed_port)], timeout=1.0)
+
+        self.assertEqual(opened, [listener.getsockname()])
+
+    def test_known_nodes_cache_keeps_eight_most_recent(self) -> None:
+        for index in range(10):
+            network_scanner._remember_nodes([f"192.168.10.{index}:8001"])
+        cached = network_scanner._load_known_nodes()
+        self.assertEqual(len(cached), 8)
+        self.assertEqual(cached[0], "192.168.10.9:8001")
+        self.assertNotIn("192.168.10.1:8001", cached)
+
+    def test_receive_datagrams_drains_queued_responses_on_real_socket(self) -> None:
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(receiver.close)
+        self.addCleanup(sender.close)
+        receiver.bind(("127.0.0.1", 0))
+        for index in range(3):
+            sender.sendto(f"pi-{index}".encode("utf-8"), receiver.getsockname())
+
+        received = [data for data, _addr in network_scanner._receive_datagrams(receiver, 0.2)]
+
+        self.assertEqual(received, [b"pi-0", b"pi-1", b"pi-2"])
+
+    def test_read_ready_datagrams_stops_on_persistent_socket_error(self) -> None:
+        class _BrokenSocket:
+            family = None
+
+            def __init__(self) -> None:
+                self.calls = 0
+
+            def recvfrom(self, _size):
+                self.calls += 1
+                if self.calls == 1:
+                    return b"pi-0", ("192.168.10.5", 50000)
+                raise OSError(9, "Bad file descriptor")
+
+        broken = _BrokenSocket()
+        self.assertEqual(network_scanner._read_ready_datagrams(broken), [(b"pi-0", ("192.168.10.5", 50000))])
+        self.assertEqual(broken.calls, 2)
+
+    @unittest.skipUnless(network_scanner._recvmmsg is not None, "recvmmsg 仅在 Linux 可用")
+    def test_recvmmsg_batch_returns_payloads_and_addresses(self) -> None:
+        receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sender = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.addCleanup(receiver.close)
+        self.addCleanup(sender.close)
+        receiver.bind(("127.0.0.1", 0))
+        sender.bind(("127.0.0.1", 0))
+        for index in range(3):
+            sender.sendto(f"pi-{index}".encode("utf-8"), receiver.getsockname())
+        time.sleep(0.05)
+
+        batch = network_scanner._recvmmsg_batch(receiver, n=2)
+
+        self.assertEqual(batch, [(b"pi-0", sender.getsockname()), (b"pi-1", sender.getsockname())])
+        self.assertEqual(network_scanner._read_ready_datagrams(receiver), [(b"pi-2", sender.getsockname())])
+        self.assertEqual(network_scanner._recvmmsg_batch(receiver), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
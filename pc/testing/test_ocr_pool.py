@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import types
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from pc.core import ocr_pool
+from pc.experts.equipment_ocr_expert import EquipmentOCRExpert
+from pc.experts.safety.chem_safety_expert import ChemSafetyExpert
+
+
+class _FakeReader:
+    created: list = []
+
+    def __init__(self, langs, gpu=False) -> None:
+        self.langs = langs
+        self.gpu = gpu
+        self.frames = []
+        _FakeReader.created.append(self)
+
+    def readtext(self, frame, detail=1):
+        self.frames.append(frame)
+        if detail == 0:
+            return ["H2SO4"]
+        return [([0, 0], "12.5 MPa", 0.9)]
+
+
+class OcrReaderPoolTests(unittest.TestCase):
+    def setUp(self) -> None:
+        _FakeReader.created = []
+        ocr_pool.release_readers()
+        self.addCleanup(ocr_pool.release_readers)
+        fake_easyocr = types.SimpleNamespace(Reader=_FakeReader)
+        real_import = ocr_pool.importlib.import_module
+        patcher = patch.object(
+            ocr_pool.importlib,
+            "import_module",
+            side_effect=lambda name: fake_easyocr if name == "easyocr" else real_import(name),
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_experts_share_one_lazily_built_reader(self) -> None:
+        equipment = EquipmentOCRExpert()
+        chem = ChemSafetyExpert()
+        self.assertEqual(_FakeReader.created, [])
+
+        frame = np.zeros((8, 8, 3), dtype=np.uint8)
+        with patch.object(ocr_pool, "_cuda_available", return_value=False), \
+             patch("pc.core.logger.console_info"):
+            self.assertIn("12.5 MPa", equipment.analyze(frame, {}))
+            self.assertIn("12.5 MPa", equipment.analyze(frame, {}))
+            self.assertIn("硫酸", chem.analyze(frame, {"detected_classes": "bottle,gloves"}))
+
+        self.assertEqual(len(_FakeReader.created), 1)
+        self.assertEqual(_FakeReader.created[0].langs, ["ch_sim", "en"])
+        self.assertTrue(all(item.ndim == 2 for item in _FakeReader.created[0].frames))
+
+    def test_unloading_one_expert_keeps_reader_for_other_users(self) -> None:
+        equipment = EquipmentOCRExpert()
+        chem = ChemSafetyExpert()
+        frame = np.zeros((8, 8, 3), dtype=np.uint8)
+        with patch.object(ocr_pool, "_cuda_available", return_value=False), \
+             patch("pc.core.logger.console_info"):
+            equipment.analyze(frame, {})
+            chem.analyze(frame, {"detected_classes": "bottle,gloves"})
+            equipment._lazy_unload()
+            self.assertEqual(len(ocr_pool._READERS), 1)
+            self.assertIn("硫酸", chem.analyze(frame, {"detected_classes": "bottle,gloves"}))
+            self.assertIn("12.5 MPa", equipment.analyze(frame, {}))
+            self.assertEqual(len(_FakeReader.created), 1)
+
+            ocr_pool.release_reader(chem._reader)
+            equipment._lazy_unload()
+        self.assertEqual(ocr_pool._READERS, {})
+        self.assertEqual(ocr_pool._READER_USERS, {})
+
+    def test_prepare_ocr_frame_downscales_and_converts_to_gray(self) -> None:
+        prepared = ocr_pool.prepare_ocr_frame(np.zeros((2160, 3840, 3), dtype=np.uint8))
+        self.assertEqual(prepared.shape, (540, 960))
+        self.assertEqual(prepared.dtype, np.uint8)
+        self.assertTrue(prepared.flags["C_CONTIGUOUS"])
+
+        small = ocr_pool.prepare_ocr_frame(np.zeros((120, 80, 4), dtype=np.uint8))
+        self.assertEqual(small.shape, (120, 80))
+
+    def test_chem_hazard_order_and_overlapping_keywords(self) -> None:
+        chem = ChemSafetyExpert()
+        frame = np.zeros((8, 8, 3), dtype=np.uint8)
+        with patch.object(chem, "_extract_fragments", return_value=["METHANOL 99%", "HF 40%"]):
+            self.assertIn("HF", chem.analyze(frame, {"detected_classes": "bottle"}))
+            self.assertIn("氢氟酸", chem.analyze(frame, {"detected_classes": "bottle,gloves"}))
+        with patch.object(chem, "_extract_fragments", return_value=["XMETHANOLX"]):
+            self.assertIn("甲醇", chem.analyze(frame, {"detected_classes": "bottle,gloves"}))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,13 @@
+import base64
 import unittest
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
-from pc.core.ai_backend import configured_model_catalog, ollama_runtime_env
+import cv2
+import numpy as np
+import requests
+
+from pc.core import ai_backend
+from pc.core.ai_backend import _encode_frame, configured_model_catalog, ollama_runtime_env
 from pc.core.runtime_assets import DEFAULT_OLLAMA_MODELS, ollama_asset_root
 
 
@@ -30,6 +36,57 @@ class OllamaModelCatalogTests(unittest.TestCase):
         env = ollama_runtime_env()
         self.assertEqual(env["OLLAMA_MODELS"], str(ollama_asset_root()))
 
+    def test_encode_frame_downscales_large_frames_before_upload(self) -> None:
+        frame = np.zeros((1080, 1920, 3), dtype=np.uint8)
+        encoded = base64.b64decode(_encode_frame(frame))
+        decoded = cv2.imdecode(np.frombuffer(encoded, np.uint8), cv2.IMREAD_COLOR)
+        self.assertEqual(decoded.shape, (720, 1280, 3))
+
+        small = np.zeros((480, 640, 3), dtype=np.uint8)
+        decoded = cv2.imdecode(np.frombuffer(base64.b64decode(_encode_frame(small)), np.uint8), cv2.IMREAD_COLOR)
+        self.assertEqual(decoded.shape, (480, 640, 3))
+
+    def test_list_ollama_models_reuses_result_within_ttl(self) -> None:
+        response = Mock()
+        response.json.return_value = {"models": [{"name": "qwen3.5:4b"}]}
+        session = Mock()
+        session.get.return_value = response
+        self.addCleanup(ai_backend.invalidate_ollama_models_cache)
+        ai_backend.invalidate_ollama_models_cache()
+        with patch("pc.core.ai_backend._ollama_session", return_value=session), \
+             patch("pc.core.ai_backend.run_hidden") as run_hidden:
+            self.assertEqual(ai_backend.list_ollama_models(), ["qwen3.5:4b"])
+            self.assertEqual(ai_backend.list_ollama_models(), ["qwen3.5:4b"])
+            self.assertEqual(session.get.call_count, 1)
+
+            ai_backend.invalidate_ollama_models_cache()
+            ai_backend.list_ollama_models()
+            self.assertEqual(session.get.call_count, 2)
+        run_hidden.assert_not_called()
+
+    def test_list_ollama_models_falls_back_to_cli_when_daemon_unreachable(self) -> None:
+        session = Mock()
+        session.get.side_effect = requests.ConnectionError("refused")
+        result = Mock(returncode=0, stdout="NAME ID SIZE\nphi4:14b abc 9GB\n")
+        self.addCleanup(ai_backend.invalidate_ollama_models_cache)
+        ai_backend.invalidate_ollama_models_cache()
+        with patch("pc.core.ai_backend._ollama_session", return_value=session), \
+             patch("pc.core.ai_backend.run_hidden", return_value=result) as run_hidden:
+            self.assertEqual(ai_backend.list_ollama_models(), ["phi4:14b"])
+        run_hidden.assert_called_once()
+
+    def test_ollama_generate_falls_back_to_thinking_answer(self) -> None:
+        response = Mock()
+        response.json.return_value = {"response": "", "thinking": "分析画面……\n最终答案：试剂瓶未盖好。"}
+        session = Mock()
+        session.post.return_value = response
+        with patch("pc.core.ai_backend._ollama_session", return_value=session), \
+             patch("pc.core.ai_backend.ensure_ollama_model_available", return_value=True):
+            result = ai_backend._ollama_generate("描述画面", "gemma3:4b")
+
+        self.assertIn("试剂瓶未盖好", result)
+        self.assertFalse(session.post.call_args.kwargs["json"]["stream"])
+
 
 if __name__ == "__main__":
     unittest.main()
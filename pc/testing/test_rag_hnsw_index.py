@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import sys
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from pc.knowledge_base import rag_engine
+
+
+class _FakeIndexFlat:
+    def __init__(self, vectors, metric_type=1) -> None:
+        self.vectors = np.asarray(vectors, dtype=np.float32)
+        self.d = self.vectors.shape[1]
+        self.metric_type = metric_type
+
+    @property
+    def ntotal(self) -> int:
+        return len(self.vectors)
+
+    def reconstruct_n(self, start, count):
+        return self.vectors[start:start + count]
+
+
+class _FakeIndexHNSWFlat:
+    def __init__(self, d, m, metric_type) -> None:
+        self.d = d
+        self.m = m
+        self.metric_type = metric_type
+        self.hnsw = SimpleNamespace(efConstruction=40, efSearch=16)
+        self.vectors = np.zeros((0, d), dtype=np.float32)
+
+    def add(self, vectors) -> None:
+        self.vectors = np.vstack((self.vectors, vectors))
+
+
+_FAKE_FAISS = SimpleNamespace(IndexFlat=_FakeIndexFlat, IndexHNSWFlat=_FakeIndexHNSWFlat)
+
+
+class RagHnswIndexTests(unittest.TestCase):
+    def test_large_flat_index_is_rebuilt_as_hnsw_in_order(self) -> None:
+        vectors = np.random.default_rng(0).random((rag_engine._HNSW_MIN_VECTORS, 8), dtype=np.float32)
+        vector_db = SimpleNamespace(index=_FakeIndexFlat(vectors, metric_type=0))
+        with patch.dict(sys.modules, {"faiss": _FAKE_FAISS}):
+            self.assertTrue(rag_engine._upgrade_to_hnsw(vector_db))
+            self.assertFalse(rag_engine._upgrade_to_hnsw(vector_db))
+
+        index = vector_db.index
+        self.assertIsInstance(index, _FakeIndexHNSWFlat)
+        self.assertEqual((index.d, index.m, index.metric_type), (8, rag_engine._HNSW_M, 0))
+        self.assertEqual(index.hnsw.efSearch, rag_engine._HNSW_EF_SEARCH)
+        np.testing.assert_array_equal(index.vectors, vectors)
+
+    def test_small_index_or_missing_faiss_keeps_flat_index(self) -> None:
+        small = SimpleNamespace(index=_FakeIndexFlat(np.zeros((3, 4))))
+        with patch.dict(sys.modules, {"faiss": _FAKE_FAISS}):
+            self.assertFalse(rag_engine._upgrade_to_hnsw(small))
+        large = SimpleNamespace(index=_FakeIndexFlat(np.zeros((rag_engine._HNSW_MIN_VECTORS, 4))))
+        with patch.dict(sys.modules, {"faiss": None}):
+            self.assertFalse(rag_engine._upgrade_to_hnsw(large))
+        self.assertIsInstance(small.index, _FakeIndexFlat)
+        self.assertIsInstance(large.index, _FakeIndexFlat)
+        self.assertFalse(rag_engine._upgrade_to_hnsw(SimpleNamespace()))
+
+
+if __name__ == "__main__":
+    unittest.main()
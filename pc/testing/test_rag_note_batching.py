@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pc.knowledge_base import rag_engine
+from pc.knowledge_base.rag_engine import ScopedRAGEngine
+from pc.knowledge_base.semantic_cache import SemanticQueryCache
+
+
+class _FakeVectorDb:
+    def __init__(self) -> None:
+        self.added = []
+        self.saves = 0
+
+    def add_documents(self, splits) -> None:
+        self.added.extend(splits)
+
+    def save_local(self, path) -> None:
+        self.saves += 1
+
+
+_COMPONENTS = (
+    None,
+    lambda page_content, metadata: page_content,
+    None,
+    lambda **kwargs: SimpleNamespace(split_documents=lambda docs: docs),
+)
+
+
+class RagNoteBatchingTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._temp = tempfile.TemporaryDirectory(prefix="neurolab_notes_")
+        self.engine = ScopedRAGEngine.__new__(ScopedRAGEngine)
+        self.engine.scope_name = "common"
+        self.engine.docs_dir = Path(self._temp.name)
+        self.engine.db_path = Path(self._temp.name) / "faiss_index"
+        self.engine.vector_db = _FakeVectorDb()
+        self.engine._query_cache = SemanticQueryCache()
+        patcher = patch.object(ScopedRAGEngine, "_load_vector_components", return_value=_COMPONENTS)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self) -> None:
+        self.engine._cancel_pending_flush()
+        self._temp.cleanup()
+
+    def test_notes_are_saved_once_per_batch(self) -> None:
+        with patch.object(rag_engine, "_NOTE_FLUSH_BATCH", 3), patch("time.strftime", side_effect=["1", "2", "3", "4"]):
+            for index in range(4):
+                self.assertTrue(self.engine.save_and_ingest_note(f"笔记{index}"))
+
+        db = self.engine.vector_db
+        self.assertEqual(len(db.added), 4)
+        self.assertEqual(db.saves, 1)
+        self.assertIsNotNone(self.engine._flush_timer)
+
+        self.engine.flush_index()
+        self.assertEqual(db.saves, 2)
+        self.assertIsNone(self.engine._flush_timer)
+        self.engine.flush_index()
+        self.assertEqual(db.saves, 2)
+
+    def test_file_imports_still_persist_immediately(self) -> None:
+        path = self.engine.docs_dir / "rules.txt"
+        path.write_text("通风橱规范", encoding="utf-8")
+        self.assertTrue(self.engine.ingest_knowledge_file(str(path)))
+        self.assertEqual(self.engine.vector_db.saves, 1)
+        self.assertEqual(self.engine._pending_notes, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
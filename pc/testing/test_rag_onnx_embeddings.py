@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import numpy as np
+
+from pc.knowledge_base import onnx_embeddings
+from pc.knowledge_base.onnx_embeddings import OnnxInt8Embeddings
+
+
+class _FakeTokenizer:
+    def __call__(self, texts, **kwargs):
+        lengths = [len(text) for text in texts]
+        width = max(lengths)
+        mask = np.array([[1] * n + [0] * (width - n) for n in lengths], dtype=np.int64)
+        ids = np.array([[ord(ch) for ch in text] + [0] * (width - len(text)) for text in texts], dtype=np.int64)
+        return {"input_ids": ids, "attention_mask": mask}
+
+
+class _FakeModel:
+    def __init__(self) -> None:
+        self.batches = []
+
+    def __call__(self, input_ids, attention_mask):
+        self.batches.append(len(input_ids))
+        hidden = np.stack((input_ids, input_ids * 2), axis=-1).astype(np.float32)
+        return SimpleNamespace(last_hidden_state=hidden)
+
+
+class OnnxEmbeddingsTests(unittest.TestCase):
+    def test_mean_pooling_ignores_padding_and_batches_documents(self) -> None:
+        model = _FakeModel()
+        embeddings = OnnxInt8Embeddings(model, _FakeTokenizer(), batch_size=2)
+
+        vectors = embeddings.embed_documents(["ab", "a", "b"])
+        a, b = float(ord("a")), float(ord("b"))
+        np.testing.assert_allclose(vectors[0], [(a + b) / 2, a + b])
+        np.testing.assert_allclose(vectors[1], [a, 2 * a])
+        np.testing.assert_allclose(embeddings.embed_query("b"), [b, 2 * b])
+        self.assertEqual(model.batches, [2, 1, 1])
+
+    def test_missing_optimum_falls_back(self) -> None:
+        with tempfile.TemporaryDirectory() as temp_dir, \
+             patch.object(onnx_embeddings, "Embeddings", dict), \
+             patch.dict(sys.modules, {"optimum": None, "optimum.onnxruntime": None}):
+            self.assertIsNone(onnx_embeddings.load_int8_embeddings("model", Path(temp_dir)))
+
+
+if __name__ == "__main__":
+    unittest.main()
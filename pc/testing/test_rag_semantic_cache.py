@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from pc.knowledge_base.rag_engine import ScopedRAGEngine
+from pc.knowledge_base.semantic_cache import SemanticQueryCache
+
+
+class _FakeEmbeddings:
+    VECTORS = {
+        "违规在实验台使用手机": [1.0, 0.0, 0.0],
+        "违规在实验台使用手机！": [0.99, 0.05, 0.0],
+        "未佩戴护目镜": [0.0, 1.0, 0.0],
+    }
+
+    def __init__(self) -> None:
+        self.calls = []
+
+    def embed_query(self, text: str):
+        self.calls.append(text)
+        return self.VECTORS[text]
+
+
+class _FakeVectorDb:
+    def __init__(self) -> None:
+        self.searches = 0
+
+    def similarity_search_by_vector(self, vector, k=3):
+        self.searches += 1
+        return [SimpleNamespace(page_content=f"命中{self.searches}", metadata={"source": "rules.md"})]
+
+    def add_documents(self, splits) -> None:
+        return None
+
+    def save_local(self, path) -> None:
+        return None
+
+
+class RagSemanticCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        ScopedRAGEngine._query_vectors.clear()
+
+    def _engine(self) -> ScopedRAGEngine:
+        engine = ScopedRAGEngine.__new__(ScopedRAGEngine)
+        engine.scope_name = "common"
+        engine.db_path = "unused"
+        engine.vector_db = _FakeVectorDb()
+        engine._query_cache = SemanticQueryCache()
+        return engine
+
+    def test_near_duplicate_queries_reuse_vector_results(self) -> None:
+        engine = self._engine()
+        embeddings = _FakeEmbeddings()
+        with patch.object(ScopedRAGEngine, "_get_embeddings", return_value=embeddings):
+            first = engine.retrieve_context("违规在实验台使用手机")
+            second = engine.retrieve_context("违规在实验台使用手机！")
+            hits = engine.similarity_search("违规在实验台使用手机", top_k=3)
+            other = engine.retrieve_context("未佩戴护目镜")
+            engine.retrieve_context("违规在实验台使用手机", top_k=1)
+
+        self.assertEqual(first, second)
+        self.assertEqual(hits[0]["content"], first)
+        self.assertNotEqual(other, first)
+        self.assertEqual(engine.vector_db.searches, 3)
+
+    def test_index_writes_invalidate_cache(self) -> None:
+        engine = self._engine()
+        components = (None, lambda page_content, metadata: page_content, None, lambda **kwargs: SimpleNamespace(split_documents=lambda docs: docs))
+        with patch.object(ScopedRAGEngine, "_get_embeddings", return_value=_FakeEmbeddings()), \
+             patch.object(ScopedRAGEngine, "_load_vector_components", return_value=components):
+            engine.retrieve_context("未佩戴护目镜")
+            self.assertEqual(len(engine._query_cache), 1)
+            self.assertTrue(engine._split_and_store_text("新增护目镜规范", source="note.txt"))
+            self.assertEqual(len(engine._query_cache), 0)
+            engine.retrieve_context("未佩戴护目镜")
+        self.assertEqual(engine.vector_db.searches, 2)
+
+    def test_repeated_queries_embed_once(self) -> None:
+        engine = self._engine()
+        embeddings = _FakeEmbeddings()
+        with patch.object(ScopedRAGEngine, "_get_embeddings", return_value=embeddings):
+            for _ in range(3):
+                engine.retrieve_context("未佩戴护目镜")
+            engine.similarity_search("未佩戴护目镜", top_k=1)
+        self.assertEqual(embeddings.calls, ["未佩戴护目镜"])
+        self.assertEqual(engine.vector_db.searches, 2)
+
+        docs = engine.query_by_vector([0.0, 1.0, 0.0], top_k=3)
+        self.assertEqual(docs[0].page_content, "命中1")
+        engine.vector_db = None
+        self.assertEqual(engine.query_by_vector([0.0, 1.0, 0.0]), [])
+
+    def test_cache_evicts_oldest_entry_at_capacity(self) -> None:
+        cache = SemanticQueryCache(capacity=2)
+        cache.store([1.0, 0.0], 3, "a")
+        cache.store([0.0, 1.0], 3, "b")
+        cache.store([0.7, 0.7], 3, "c")
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.lookup([1.0, 0.0], 3))
+        self.assertEqual(cache.lookup([0.0, 2.0], 3), "b")
+        self.assertIsNone(cache.lookup([0.0, 1.0, 0.0], 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
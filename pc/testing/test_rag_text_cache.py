@@ -0,0 +1,32 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+from pc.knowledge_base.rag_engine import ScopedRAGEngine
+
+
+class RagTextCacheTests(unittest.TestCase):
+    def test_documents_are_reparsed_only_after_they_change(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_kb_cache_") as temp_dir:
+            doc = Path(temp_dir) / "chem.csv"
+            doc.write_text("name,value\nHF,氢氟酸\n", encoding="utf-8")
+            engine = ScopedRAGEngine.__new__(ScopedRAGEngine)
+            with patch.dict(ScopedRAGEngine._text_cache, clear=True), \
+                 patch.object(ScopedRAGEngine, "_parse_text_content", wraps=ScopedRAGEngine._parse_text_content) as parse:
+                first = engine._read_text_content(str(doc))
+                second = engine._read_text_content(str(doc))
+                self.assertEqual(parse.call_count, 1)
+                self.assertEqual(first, second)
+
+                doc.write_text("name,value\nHF,氢氟酸\nHNO3,硝酸\n", encoding="utf-8")
+                os.utime(doc, ns=(0, 10 ** 9))
+                self.assertIn("HNO3", engine._read_text_content(str(doc)))
+                self.assertEqual(parse.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import tempfile
+import threading
 import unittest
 from unittest.mock import patch
 
@@ -13,6 +15,15 @@ class RemoteVoiceRoutingTests(unittest.TestCase):
         voice_module._remote_text_router = None
         voice_module._pending_local_command_handler = None
 
+    def test_remote_router_skips_audio_library_imports(self) -> None:
+        with patch.object(voice_module, "_import_speech_recognition") as import_sr, \
+             patch.object(voice_module, "_import_model_libraries") as import_models:
+            agent = get_remote_text_router()
+
+        self.assertIsNone(agent.recognizer)
+        import_sr.assert_not_called()
+        import_models.assert_not_called()
+
     def test_remote_command_does_not_trigger_local_gui_handler(self) -> None:
         agent = VoiceInteraction(initialize_audio_models=False)
         calls = []
@@ -89,6 +100,50 @@ class RemoteVoiceRoutingTests(unittest.TestCase):
         self.assertEqual(reply, "系统自检已发起")
         self.assertEqual(calls, [("介绍当前系统状态", "run_self_check")])
 
+    def test_manager_routes_node_commands_through_one_worker_thread(self) -> None:
+        from pc.communication.multi_ws_manager import MultiPiManager
+
+        handled = []
+        done = threading.Event()
+
+        class _FakeAgent:
+            def process_remote_command(self, node_id, command, reply_callback=None):
+                handled.append((node_id, command, threading.current_thread().name))
+                reply_callback(f"回复:{command}")
+                if len(handled) == 2:
+                    done.set()
+
+        manager = MultiPiManager({"1": "127.0.0.1", "2": "127.0.0.2"}, log_info=lambda _msg: None)
+        audit_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(audit_dir.cleanup)
+        manager.audit_log_dir = audit_dir.name
+        try:
+            with patch("pc.voice.voice_interaction.get_remote_text_router", return_value=_FakeAgent()):
+                manager._handle_remote_voice("1", "PI_VOICE_COMMAND:现在几点")
+                manager._handle_remote_voice("2", "PI_VOICE_COMMAND:介绍系统")
+                self.assertTrue(done.wait(5))
+        finally:
+            manager.stop()
+
+        self.assertEqual([item[:2] for item in handled], [("1", "现在几点"), ("2", "介绍系统")])
+        self.assertEqual({item[2] for item in handled}, {"RemoteVoiceWorker"})
+        self.assertEqual(list(manager._send_pending["1"]), ["CMD:TTS:回复:现在几点"])
+        self.assertEqual(manager.node_latest_results["2"]["text"], "回复:介绍系统")
+
+    def test_manager_with_voice_disabled_replies_without_router(self) -> None:
+        from pc.communication.multi_ws_manager import MultiPiManager
+
+        manager = MultiPiManager({"1": "127.0.0.1"}, log_info=lambda _msg: None, enable_voice=False)
+        try:
+            with patch("pc.voice.voice_interaction.get_remote_text_router") as router:
+                manager._handle_remote_voice("1", "PI_VOICE_COMMAND:现在几点")
+        finally:
+            manager.stop()
+
+        router.assert_not_called()
+        self.assertIsNone(manager._voice_thread)
+        self.assertEqual(list(manager._send_pending["1"]), ["CMD:TTS:PC 端语音助手未启用。"])
+
 
 if __name__ == '__main__':
     unittest.main()
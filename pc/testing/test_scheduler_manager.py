@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime
+from unittest.mock import patch
+
+from pc.core import scheduler_manager as scheduler_module
+from pc.core.scheduler_manager import SchedulerManager, _secs_until
+
+
+class SchedulerManagerTests(unittest.TestCase):
+    def test_secs_until_rolls_over_to_next_day(self) -> None:
+        now = datetime(2026, 3, 1, 8, 0, 0)
+        self.assertEqual(_secs_until(8, 30, now), 1800.0)
+        self.assertEqual(_secs_until(8, 0, now), 86400.0)
+        self.assertEqual(_secs_until(7, 0, now), 23 * 3600.0)
+
+    def test_routine_rearms_until_stopped(self) -> None:
+        manager = SchedulerManager()
+        self.addCleanup(manager.stop)
+        with patch.object(scheduler_module, "console_info"), \
+             patch.object(scheduler_module, "speak_async") as speak:
+            manager.start()
+            manager.start()
+            first = dict(manager._timers)
+            self.assertEqual(set(first), {"morning", "evening"})
+            self.assertTrue(all(timer.daemon for timer in first.values()))
+
+            manager._run_and_rearm("morning", 8, 30)
+            self.assertEqual(speak.call_count, 1)
+            self.assertIsNot(manager._timers["morning"], first["morning"])
+
+            manager.stop()
+            manager._run_and_rearm("evening", 17, 30)
+            self.assertEqual(manager._timers, {})
+            self.assertEqual(speak.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+import unittest
+from unittest.mock import patch
+
+from pc.core import tts
+
+
+class _BlockingSpeaker:
+    def __init__(self) -> None:
+        self.release = threading.Event()
+        self.spoken: list[tuple[str, str]] = []
+        self._pending = ""
+
+    def say(self, message: str) -> None:
+        self._pending = message
+
+    def runAndWait(self) -> None:
+        self.release.wait(5)
+        self.spoken.append((self._pending, threading.current_thread().name))
+
+
+class TTSQueueTests(unittest.TestCase):
+    def _manager(self, speaker: _BlockingSpeaker) -> tts.TTSManager:
+        def _fake_init(manager: tts.TTSManager) -> None:
+            manager.speaker = speaker
+            manager.backend_name = "pyttsx3"
+
+        with patch.object(tts.TTSManager, "_init_tts", _fake_init):
+            return tts.TTSManager()
+
+    def test_single_worker_speaks_in_order_and_drops_overflow(self) -> None:
+        speaker = _BlockingSpeaker()
+        manager = self._manager(speaker)
+        with patch.object(tts, "console_info"), patch.object(tts, "console_error") as console_error:
+            for index in range(12):
+                manager.speak_async(f"播报{index}")
+                manager.speak_async(f"播报{index}")
+            speaker.release.set()
+            manager._queue.join()
+
+        spoken = [text for text, _ in speaker.spoken]
+        self.assertEqual(spoken[:2], ["播报0", "播报1"])
+        self.assertEqual(spoken, sorted(spoken, key=lambda text: int(text[2:])))
+        self.assertLess(len(spoken), 12)
+        self.assertTrue(console_error.called)
+        self.assertEqual({name for _, name in speaker.spoken}, {"TTSPlayback"})
+
+    def test_identical_text_is_dropped_within_window(self) -> None:
+        speaker = _BlockingSpeaker()
+        speaker.release.set()
+        manager = self._manager(speaker)
+        with patch.object(tts, "console_info"):
+            manager.speak_async("我在")
+            manager.speak_async("我在")
+            manager.speak_async("抱歉，我没有听清楚")
+            manager.speak_async("抱歉，我没有听清楚")
+            manager._last_time -= manager.DEDUP_WINDOW_SECONDS
+            manager.speak_async("抱歉，我没有听清楚")
+            manager._queue.join()
+
+        self.assertEqual([text for text, _ in speaker.spoken], ["我在", "抱歉，我没有听清楚", "抱歉，我没有听清楚"])
+
+    def test_module_level_manager_is_created_on_first_speech(self) -> None:
+        speaker = _BlockingSpeaker()
+        speaker.release.set()
+        manager = self._manager(speaker)
+        created = []
+
+        def _factory() -> tts.TTSManager:
+            created.append(manager)
+            return manager
+
+        with patch.object(tts, "_tts_manager", None), patch.object(tts, "TTSManager", side_effect=_factory), \
+             patch.object(tts, "console_info"):
+            tts.stop_tts()
+            self.assertEqual(created, [])
+            tts.speak_async("请佩戴护目镜")
+            tts.speak_async("请佩戴手套")
+            created[0]._queue.join()
+
+        self.assertEqual(len(created), 1)
+        self.assertEqual([text for text, _ in speaker.spoken], ["请佩戴护目镜", "请佩戴手套"])
+
+
+if __name__ == "__main__":
+    unittest.main()
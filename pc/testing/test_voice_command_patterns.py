@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import unittest
+from unittest.mock import patch
+
+from pc.voice import voice_interaction
+from pc.voice.voice_interaction import VoiceInteraction
+
+
+class VoiceCommandPatternTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.voice = VoiceInteraction.__new__(VoiceInteraction)
+
+    def test_normalize_strips_whitespace_and_punctuation(self) -> None:
+        self.assertEqual(VoiceInteraction._normalize_text("  Hello， 小爱-同学！\t"), "hello小爱同学")
+        self.assertEqual(VoiceInteraction._normalize_text(None), "")
+
+    def test_command_keywords_match_through_punctuation(self) -> None:
+        self.assertTrue(self.voice._is_stop_playback_command("好了，别说了。"))
+        self.assertTrue(self.voice._is_stop_session_command("退出 对话"))
+        self.assertTrue(self.voice._is_stop_session_command("结束、本轮"))
+        self.assertTrue(self.voice._is_note_command("帮我 记录 一下：离心机转速"))
+        self.assertFalse(self.voice._is_stop_session_command("切换到显微镜模式"))
+        self.assertFalse(self.voice._is_note_command("停止播报"))
+
+    def test_speech_is_truncated_by_utf8_bytes_at_sentence_end(self) -> None:
+        text = "离心机运行前请确认转子配平。" + "盖好安全盖并等待转速稳定后再离开" * 3
+        spoken = voice_interaction._truncate_speech(text, 60)
+        self.assertEqual(spoken, "离心机运行前请确认转子配平。")
+
+        cut = voice_interaction._truncate_speech("甲" * 40, 50)
+        self.assertEqual(cut, "甲" * 16)
+        self.assertLessEqual(len(cut.encode("utf-8")), 50)
+        self.assertEqual(voice_interaction._truncate_speech("短句。", 60), "短句。")
+
+    def test_only_spoken_copy_is_truncated(self) -> None:
+        self.voice.config = type("Config", (), {"max_speech_bytes": 18})()
+        spoken = []
+        self.voice._mark_speaking = lambda text: None
+        with patch.object(voice_interaction, "speak_async", side_effect=spoken.append):
+            self.voice._deliver_response("第一句。第二句很长很长很长很长", speak_response=True, reply_callback=None)
+        self.assertEqual(spoken, ["第一句。"])
+
+        replies = []
+        self.voice._deliver_response("第一句。第二句很长很长很长很长", speak_response=True, reply_callback=replies.append)
+        self.assertEqual(replies, ["第一句。第二句很长很长很长很长"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import types
+import unittest
+from unittest.mock import patch
+
+import numpy as np
+
+from pc.core import vad
+from pc.core.vad import EnergyGate, frame_rms
+from pc.voice import voice_interaction
+from pc.voice.voice_interaction import VoiceInteraction
+
+
+def _tone(amplitude: float, count: int = 1600) -> np.ndarray:
+    phase = np.linspace(0, 40 * np.pi, count, endpoint=False)
+    return (np.sin(phase) * amplitude).astype(np.int16)
+
+
+class EnergyGateTests(unittest.TestCase):
+    def test_frame_rms_splits_into_20ms_frames(self) -> None:
+        samples = np.concatenate((np.full(320, 100, dtype=np.int16), np.full(320, -300, dtype=np.int16), np.full(10, 9000, dtype=np.int16)))
+        np.testing.assert_allclose(frame_rms(samples), [100.0, 300.0])
+        np.testing.assert_allclose(frame_rms(np.array([100, -100, 100, -100], dtype=np.int16)), [100.0])
+        self.assertEqual(frame_rms(np.zeros(0, dtype=np.int16)).size, 0)
+
+    def test_single_pass_kernel_matches_numpy_path(self) -> None:
+        samples = (np.random.default_rng(7).standard_normal(4000) * 2000).astype(np.int16)
+        loop_rms = np.sqrt(vad._frame_energy_loop(samples, vad.FRAME_SAMPLES))
+        with patch.object(vad, "_frame_energy_kernel", None):
+            rms = frame_rms(samples)
+        np.testing.assert_allclose(loop_rms, rms, rtol=1e-5)
+
+    def test_unseeded_gate_lets_everything_through(self) -> None:
+        gate = EnergyGate()
+        self.assertTrue(gate.is_speech(np.zeros(1600, dtype=np.int16)))
+        self.assertIsNone(gate.floor_rms)
+
+    def test_silence_is_gated_and_floor_follows_noise(self) -> None:
+        gate = EnergyGate(ratio=2.0)
+        gate.seed_rms(100.0)
+        self.assertFalse(gate.is_speech(_tone(40)))
+        self.assertLess(gate.floor_rms, 100.0)
+        self.assertTrue(gate.is_speech(_tone(3000)))
+
+        floor = gate.floor_rms
+        self.assertTrue(gate.is_speech(_tone(3000)))
+        self.assertEqual(gate.floor_rms, floor)
+
+    def test_short_wake_word_inside_long_quiet_clip_passes(self) -> None:
+        gate = EnergyGate(ratio=2.0)
+        gate.seed_rms(100.0)
+        quiet = _tone(40, 16000 * 3)
+        clip = quiet.copy()
+        clip[16000:16000 + 3200] = _tone(1000, 3200)
+        # 整段 RMS 低于 200 的阈值，逐帧判断仍能识别出 200 ms 的语音。
+        self.assertLess(float(np.sqrt(np.mean(clip.astype(np.float64) ** 2))), 200.0)
+        self.assertTrue(gate.is_speech(clip))
+        self.assertEqual(gate.floor_rms, 100.0)
+
+    def test_rejected_clip_with_loud_frames_does_not_raise_floor(self) -> None:
+        gate = EnergyGate(ratio=2.0, min_frames=3)
+        gate.seed_rms(100.0)
+        clip = _tone(40, 16000)
+        clip[:320] = _tone(3000, 320)
+        self.assertFalse(gate.is_speech(clip))
+        self.assertEqual(gate.floor_rms, 100.0)
+
+        self.assertFalse(gate.is_speech(_tone(40, 16000)))
+        self.assertLess(gate.floor_rms, 100.0)
+
+
+class _FakeAudio:
+    def __init__(self, samples: np.ndarray) -> None:
+        self._raw = samples.tobytes()
+
+    def get_raw_data(self, convert_rate=None, convert_width=None) -> bytes:
+        return self._raw
+
+
+class _FakeWakeModel:
+    def __init__(self, scores) -> None:
+        self.scores = scores
+
+    def predict(self, chunk):
+        return self.scores
+
+
+class WakeThresholdTests(unittest.TestCase):
+    def test_threshold_is_clamped_to_probability_range(self) -> None:
+        self.assertEqual(voice_interaction._clamp_wake_threshold("0.6"), 0.6)
+        self.assertEqual(voice_interaction._clamp_wake_threshold(0), 0.01)
+        self.assertEqual(voice_interaction._clamp_wake_threshold(5), 1.0)
+        self.assertEqual(voice_interaction._clamp_wake_threshold("abc"), 0.45)
+        self.assertEqual(voice_interaction._clamp_wake_threshold(float("nan")), 0.45)
+
+    def test_openwakeword_scores_compare_as_floats(self) -> None:
+        voice = VoiceInteraction.__new__(VoiceInteraction)
+        voice.config = types.SimpleNamespace(openwakeword_threshold=0.5, openwakeword_chunk_size=320)
+        audio = _FakeAudio(np.zeros(640, dtype=np.int16))
+
+        voice.openwakeword_model = _FakeWakeModel({"xiaozhi": np.float32(0.2), "bad": "n/a"})
+        self.assertFalse(voice._detect_openwakeword(audio))
+        voice.openwakeword_model = _FakeWakeModel({"xiaozhi": np.float32(0.7)})
+        self.assertTrue(voice._detect_openwakeword(audio))
+        voice.openwakeword_model = _FakeWakeModel([0.9])
+        self.assertFalse(voice._detect_openwakeword(audio))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import threading
+import types
+import unittest
+from unittest.mock import patch
+
+from pc.voice import voice_interaction
+from pc.voice.voice_interaction import VoiceInteraction
+
+
+class _WaitTimeout(Exception):
+    pass
+
+
+class _CountingMicrophone:
+    def __init__(self) -> None:
+        self.opened = 0
+        self.closed = 0
+
+    def __enter__(self):
+        self.opened += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        self.closed += 1
+        return False
+
+
+class VoiceMicrophoneReuseTests(unittest.TestCase):
+    def test_interaction_loop_keeps_one_stream_open_across_listens(self) -> None:
+        voice = VoiceInteraction.__new__(VoiceInteraction)
+        voice.stop_event = threading.Event()
+        voice.microphone = _CountingMicrophone()
+        voice.is_active = False
+        voice.last_wake_time = 0.0
+        voice.config = types.SimpleNamespace(wake_timeout=10.0, wake_phrase_time_limit=4.0)
+        listens = []
+
+        def _listen(source, timeout=None, phrase_time_limit=None):
+            listens.append(source)
+            if len(listens) >= 5:
+                voice.stop_event.set()
+            raise _WaitTimeout()
+
+        voice.recognizer = types.SimpleNamespace(listen=_listen)
+        with patch.object(voice_interaction, "sr", types.SimpleNamespace(WaitTimeoutError=_WaitTimeout)), \
+             patch.object(voice_interaction.time, "sleep"):
+            voice._interaction_loop()
+
+        self.assertEqual(len(listens), 5)
+        self.assertEqual((voice.microphone.opened, voice.microphone.closed), (1, 1))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -19,7 +19,8 @@ import numpy as np
 
 from pc.app_identity import resource_path
 from pc.core.ai_backend import ask_assistant_with_rag, default_model_for_backend
-from pc.core.config import get_config
+from pc.core.config import get_config, get_config_list
+from pc.core.vad import EnergyGate
 from pc.core.logger import console_error, console_info
 from pc.core.orchestrator import orchestrator
 from pc.core.runtime_assets import sensevoice_model_dir, vosk_model_dir
@@ -39,73 +40,115 @@ except ImportError:
     def stop_tts() -> None:
         return
 
-try:
-    try:
-        import pyaudio  # noqa: F401
-    except ImportError:
-        import pyaudiowpatch as pyaudio  # type: ignore
-        sys.modules.setdefault("pyaudio", pyaudio)
+# 语音相关的原生扩展（PortAudio、Vosk、FunASR/torch、openWakeWord）只在真正创建本地语音助手时才导入，
+# 仅处理远端文本指令的路由器和未开启语音的启动流程不再承担这部分导入开销。
+sr = None
+VOICE_INTERACTION_AVAILABLE = False
+vosk = None
+VOSK_AVAILABLE = False
+FunASRAutoModel = None
+FUNASR_IMPORT_ERROR = ""
+rich_transcription_postprocess = None
+FUNASR_POSTPROCESS_IMPORT_ERROR = ""
+OpenWakeWordModel = None
+OPENWAKEWORD_IMPORT_ERROR = ""
 
-    import speech_recognition as sr
+_IMPORT_LOCK = threading.Lock()
+_SR_IMPORTED = False
+_MODEL_LIBS_IMPORTED = False
 
-    if sys.platform == "win32":
-        os.environ["PSX_NO_CONSOLE"] = "1"
-    VOICE_INTERACTION_AVAILABLE = True
-except ImportError as exc:
-    console_error(f"语音交互功能不可用: {exc}")
-    sr = None
-    VOICE_INTERACTION_AVAILABLE = False
 
-try:
-    import vosk
+def _import_speech_recognition() -> bool:
+    global sr, VOICE_INTERACTION_AVAILABLE, _SR_IMPORTED
+    with _IMPORT_LOCK:
+        if _SR_IMPORTED:
+            return VOICE_INTERACTION_AVAILABLE
+        _SR_IMPORTED = True
+        try:
+            try:
+                import pyaudio  # noqa: F401
+            except ImportError:
+                import pyaudiowpatch as pyaudio  # type: ignore
+                sys.modules.setdefault("pyaudio", pyaudio)
+
+            import speech_recognition
+
+            if sys.platform == "win32":
+                os.environ["PSX_NO_CONSOLE"] = "1"
+            sr = speech_recognition
+            VOICE_INTERACTION_AVAILABLE = True
+        except ImportError as exc:
+            console_error(f"语音交互功能不可用: {exc}")
+            sr = None
+            VOICE_INTERACTION_AVAILABLE = False
+        return VOICE_INTERACTION_AVAILABLE
+
+
+def _import_model_libraries() -> None:
+    global vosk, VOSK_AVAILABLE, FunASRAutoModel, FUNASR_IMPORT_ERROR
+    global rich_transcription_postprocess, FUNASR_POSTPROCESS_IMPORT_ERROR
+    global OpenWakeWordModel, OPENWAKEWORD_IMPORT_ERROR, _MODEL_LIBS_IMPORTED
+    with _IMPORT_LOCK:
+        if _MODEL_LIBS_IMPORTED:
+            return
+        _MODEL_LIBS_IMPORTED = True
 
-    vosk.SetLogLevel(-1)
-    VOSK_AVAILABLE = True
-except ImportError:
-    vosk = None
-    VOSK_AVAILABLE = False
+        try:
+            import vosk as vosk_module
 
-FUNASR_IMPORT_ERROR = ""
-try:
-    _funasr_import_buffer = io.StringIO()
-    with redirect_stdout(_funasr_import_buffer), redirect_stderr(_funasr_import_buffer):
-        from funasr import AutoModel as FunASRAutoModel
-except ImportError as exc:
-    FunASRAutoModel = None
-    FUNASR_IMPORT_ERROR = str(exc)
-    console_error(f"[VOICE] FunASR 导入失败: {exc}")
+            vosk_module.SetLogLevel(-1)
+            vosk = vosk_module
+            VOSK_AVAILABLE = True
+        except ImportError:
+            vosk = None
+            VOSK_AVAILABLE = False
 
-FUNASR_POSTPROCESS_IMPORT_ERROR = ""
-try:
-    from funasr.utils.postprocess_utils import rich_transcription_postprocess
-except ImportError as exc:
-    rich_transcription_postprocess = None
-    FUNASR_POSTPROCESS_IMPORT_ERROR = str(exc)
+        try:
+            funasr_import_buffer = io.StringIO()
+            with redirect_stdout(funasr_import_buffer), redirect_stderr(funasr_import_buffer):
+                from funasr import AutoModel as funasr_auto_model
+            FunASRAutoModel = funasr_auto_model
+        except ImportError as exc:
+            FunASRAutoModel = None
+            FUNASR_IMPORT_ERROR = str(exc)
+            console_error(f"[VOICE] FunASR 导入失败: {exc}")
 
-OPENWAKEWORD_IMPORT_ERROR = ""
-try:
-    from openwakeword.model import Model as OpenWakeWordModel
-except ImportError as exc:
-    OpenWakeWordModel = None
-    OPENWAKEWORD_IMPORT_ERROR = str(exc)
-    console_error(f"[VOICE] openWakeWord 导入失败: {exc}")
+        try:
+            from funasr.utils.postprocess_utils import rich_transcription_postprocess as postprocess
+            rich_transcription_postprocess = postprocess
+        except ImportError as exc:
+            rich_transcription_postprocess = None
+            FUNASR_POSTPROCESS_IMPORT_ERROR = str(exc)
+
+        try:
+            from openwakeword.model import Model as openwakeword_model
+            OpenWakeWordModel = openwakeword_model
+        except ImportError as exc:
+            OpenWakeWordModel = None
+            OPENWAKEWORD_IMPORT_ERROR = str(exc)
+            console_error(f"[VOICE] openWakeWord 导入失败: {exc}")
+
+# 指令判别在每轮识别后都会执行，关键词合并为预编译的单个正则，一次扫描完成匹配。
+_NORMALIZE_RE = re.compile(r"[\s，。！？、,.!?\-—_:;\"'`~·]+")
+_STOP_PLAYBACK_RE = re.compile("停止播报|停止说话|别说了|闭嘴")
+_STOP_SESSION_RE = re.compile("退出|关闭语音|结束语音|停止语音|不用了|结束助手|结束对话|结束本轮")
+_NOTE_RE = re.compile("记住|记一下|记录|记到知识库")
+_SENTENCE_ENDS = "。！？；!?;"
 
 
 class VoiceInteractionConfig:
     def __init__(self) -> None:
         self.wake_word = str(get_config("voice_interaction.wake_word", "小爱同学"))
-        wake_aliases_raw = str(
-            get_config(
-                "voice_interaction.wake_aliases",
-                "小爱同学,小爱同,小爱,小艾同学,晓爱同学,哎同学,爱同学",
-            )
+        self.wake_aliases = get_config_list(
+            "voice_interaction.wake_aliases",
+            "小爱同学,小爱同,小爱,小艾同学,晓爱同学,哎同学,爱同学",
         )
-        self.wake_aliases = [item.strip() for item in wake_aliases_raw.split(",") if item.strip()]
         self.wake_timeout = float(get_config("voice_interaction.wake_timeout", 10.0))
         self.energy_threshold = int(get_config("voice_interaction.energy_threshold", 300))
         self.pause_threshold = float(get_config("voice_interaction.pause_threshold", 1.0))
         self.wake_phrase_time_limit = float(get_config("voice_interaction.wake_phrase_time_limit", 4.0))
         self.command_timeout = float(get_config("voice_interaction.command_timeout", 6.0))
+        self.max_speech_bytes = int(get_config("voice_interaction.max_speech_bytes", 360))
         self.command_phrase_time_limit = float(get_config("voice_interaction.command_phrase_time_limit", 12.0))
         self.online_recognition = str(get_config("voice_interaction.online_recognition", True)).lower() == "true"
         self.vosk_model_path = str(get_config("voice_interaction.vosk_model_path", str(vosk_model_dir())))
@@ -121,10 +164,40 @@ class VoiceInteractionConfig:
         self.funasr_use_itn = str(get_config("voice_interaction.funasr_use_itn", False)).lower() == "true"
 
         self.openwakeword_model_path = str(get_config("voice_interaction.openwakeword_model_path", "")).strip()
-        self.openwakeword_threshold = float(get_config("voice_interaction.openwakeword_threshold", 0.45))
+        self.openwakeword_threshold = _clamp_wake_threshold(get_config("voice_interaction.openwakeword_threshold", 0.45))
         self.openwakeword_chunk_size = int(get_config("voice_interaction.openwakeword_chunk_size", 1280))
 
 
+def _clamp_wake_threshold(value: Any, default: float = 0.45) -> float:
+    # openWakeWord 输出 0~1 的概率；阈值为 0 或负数时任何片段都会被判为唤醒。
+    try:
+        threshold = float(value)
+    except (TypeError, ValueError):
+        return default
+    if threshold != threshold:
+        return default
+    return min(max(threshold, 0.01), 1.0)
+
+
+def _wake_score(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return -1.0
+
+
+def _truncate_speech(text: str, max_bytes: int) -> str:
+    # 播报耗时随合成文本的字节数增长；按 UTF-8 字节预算截断，并尽量停在句末标点处。
+    encoded = text.encode("utf-8")
+    if max_bytes <= 0 or len(encoded) <= max_bytes:
+        return text
+    head = encoded[:max_bytes].decode("utf-8", "ignore")
+    cut = max(head.rfind(mark) for mark in _SENTENCE_ENDS)
+    if cut >= len(head) // 2:
+        return head[: cut + 1]
+    return head
+
+
 def _existing_model_dir(*relative_candidates: str) -> str:
     for candidate in relative_candidates:
         path = resource_path(candidate)
@@ -142,6 +215,8 @@ class VoiceInteraction:
     ) -> None:
         self.config = config or VoiceInteractionConfig()
         self.initialize_audio_models = bool(initialize_audio_models)
+        if self.initialize_audio_models:
+            _import_speech_recognition()
         self.recognizer = sr.Recognizer() if sr else None
         self.microphone = None
         self.is_active = False
@@ -164,6 +239,7 @@ class VoiceInteraction:
         self.funasr_model = None
         self.funasr_runtime_device = "cpu"
         self.openwakeword_model = None
+        self._energy_gate = EnergyGate()
 
         self._configure_recognizer()
         if self.initialize_audio_models:
@@ -187,6 +263,7 @@ class VoiceInteraction:
         self.recognizer.phrase_threshold = 0.25
 
     def _init_voice_models(self) -> None:
+        _import_model_libraries()
         self._init_funasr_engine()
         self._init_vosk_engine()
         self._init_openwakeword_engine()
@@ -344,9 +421,7 @@ class VoiceInteraction:
 
     @staticmethod
     def _normalize_text(text: str) -> str:
-        normalized = re.sub(r"\s+", "", str(text or ""))
-        normalized = re.sub(r"[，。！？、,.!?\-—_:;\"'`~·]+", "", normalized)
-        return normalized.lower()
+        return _NORMALIZE_RE.sub("", str(text or "")).lower()
 
     def _wake_matches(self, text: str) -> bool:
         normalized = self._normalize_text(text)
@@ -367,8 +442,7 @@ class VoiceInteraction:
         return False
 
     def _is_stop_playback_command(self, text: str) -> bool:
-        normalized = self._normalize_text(text)
-        return any(keyword in normalized for keyword in ("停止播报", "停止说话", "别说了", "闭嘴"))
+        return _STOP_PLAYBACK_RE.search(self._normalize_text(text)) is not None
 
     def _stop_playback(self) -> None:
         stop_tts()
@@ -461,6 +535,14 @@ class VoiceInteraction:
             return self._recognize_with_google(audio_data)
         return ""
 
+    def _has_speech_energy(self, audio_data: Any) -> bool:
+        # 待机监听时先做能量门限判断，安静环境下的噪声片段不再送入 FunASR / Vosk / 唤醒模型。
+        try:
+            raw_pcm = audio_data.get_raw_data(convert_rate=16000, convert_width=2)
+        except Exception:
+            return True
+        return self._energy_gate.is_speech(np.frombuffer(raw_pcm, dtype=np.int16))
+
     def _detect_openwakeword(self, audio_data: Any) -> bool:
         if self.openwakeword_model is None:
             return False
@@ -470,18 +552,15 @@ class VoiceInteraction:
             if hasattr(self.openwakeword_model, "reset"):
                 self.openwakeword_model.reset()
             chunk_size = max(320, self.config.openwakeword_chunk_size)
+            threshold = self.config.openwakeword_threshold
             for idx in range(0, len(samples), chunk_size):
                 chunk = samples[idx: idx + chunk_size]
                 if len(chunk) < chunk_size:
                     break
                 scores = self.openwakeword_model.predict(chunk)
-                if isinstance(scores, dict):
-                    for score in scores.values():
-                        try:
-                            if float(score) >= self.config.openwakeword_threshold:
-                                return True
-                        except Exception:
-                            continue
+                values = scores.values() if isinstance(scores, dict) else ()
+                if any(_wake_score(score) >= threshold for score in values):
+                    return True
         except Exception as exc:
             console_error(f"[VOICE] openWakeWord 检测失败，将继续使用文本唤醒匹配: {exc}")
         return False
@@ -532,6 +611,8 @@ class VoiceInteraction:
             with self.microphone as source:
                 assert self.recognizer is not None
                 self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            # 环境噪声校准后的阈值约为底噪的 1.5 倍，用它为能量门限提供初始底噪。
+            self._energy_gate.seed_rms(float(self.recognizer.energy_threshold) / 1.5)
             console_info(
                 f"[VOICE] 当前语音引擎状态: ASR={self._active_asr_engine_name()}, Wake={self._active_wake_engine_name()}, "
                 f"FunASRReady={self.funasr_model is not None}, FunASRDevice={self.funasr_runtime_device}, VoskReady={self.vosk_recognizer is not None}, "
@@ -566,51 +647,58 @@ class VoiceInteraction:
                 if not self.microphone or not self.recognizer:
                     time.sleep(1.0)
                     continue
+                # 麦克风流只打开一次并在整个监听期间复用；出现异常时退出 with 关闭流，稍后重新打开。
                 with self.microphone as source:
-                    if self.is_active and (time.time() - self.last_wake_time) > self.config.wake_timeout:
-                        self.is_active = False
-                        console_info("[VOICE] 唤醒超时，回到待机状态")
-
-                    if not self.is_active:
-                        try:
-                            audio = self.recognizer.listen(
-                                source,
-                                timeout=1,
-                                phrase_time_limit=self.config.wake_phrase_time_limit,
-                            )
-                            text = self._recognize_audio_data(audio)
-                            if text:
-                                console_info(f"[VOICE] 唤醒监听识别: {text}")
-                            if self._is_stop_playback_command(text):
-                                self._stop_playback()
-                                continue
-                            if self._detect_wake_word(audio, text):
-                                self._handle_wake_word()
-                        except sr.WaitTimeoutError:
-                            pass
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            console_info("[VOICE] 正在监听指令...")
-                            audio = self.recognizer.listen(
-                                source,
-                                timeout=self.config.command_timeout,
-                                phrase_time_limit=self.config.command_phrase_time_limit,
-                            )
-                            text = self._recognize_audio_data(audio)
-                            if text:
-                                console_info(f"[VOICE] 指令识别: {text}")
-                                self._route_command(text)
-                            else:
-                                self.is_active = False
-                                console_info("[VOICE] 未识别到有效指令，回到待机状态")
-                        except sr.WaitTimeoutError:
-                            self.is_active = False
-                            console_info("[VOICE] 指令等待超时，回到待机状态")
+                    while not self.stop_event.is_set():
+                        self._listen_once(source)
             except Exception:
                 time.sleep(1.0)
 
+    def _listen_once(self, source: Any) -> None:
+        if self.is_active and (time.time() - self.last_wake_time) > self.config.wake_timeout:
+            self.is_active = False
+            console_info("[VOICE] 唤醒超时，回到待机状态")
+
+        if not self.is_active:
+            try:
+                audio = self.recognizer.listen(
+                    source,
+                    timeout=1,
+                    phrase_time_limit=self.config.wake_phrase_time_limit,
+                )
+                if not self._has_speech_energy(audio):
+                    return
+                text = self._recognize_audio_data(audio)
+                if text:
+                    console_info(f"[VOICE] 唤醒监听识别: {text}")
+                if self._is_stop_playback_command(text):
+                    self._stop_playback()
+                    return
+                if self._detect_wake_word(audio, text):
+                    self._handle_wake_word()
+            except sr.WaitTimeoutError:
+                pass
+            except Exception:
+                pass
+        else:
+            try:
+                console_info("[VOICE] 正在监听指令...")
+                audio = self.recognizer.listen(
+                    source,
+                    timeout=self.config.command_timeout,
+                    phrase_time_limit=self.config.command_phrase_time_limit,
+                )
+                text = self._recognize_audio_data(audio)
+                if text:
+                    console_info(f"[VOICE] 指令识别: {text}")
+                    self._route_command(text)
+                else:
+                    self.is_active = False
+                    console_info("[VOICE] 未识别到有效指令，回到待机状态")
+            except sr.WaitTimeoutError:
+                self.is_active = False
+                console_info("[VOICE] 指令等待超时，回到待机状态")
+
     def _handle_wake_word(self) -> None:
         stop_tts()
         self.is_active = True
@@ -629,8 +717,10 @@ class VoiceInteraction:
         if reply_callback is not None:
             reply_callback(response)
         elif speak_response and response:
-            self._mark_speaking(response)
-            speak_async(response)
+            # 完整回答仍会回调并写入对话记录，这里只限制实际播报的长度。
+            spoken = _truncate_speech(response, self.config.max_speech_bytes)
+            self._mark_speaking(spoken)
+            speak_async(spoken)
 
     def _set_session_state(self, state: str) -> None:
         self.session_state = state
@@ -766,27 +856,10 @@ class VoiceInteraction:
         self.pending_note_items = []
 
     def _is_stop_session_command(self, text: str) -> bool:
-        normalized = self._normalize_text(text)
-        session_keywords = (
-            "退出",
-            "退出助手",
-            "关闭语音",
-            "结束语音",
-            "停止语音",
-            "不用了",
-            "结束助手",
-            "结束对话",
-            "退出对话",
-            "结束本轮",
-        )
-        return any(self._normalize_text(keyword) in normalized for keyword in session_keywords)
+        return _STOP_SESSION_RE.search(self._normalize_text(text)) is not None
 
     def _is_note_command(self, text: str) -> bool:
-        normalized = self._normalize_text(text)
-        return any(
-            self._normalize_text(keyword) in normalized
-            for keyword in ("记住", "记一下", "记录一下", "记录", "帮我记录", "请记录", "记到知识库")
-        )
+        return _NOTE_RE.search(self._normalize_text(text)) is not None
 
     def _execute_orchestrator_actions(self, text: str, actions: list[dict[str, Any]]) -> str:
         if self.local_command_handler is None:
@@ -930,7 +1003,7 @@ def set_voice_local_command_handler(handler: Optional[Callable[[str, str], Optio
 
 def get_voice_interaction() -> Optional[VoiceInteraction]:
     global _voice_interaction
-    if not VOICE_INTERACTION_AVAILABLE:
+    if not _import_speech_recognition():
         return None
     if _voice_interaction is None:
         _voice_interaction = VoiceInteraction()
@@ -4,7 +4,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import io
 import importlib
 import importlib.util
@@ -1199,17 +1198,6 @@ class LabDetectorRuntime:
             return f"{output}\n{error_text}".strip() if output else error_text
         return buffer.getvalue().strip()
 
-    def _check_gpu(self) -> Dict[str, Any]:
-        output = self._run_python_script("pc/tools/check_gpu.py")
-        status = "pass" if "GPU 可用: True" in output else "warn"
-        summary = "检测到可用 GPU" if status == "pass" else "未检测到 CUDA，可降级到 CPU"
-        return {
-            "status": status,
-            "summary": summary,
-            "detail": output or "未返回输出",
-            "raw_output": output or "[WARN] GPU 检查脚本未返回输出",
-        }
-
     def _check_gpu(self) -> Dict[str, Any]:
         report = detect_gpu_environment()
         details = dict(report.get("details") or {})
@@ -1776,12 +1764,13 @@ class LabDetectorRuntime:
         self.background_init_thread.start()
 
     def _latest_frame_for_voice(self) -> Optional[np.ndarray]:
+        # 语音问答会把画面交给耗时数秒的模型调用；节点帧是解码器循环复用的缓冲视图，必须先拷贝出来。
         if self.local_frame is not None:
-            return self.local_frame
+            return self.local_frame.copy()
         if self.manager:
             for frame in self.manager.frame_buffers.values():
                 if frame is not None:
-                    return frame
+                    return frame.copy()
         return None
 
     def _start_camera_session_locked(self) -> None:
@@ -1944,7 +1933,7 @@ class LabDetectorRuntime:
     def _manager_loop(self) -> None:
         try:
             if self.manager:
-                asyncio.run(self.manager.start())
+                self.manager.run()
         except Exception as exc:
             self._log_error(f"多节点监控线程退出: {exc}")
 
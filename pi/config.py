@@ -1,119 +1,128 @@
 import configparser
+import io
 import os
+import sys
 from typing import Any
 
 
 PI_BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
 
+_DEFAULTS = {
+    "voice": {
+        "wake_word": "小爱同学",
+        "wake_aliases": "小爱同学,小爱同,小爱,小艾同学,晓爱同学,哎同学,爱同学",
+        "online_recognition": "True",
+        "model_path": "voice/model",
+    },
+    "network": {"pc_ip": "", "ws_port": "8001"},
+    "detector": {
+        "weights_path": "yolov8n.pt",
+        "conf": "0.4",
+        "imgsz": "640",
+        "prefer_exported": "True",
+    },
+    "self_check": {
+        "auto_install_dependencies": "False",
+    },
+    "architecture": {
+        "node_role": "light_frontend",
+        "local_orchestration": "False",
+    },
+}
+
+_BOOL_VALUES = {"true": True, "false": False}
+
+
+def _coerce(value: str) -> Any:
+    if not value or value[0] not in "+-.0123456789":
+        flag = _BOOL_VALUES.get(value.lower())
+        return value if flag is None else flag
+    try:
+        if "." in value:
+            return float(value)
+        return int(value)
+    except ValueError:
+        return value
+
+
 class PiConfig:
     _config = None
+    _value_cache: dict = {}
     _config_path = os.path.join(PI_BASE_DIR, "config.ini")
 
     @classmethod
     def init(cls) -> None:
         if cls._config is not None:
             return
-        cls._config = configparser.ConfigParser()
-        if not os.path.exists(cls._config_path):
-            cls._create_default()
-        cls._config.read(cls._config_path, encoding="utf-8-sig")
-        cls._ensure_defaults()
-
-    @classmethod
-    def _create_default(cls) -> None:
-        config = configparser.ConfigParser()
-        config["voice"] = {
-            "wake_word": "小爱同学",
-            "wake_aliases": "小爱同学,小爱同,小爱,小艾同学,晓爱同学,哎同学,爱同学",
-            "online_recognition": "True",
-            "model_path": "voice/model",
-        }
-        config["network"] = {"pc_ip": "", "ws_port": "8001"}
-        config["detector"] = {
-            "weights_path": "yolov8n.pt",
-            "conf": "0.4",
-            "imgsz": "640",
-        }
-        config["self_check"] = {
-            "auto_install_dependencies": "False",
-        }
-        config["architecture"] = {
-            "node_role": "light_frontend",
-            "local_orchestration": "False",
-        }
-        with open(cls._config_path, "w", encoding="utf-8-sig") as handle:
-            config.write(handle)
-
-    @classmethod
-    def _ensure_defaults(cls) -> None:
-        defaults = {
-            "voice": {
-                "wake_word": "小爱同学",
-                "wake_aliases": "小爱同学,小爱同,小爱,小艾同学,晓爱同学,哎同学,爱同学",
-                "online_recognition": "True",
-                "model_path": "voice/model",
-            },
-            "network": {"pc_ip": "", "ws_port": "8001"},
-            "detector": {
-                "weights_path": "yolov8n.pt",
-                "conf": "0.4",
-                "imgsz": "640",
-            },
-            "self_check": {
-                "auto_install_dependencies": "False",
-            },
-            "architecture": {
-                "node_role": "light_frontend",
-                "local_orchestration": "False",
-            },
-        }
-        changed = False
-        assert cls._config is not None
-        for section, options in defaults.items():
+        cls._config = configparser.ConfigParser(interpolation=None)
+        cls._value_cache.clear()
+        # 直接尝试打开，省去单独的 exists() 探测。
+        try:
+            with open(cls._config_path, encoding="utf-8-sig") as handle:
+                cls._config.read_file(handle)
+            changed = False
+        except FileNotFoundError:
+            cls._config.read_dict(_DEFAULTS)
+            changed = True
+        for section, options in _DEFAULTS.items():
             if section not in cls._config:
                 cls._config[section] = {}
-                changed = True
+            current = cls._config[section]
             for key, value in options.items():
-                if key not in cls._config[section]:
-                    cls._config[section][key] = str(value)
+                if key not in current:
+                    current[key] = value
                     changed = True
         if changed:
-            with open(cls._config_path, "w", encoding="utf-8-sig") as handle:
-                cls._config.write(handle)
+            cls._save()
+
+    @classmethod
+    def _save(cls) -> None:
+        buffer = io.StringIO()
+        cls._config.write(buffer)
+        data = buffer.getvalue().encode("utf-8-sig")
+        # 内容未变化时不重写，减少 SD 卡写入。
+        try:
+            with open(cls._config_path, "rb") as handle:
+                if handle.read() == data:
+                    return
+        except OSError:
+            pass
+        with open(cls._config_path, "wb") as handle:
+            handle.write(data)
 
     @classmethod
     def get(cls, key_path: str, default: Any = None):
-        cls.init()
-        section, key = key_path.split(".", 1)
-        if section not in cls._config or key not in cls._config[section]:
-            return default
-        value = cls._config[section][key]
-        lowered = value.lower()
-        if lowered == "true":
-            return True
-        if lowered == "false":
-            return False
+        # 已初始化时不再经 classmethod 描述符调用 init()，缓存命中只剩一次字典查找。
+        if cls._config is None:
+            cls.init()
         try:
-            if "." in value:
-                return float(value)
-            return int(value)
-        except ValueError:
-            return value
+            return cls._value_cache[key_path]
+        except KeyError:
+            pass
+        section, sep, key = key_path.partition(".")
+        if not sep or section not in cls._config or key not in cls._config[section]:
+            return default
+        value = _coerce(cls._config[section][key])
+        cls._value_cache[sys.intern(key_path)] = value
+        return value
 
     @classmethod
     def set(cls, key_path: str, value: Any) -> None:
         cls.init()
-        section, key = key_path.split(".", 1)
+        section, sep, key = key_path.partition(".")
+        if not sep:
+            return
         if section not in cls._config:
             cls._config[section] = {}
         cls._config[section][key] = str(value)
-        with open(cls._config_path, "w", encoding="utf-8-sig") as handle:
-            cls._config.write(handle)
+        cls._value_cache.clear()
+        cls._save()
 
 
-def get_pi_config(key, default=None):
-    return PiConfig.get(key, default)
+def get_pi_config(key, default=None, _get=PiConfig.get):
+    # PiConfig.get 在定义时绑定为局部变量，逐帧调用时省去全局与属性查找。
+    return _get(key, default)
 
 
 def set_pi_config(key, value):
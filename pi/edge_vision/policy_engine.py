@@ -3,6 +3,20 @@ from __future__ import annotations
 import time
 
 
+def policies_ready(policies, last_triggers=None, current_time=None) -> bool:
+    """是否至少有一条有效策略已过冷却期；全部处于冷却时本帧无需推理。"""
+    current_time = float(current_time or time.time())
+    trigger_cache = last_triggers if isinstance(last_triggers, dict) else {}
+    for policy in policies or []:
+        event_name = policy.get("event_name")
+        if not event_name or not policy.get("trigger_classes"):
+            continue
+        cooldown = float(policy.get("cooldown", 5.0) or 5.0)
+        if current_time - float(trigger_cache.get(event_name, 0.0) or 0.0) >= cooldown:
+            return True
+    return False
+
+
 def apply_policies_to_detections(
     frame,
     policies,
@@ -12,6 +26,7 @@ def apply_policies_to_detections(
     last_triggers=None,
     current_time=None,
 ):
+    """按策略筛选本帧触发的事件；返回的图像是 frame 本身或其切片视图，调用方只读使用（编码上传）。"""
     detected_set = set(detected_objects or [])
     detected_str = ",".join(sorted(detected_set))
     triggered_events = []
@@ -58,10 +73,11 @@ def apply_policies_to_detections(
                 )
             )
         else:
+            # 整帧事件只会被 imencode 读取，多条策略共享同一帧，避免每次触发都整帧拷贝。
             triggered_events.append(
                 (
                     event_name,
-                    frame.copy(),
+                    frame,
                     detected_str,
                     {
                         "expert_code": str(policy.get("expert_code", "") or ""),
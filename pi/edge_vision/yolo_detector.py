@@ -1,11 +1,12 @@
 ﻿# pi/edge_vision/yolo_detector.py
 from __future__ import annotations
 
+import threading
 import time
 from pathlib import Path
 
 from ultralytics import YOLO
-from .policy_engine import apply_policies_to_detections
+from .policy_engine import apply_policies_to_detections, policies_ready
 
 try:
     from ..config import get_pi_config
@@ -13,6 +14,41 @@ except ImportError:  # pragma: no cover - direct script fallback
     from config import get_pi_config
 
 
+# 导出格式按优先级排列：Jetson 上的 TensorRT 引擎、树莓派 CPU 上最快的 NCNN、通用的 ONNX。
+# 导出模型的输入尺寸在导出时固定，需与 detector.imgsz 保持一致。
+_EXPORTED_SUFFIXES = (".engine", "_ncnn_model", ".onnx")
+
+
+def prefer_exported_weights(weights_path: str) -> str:
+    """若 .pt 权重旁存在已导出的推理模型，则优先使用它。"""
+    path = Path(weights_path)
+    if path.suffix != ".pt":
+        return weights_path
+    for suffix in _EXPORTED_SUFFIXES:
+        candidate = path.with_name(path.stem + suffix)
+        if candidate.exists():
+            return str(candidate)
+    return weights_path
+
+
+_MODEL_CACHE: dict = {}
+_MODEL_LOCK = threading.Lock()
+
+
+def get_yolo(weights_path: str):
+    """按权重路径返回进程内共享的 YOLO 实例；断线重连重建检测器时不再重复加载权重。"""
+    with _MODEL_LOCK:
+        model = _MODEL_CACHE.get(weights_path)
+        if model is None:
+            model = _MODEL_CACHE[weights_path] = YOLO(weights_path, task="detect")
+        return model
+
+
+def export_weights(weights_path: str, fmt: str = "ncnn", imgsz: int = 640, half: bool = False, int8: bool = False) -> str:
+    """一次性把 .pt 权重导出为推理格式，导出结果与源权重放在同一目录。"""
+    return str(YOLO(weights_path).export(format=fmt, imgsz=imgsz, half=half, int8=int8))
+
+
 class SemanticEdgeEngine:
     def __init__(self) -> None:
         weights_path = str(get_pi_config("detector.weights_path", "yolov8n.pt") or "yolov8n.pt")
@@ -21,7 +57,9 @@ class SemanticEdgeEngine:
         self.conf = max(0.05, min(conf, 0.95))
         self.imgsz = max(320, min(imgsz, 1280))
         self.weights_path = self._resolve_weights_path(weights_path)
-        self.model = YOLO(self.weights_path)
+        if get_pi_config("detector.prefer_exported", True):
+            self.weights_path = prefer_exported_weights(self.weights_path)
+        self.model = get_yolo(self.weights_path)
         self.last_triggers = {}
 
     @staticmethod
@@ -46,24 +84,33 @@ class SemanticEdgeEngine:
         """
         if not policies:
             return []
+        current_time = time.time()
+        # 所有策略都在冷却期内时，本帧检测结果不会触发任何事件，直接跳过整次前向推理。
+        if not policies_ready(policies, self.last_triggers, current_time):
+            return []
 
         # 在树莓派 5 上显式传入 imgsz，避免默认推理尺寸失控导致负载飘高。
         results = self.model(frame, verbose=False, conf=self.conf, imgsz=self.imgsz)
         detected_objects = []
         boxes_dict = {}
 
+        names = self.model.names
         for result in results:
-            for box in result.boxes:
-                cls_name = self.model.names[int(box.cls[0])]
+            boxes = result.boxes
+            if boxes is None or len(boxes) == 0:
+                continue
+            # 类别与坐标各做一次整批张量转换，避免逐框索引张量和逐个 int() 转换。
+            for cls_id, xyxy in zip(boxes.cls.int().tolist(), boxes.xyxy.int().tolist()):
+                cls_name = names[cls_id]
                 detected_objects.append(cls_name)
-                boxes_dict.setdefault(cls_name, []).append(list(map(int, box.xyxy[0])))
+                boxes_dict.setdefault(cls_name, []).append(xyxy)
         return apply_policies_to_detections(
             frame,
             policies,
             detected_objects,
             boxes_dict,
             last_triggers=self.last_triggers,
-            current_time=time.time(),
+            current_time=current_time,
         )
 
 
@@ -238,6 +238,28 @@ def install_log(tail_lines: int = 40) -> int:
     return 0
 
 
+def export_detector(fmt: str = "ncnn", half: bool = False, int8: bool = False) -> int:
+    try:
+        try:
+            from .edge_vision.yolo_detector import SemanticEdgeEngine, export_weights
+        except ImportError:
+            from edge_vision.yolo_detector import SemanticEdgeEngine, export_weights
+    except Exception as exc:
+        print(f"YOLO 检测模块加载失败: {exc}")
+        return 1
+
+    weights_path = SemanticEdgeEngine._resolve_weights_path(str(get_pi_config("detector.weights_path", "yolov8n.pt") or "yolov8n.pt"))
+    imgsz = max(320, min(int(get_pi_config("detector.imgsz", 640) or 640), 1280))
+    try:
+        output = export_weights(weights_path, fmt=fmt, imgsz=imgsz, half=half, int8=int8)
+    except Exception as exc:
+        print(f"检测权重导出失败: {exc}")
+        return 1
+    print(f"检测权重已导出: {output}")
+    print("启动时将优先加载导出模型（detector.prefer_exported=False 可关闭）。")
+    return 0
+
+
 def interactive_config_wizard() -> int:
     snapshot = _config_snapshot()
     pc_ip = input(f"PC 中枢 IP [{snapshot['network']['pc_ip'] or '留空自动发现'}]: ").strip()
@@ -341,6 +363,11 @@ def build_parser() -> argparse.ArgumentParser:
     install_log_parser = subparsers.add_parser("install-log", help="查看 Pi 运行时安装日志")
     install_log_parser.add_argument("--tail", type=int, default=40, help="输出最后 N 行日志")
 
+    export_parser = subparsers.add_parser("export-detector", help="将检测权重一次性导出为 NCNN / TensorRT / ONNX 推理模型")
+    export_parser.add_argument("--format", dest="export_format", choices=("ncnn", "engine", "onnx"), default="ncnn", help="导出格式")
+    export_parser.add_argument("--half", action="store_true", help="以 FP16 导出（TensorRT）")
+    export_parser.add_argument("--int8", action="store_true", help="以 INT8 量化导出")
+
     subparsers.add_parser("version", help="输出版本号")
     return parser
 
@@ -375,6 +402,8 @@ def main(argv: list[str] | None = None) -> int:
             return install_status(as_json=args.json)
         if args.command == "install-log":
             return install_log(tail_lines=args.tail)
+        if args.command == "export-detector":
+            return export_detector(fmt=args.export_format, half=args.half, int8=args.int8)
         if args.command == "version":
             print(APP_VERSION)
             return 0
@@ -4,10 +4,12 @@
 pisend_receive.py - 树莓派全双工收发器 (支持 QoS 动态帧率均衡版)
 """
 import asyncio
+import concurrent.futures
 import json
 import os
 import shutil
 import socket
+import struct
 import subprocess
 import sys
 import threading
@@ -17,8 +19,21 @@ import uuid
 import base64
 import importlib
 import importlib.util
+import itertools
 from typing import List, Optional, Tuple
 
+try:
+    import uvloop
+except Exception:  # pragma: no cover - optional dependency
+    uvloop = None
+
+try:
+    from zeroconf import ServiceInfo, Zeroconf
+except Exception:  # pragma: no cover - optional dependency
+    ServiceInfo = Zeroconf = None
+
+MDNS_SERVICE_TYPE = "_videostream._tcp.local."
+
 try:
     from .config import get_pi_config, get_pi_path_config
     from .tools.version_manager import get_app_version
@@ -98,6 +113,32 @@ _PI_STATE = {
 }
 
 
+# 事件关键帧以二进制帧上行：1 字节操作码 + 4 字节大端元数据长度 + UTF-8 JSON 元数据 + 原始 JPEG，
+# 格式与 PC 端 pc.core.expert_closed_loop.parse_pi_expert_frame 保持一致。
+# 仅当 PC 在 CMD:SYNC_CONFIG 中声明 binary_event_frames 时启用，旧版 PC 仍收到 Base64 文本事件包。
+PI_FRAME_EXPERT_EVENT = 0x02
+_PI_FRAME_HEADER = struct.Struct(">BI")
+
+
+def build_expert_event_frame(payload: dict, jpeg_bytes: bytes) -> bytes:
+    meta_raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    return _PI_FRAME_HEADER.pack(PI_FRAME_EXPERT_EVENT, len(meta_raw)) + meta_raw + jpeg_bytes
+
+
+def build_expert_event_message(payload: dict, jpeg_bytes: bytes, binary: bool):
+    if binary:
+        return build_expert_event_frame(payload, jpeg_bytes)
+    b64_img = base64.b64encode(jpeg_bytes).decode("utf-8")
+    return f"PI_EXPERT_EVENT:{json.dumps(payload, ensure_ascii=False)}:{b64_img}"
+
+
+def _run_event_loop(main) -> None:
+    """运行主协程；安装了 uvloop 时使用 libuv 事件循环以降低收发调度开销。"""
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
+
+
 def write_log(level: str, text: str):
     try:
         log_line = f"[{time.strftime('%H:%M:%S')}] {level} {text}\n"
@@ -245,7 +286,13 @@ def _load_runtime_modules() -> None:
             check_and_download_vosk = None
 
 _TTS_ENGINE = None
+# mDNS 通告、远程自检等短时后台任务共用一个线程池，避免每次都新建线程。
+_BACKGROUND_POOL = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="PiBackground")
+# 播报独占一个单线程执行器：一次只播一句，排队的播报留在优先级队列里，不占用后台线程池。
+_TTS_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="PiTTS")
+
 tts_queue = None
+_TTS_SEQ = itertools.count()
 _TTS_PROCESS = None
 _TTS_LOCK = threading.Lock()
 
@@ -287,6 +334,12 @@ def stop_tts_playback():
             pass
 
 
+def _enqueue_tts(text: str, urgent: bool = False) -> None:
+    # 告警类播报排在普通播报之前，同级按到达顺序播放。
+    if tts_queue is not None:
+        tts_queue.put_nowait((0 if urgent else 1, next(_TTS_SEQ), text))
+
+
 def detect_audio_capabilities():
     """检测 Pi 端音频能力（麦克风/扬声器）。"""
     global pyaudio
@@ -311,25 +364,45 @@ def detect_audio_capabilities():
         pass
     return has_mic, has_speaker
 
-def speak_async(text):
-    def _speak(t):
-        global _TTS_PROCESS
-        if not t or not _TTS_ENGINE: return
-        try:
+def _speak_blocking(text):
+    """同步播报一句，播放结束后返回；只在 _TTS_EXECUTOR 上调用。"""
+    global _TTS_PROCESS
+    if not text or not _TTS_ENGINE:
+        return
+    try:
+        if _TTS_ENGINE == "espeak":
+            cmd = shutil.which("espeak")
+            if not cmd:
+                return
+            # 只在启动与清理进程时持锁，stop_tts_playback 可以随时终止正在播放的句子。
             with _TTS_LOCK:
-                if _TTS_ENGINE == "espeak":
-                    cmd = shutil.which("espeak")
-                    if cmd:
-                        _TTS_PROCESS = subprocess.Popen([str(cmd), "-v", "zh", t], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-                        _TTS_PROCESS.wait()
-                        _TTS_PROCESS = None
-                else:
-                    _TTS_ENGINE.say(t)
-                    _TTS_ENGINE.runAndWait()
-        except:
-            pass
+                process = _TTS_PROCESS = subprocess.Popen(
+                    [str(cmd), "-v", "zh", text], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+                )
+            process.wait()
+            with _TTS_LOCK:
+                if _TTS_PROCESS is process:
+                    _TTS_PROCESS = None
+        else:
+            _TTS_ENGINE.say(text)
+            _TTS_ENGINE.runAndWait()
+    except Exception:
+        pass
+
 
-    threading.Thread(target=_speak, args=(text,), daemon=True).start()
+def speak_async(text):
+    return _TTS_EXECUTOR.submit(_speak_blocking, text)
+
+
+async def _tts_worker():
+    # 在此等待每句播完再取下一句，待播内容积压在 PriorityQueue 中，告警优先与停止时清空才能生效。
+    loop = asyncio.get_running_loop()
+    while running:
+        _, _, txt = await tts_queue.get()
+        try:
+            await loop.run_in_executor(_TTS_EXECUTOR, _speak_blocking, txt)
+        finally:
+            tts_queue.task_done()
 
 
 class NetworkDiscoveryResponder:
@@ -357,6 +430,23 @@ class NetworkDiscoveryResponder:
 
         threading.Thread(target=_loop, daemon=True).start()
         console_info(f"UDP 发现服务已就绪 (端口: {self.port})")
+        if Zeroconf is not None:
+            _BACKGROUND_POOL.submit(self._advertise_mdns)
+
+    def _advertise_mdns(self):
+        # 安装了 zeroconf 时额外通告 mDNS 服务，PC 端无需等待广播应答即可发现节点。
+        try:
+            info = ServiceInfo(
+                MDNS_SERVICE_TYPE,
+                f"neurolab-{socket.gethostname()}.{MDNS_SERVICE_TYPE}",
+                addresses=[socket.inet_aton(self.local_ip)],
+                port=self.ws_port,
+            )
+            self._zeroconf = Zeroconf()
+            self._zeroconf.register_service(info)
+            console_info(f"mDNS 服务已通告: {MDNS_SERVICE_TYPE} ({self.local_ip}:{self.ws_port})")
+        except Exception as exc:
+            console_info(f"[WARN] mDNS 通告失败: {exc}")
 
 
 picam2 = None
@@ -370,12 +460,28 @@ async def get_frame():
         return None
 
 
+def _tune_client_socket(websocket) -> None:
+    # 预览帧与事件帧成批写出，放大内核发送缓冲，避免突发时 send 因缓冲写满而挂起。
+    transport = getattr(websocket, "transport", None)
+    sock = transport.get_extra_info("socket") if transport is not None else None
+    if sock is None:
+        return
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 1 << 20)
+    except OSError:
+        pass
+
+
 async def handle_client(websocket, path=""):
     capture_controller = AdaptiveCaptureController()
     console_info(f"[INFO] PC连接成功: {websocket.remote_address}")
+    _tune_client_socket(websocket)
 
     await websocket.send(f"PI_CAPS:{json.dumps({'has_mic': _PI_STATE['has_mic'], 'has_speaker': _PI_STATE['has_speaker']})}")
 
+    # 当前连接的协议协商结果，由 PC 在 CMD:SYNC_CONFIG 中声明。
+    link_options = {"binary_event_frames": False}
+
     # ★ 新增：启动语音协程，共用当前的 websocket 连接
     voice_task = asyncio.create_task(voice_thread(websocket))
     loop = asyncio.get_running_loop()
@@ -400,6 +506,7 @@ async def handle_client(websocket, path=""):
                             payload = json.loads(config_str)
                         except Exception:
                             payload = {}
+                        link_options["binary_event_frames"] = bool(payload.get("binary_event_frames", False))
                         wake_word = str(payload.get("wake_word", "") or "").strip()
                         wake_aliases_raw = payload.get("wake_aliases", [])
                         if isinstance(wake_aliases_raw, str):
@@ -427,12 +534,12 @@ async def handle_client(websocket, path=""):
                         def _worker() -> None:
                             run_pi_self_check(progress_callback=_schedule_progress)
 
-                        threading.Thread(target=_worker, daemon=True, name="PiRemoteSelfCheck").start()
+                        _BACKGROUND_POOL.submit(_worker)
                     elif msg.startswith("CMD:TTS:"):
                         tts_text = msg.replace("CMD:TTS:", "")
                         console_info(f"[专家结论] {tts_text}")
-                        if _PI_STATE["has_speaker"] and tts_queue is not None:
-                            await tts_queue.put(tts_text)
+                        if _PI_STATE["has_speaker"]:
+                            _enqueue_tts(tts_text)
                     elif msg.startswith("CMD:EXPERT_RESULT:"):
                         result_raw = msg.replace("CMD:EXPERT_RESULT:", "", 1)
                         payload = json.loads(result_raw)
@@ -447,8 +554,8 @@ async def handle_client(websocket, path=""):
                         }
                         if text:
                             console_info(f"[专家研判-{severity}] ({event_id}) {text}")
-                            if should_speak and _PI_STATE["has_speaker"] and tts_queue is not None:
-                                await tts_queue.put(text)
+                            if should_speak and _PI_STATE["has_speaker"]:
+                                _enqueue_tts(text, urgent=severity not in ("", "info"))
 
                         ack = {
                             "event_id": event_id,
@@ -497,7 +604,6 @@ async def handle_client(websocket, path=""):
                     for event_name, event_frame, detected_str, policy_meta in triggered_events:
                         ret, buf = cv2.imencode('.jpg', event_frame, hd_encode_param)
                         if ret:
-                            b64_img = base64.b64encode(buf.tobytes()).decode('utf-8')
                             payload = {
                                 "event_id": str(uuid.uuid4()),
                                 "event_name": event_name,
@@ -513,7 +619,9 @@ async def handle_client(websocket, path=""):
                                     "policy_action": str((policy_meta or {}).get("policy_action", "") or ""),
                                 },
                             }
-                            await websocket.send(f"PI_EXPERT_EVENT:{json.dumps(payload, ensure_ascii=False)}:{b64_img}")
+                            await websocket.send(
+                                build_expert_event_message(payload, buf.tobytes(), link_options["binary_event_frames"])
+                            )
                             console_info(
                                 f"捕捉违规，上传关键帧 [{event_name}] expert={payload['expert_code'] or 'unknown'} classes={detected_str}"
                             )
@@ -547,6 +655,11 @@ async def main_async():
         console_error(f"运行时依赖未就绪: {exc}")
         return
 
+    # to_thread 只用于摄像头取帧等少量阻塞调用，固定 2 个工作线程，避免在树莓派上按 CPU 数量多开线程。
+    asyncio.get_running_loop().set_default_executor(
+        concurrent.futures.ThreadPoolExecutor(max_workers=2, thread_name_prefix="PiIO")
+    )
+
     try:
         if check_and_download_vosk is not None:
             check_and_download_vosk(_get_voice_model_dir())
@@ -568,17 +681,20 @@ async def main_async():
     _PI_STATE["has_mic"], _PI_STATE["has_speaker"] = detect_audio_capabilities()
 
     if _PI_STATE["has_speaker"] and init_tts():
-        tts_queue = asyncio.Queue()
-
-        async def _tts_worker():
-            while running:
-                txt = await tts_queue.get()
-                speak_async(txt)
-
+        tts_queue = asyncio.PriorityQueue()
         asyncio.create_task(_tts_worker())
 
     ws_port = _get_ws_port()
-    async with websockets.serve(handle_client, "0.0.0.0", ws_port, ping_interval=20, ping_timeout=20, max_size=None):
+    # 视频帧为 JPEG，关闭 permessage-deflate，避免树莓派 CPU 浪费在二次压缩上。
+    async with websockets.serve(
+        handle_client,
+        "0.0.0.0",
+        ws_port,
+        ping_interval=20,
+        ping_timeout=20,
+        max_size=None,
+        compression=None,
+    ):
         console_info(f"WebSocket 服务已就绪: ws://{get_local_ip()}:{ws_port}")
         while running: await asyncio.sleep(1)
 
@@ -594,7 +710,7 @@ def main():
         loop.create_task(main_async())
     else:
         try:
-            asyncio.run(main_async())
+            _run_event_loop(main_async)
         except KeyboardInterrupt:
             running = False
 
@@ -610,6 +726,22 @@ async def voice_thread(websocket):
             wake_aliases=_PI_STATE.get("wake_aliases") or [],
         )
 
+        # PyAudio 回调线程直接把音频块投递进事件循环，避免每个音频块都经 to_thread 跳一次线程池。
+        loop = asyncio.get_running_loop()
+        audio_chunks = asyncio.Queue(maxsize=8)
+
+        def _push_chunk(chunk: bytes) -> None:
+            if audio_chunks.full():
+                audio_chunks.get_nowait()
+            audio_chunks.put_nowait(chunk)
+
+        def _on_audio(in_data, _frame_count, _time_info, _status):
+            try:
+                loop.call_soon_threadsafe(_push_chunk, in_data)
+            except RuntimeError:
+                return None, pyaudio.paComplete
+            return None, pyaudio.paContinue
+
         p = pyaudio.PyAudio()
         stream = p.open(
             format=pyaudio.paInt16,
@@ -617,6 +749,7 @@ async def voice_thread(websocket):
             rate=16000,
             input=True,
             frames_per_buffer=4000,
+            stream_callback=_on_audio,
         )
         stream.start_stream()
         console_info("Pi 端本地语音引擎已就绪。")
@@ -626,7 +759,10 @@ async def voice_thread(websocket):
 
     while running:
         try:
-            data = await asyncio.to_thread(stream.read, 4000, exception_on_overflow=False)
+            try:
+                data = await asyncio.wait_for(audio_chunks.get(), timeout=1.0)
+            except asyncio.TimeoutError:
+                continue
             synced_wake_word = str(_PI_STATE.get("wake_word") or "").strip()
             if synced_wake_word and interaction.wake_word != synced_wake_word:
                 interaction.wake_word = synced_wake_word
@@ -832,7 +968,7 @@ if __name__ == '__main__':
         loop.create_task(main_async())
     else:
         try:
-            asyncio.run(main_async())
+            _run_event_loop(main_async)
         except KeyboardInterrupt:
             running = False
             print("\n[INFO] 正在关闭 Pi 边缘节点...")
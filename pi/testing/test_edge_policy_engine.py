@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import unittest
+
+import numpy as np
+
+from pi.edge_vision import policy_engine
+
+
+_POLICIES = [
+    {"event_name": "PPE穿戴检查", "trigger_classes": ["person"], "condition": "any", "action": "full_frame", "cooldown": 8.0},
+    {"event_name": "危化品识别", "trigger_classes": ["bottle"], "condition": "any", "action": "crop_target", "cooldown": 4.0},
+]
+
+
+class EdgePolicyEngineTest(unittest.TestCase):
+    def test_policies_ready_only_when_some_cooldown_elapsed(self) -> None:
+        triggers = {"PPE穿戴检查": 100.0, "危化品识别": 100.0}
+        self.assertFalse(policy_engine.policies_ready(_POLICIES, triggers, 103.0))
+        self.assertTrue(policy_engine.policies_ready(_POLICIES, triggers, 104.0))
+        self.assertTrue(policy_engine.policies_ready(_POLICIES, {}, 1000.0))
+        self.assertFalse(policy_engine.policies_ready([{"event_name": "", "trigger_classes": ["person"]}], {}, 1000.0))
+        self.assertFalse(policy_engine.policies_ready([], {}, 1000.0))
+
+    def test_apply_policies_respects_cooldown(self) -> None:
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        triggers: dict = {}
+        events = policy_engine.apply_policies_to_detections(
+            frame,
+            _POLICIES,
+            ["person", "bottle"],
+            {"person": [[0, 0, 50, 50]], "bottle": [[10, 10, 30, 30]]},
+            last_triggers=triggers,
+            current_time=100.0,
+        )
+        self.assertEqual([event[0] for event in events], ["PPE穿戴检查", "危化品识别"])
+        self.assertFalse(policy_engine.policies_ready(_POLICIES, triggers, 102.0))
+
+    def test_full_frame_events_share_the_input_frame(self) -> None:
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        policies = [
+            {"event_name": "PPE穿戴检查", "trigger_classes": ["person"], "action": "full_frame"},
+            {"event_name": "人员离岗", "trigger_classes": ["person"], "action": "full_frame"},
+            {"event_name": "危化品识别", "trigger_classes": ["bottle"], "action": "crop_target"},
+        ]
+        events = policy_engine.apply_policies_to_detections(
+            frame,
+            policies,
+            ["person", "bottle"],
+            {"person": [[0, 0, 50, 50]], "bottle": [[10, 10, 30, 30]]},
+            current_time=100.0,
+        )
+        self.assertIs(events[0][1], frame)
+        self.assertIs(events[1][1], frame)
+        self.assertIs(events[2][1].base, frame)
+        self.assertEqual(events[2][1].shape, (50, 50, 3))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -24,6 +24,18 @@ class PiConfigTest(unittest.TestCase):
             self.assertEqual(node_role, "light_frontend")
             self.assertFalse(local_orchestration)
 
+    def test_cached_values_are_invalidated_by_set(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pi_config_") as temp_dir:
+            config_path = Path(temp_dir) / "config.ini"
+            with mock.patch.object(config.PiConfig, "_config", None), \
+                 mock.patch.object(config.PiConfig, "_value_cache", {}), \
+                 mock.patch.object(config.PiConfig, "_config_path", str(config_path)):
+                self.assertEqual(config.get_pi_config("network.ws_port"), 8001)
+                self.assertIn("network.ws_port", config.PiConfig._value_cache)
+
+                config.set_pi_config("network.ws_port", 9012)
+                self.assertEqual(config.get_pi_config("network.ws_port"), 9012)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import unittest
+from unittest import mock
+
+from pi import pisend_receive
+
+
+class PiTtsQueueTests(unittest.TestCase):
+    def _run(self, scenario):
+        played = []
+        started = threading.Event()
+        release = threading.Event()
+
+        def _fake_speak(text):
+            played.append(text)
+            started.set()
+            release.wait(2.0)
+
+        async def _main():
+            pisend_receive.tts_queue = asyncio.PriorityQueue()
+            worker = asyncio.create_task(pisend_receive._tts_worker())
+            try:
+                pisend_receive._enqueue_tts("第一句")
+                await asyncio.get_running_loop().run_in_executor(None, started.wait, 2.0)
+                scenario()
+                release.set()
+                await asyncio.wait_for(pisend_receive.tts_queue.join(), 2.0)
+            finally:
+                worker.cancel()
+
+        with mock.patch.object(pisend_receive, "_speak_blocking", side_effect=_fake_speak), \
+             mock.patch.object(pisend_receive, "tts_queue", None):
+            asyncio.run(_main())
+        return played
+
+    def test_urgent_speech_jumps_ahead_of_pending_routine_speech(self) -> None:
+        def _scenario():
+            pisend_receive._enqueue_tts("例行播报")
+            pisend_receive._enqueue_tts("紧急告警", urgent=True)
+
+        self.assertEqual(self._run(_scenario), ["第一句", "紧急告警", "例行播报"])
+
+    def test_stop_drains_pending_speech(self) -> None:
+        def _scenario():
+            pisend_receive._enqueue_tts("例行播报")
+            pisend_receive._enqueue_tts("紧急告警", urgent=True)
+            self.assertEqual(pisend_receive.tts_queue.qsize(), 2)
+            pisend_receive.stop_tts_playback()
+
+        self.assertEqual(self._run(_scenario), ["第一句"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import importlib
+import sys
+import tempfile
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+
+class _FakeTensor:
+    def __init__(self, values) -> None:
+        self.values = np.asarray(values, dtype=np.float32)
+
+    def int(self) -> "_FakeTensor":
+        return _FakeTensor(self.values.astype(np.int32))
+
+    def tolist(self):
+        return self.values.astype(np.int64).tolist()
+
+
+class _FakeBoxes:
+    def __init__(self, cls, xyxy) -> None:
+        self.cls = _FakeTensor(cls)
+        self.xyxy = _FakeTensor(xyxy)
+
+    def __len__(self) -> int:
+        return len(self.cls.values)
+
+
+class _FakeYOLO:
+    names = {0: "person", 39: "bottle"}
+
+    def __init__(self, weights_path, task=None) -> None:
+        self.weights_path = weights_path
+        self.task = task
+        self.results = []
+
+    def __call__(self, frame, **kwargs):
+        return self.results
+
+
+def _load_detector_module():
+    fake_ultralytics = types.SimpleNamespace(YOLO=_FakeYOLO)
+    with mock.patch.dict(sys.modules, {"ultralytics": fake_ultralytics}):
+        sys.modules.pop("pi.edge_vision.yolo_detector", None)
+        module = importlib.import_module("pi.edge_vision.yolo_detector")
+    sys.modules.pop("pi.edge_vision.yolo_detector", None)
+    return module
+
+
+class YoloDetectorWeightsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.module = _load_detector_module()
+
+    def test_exported_model_next_to_pt_is_preferred(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pi_weights_") as temp_dir:
+            weights = Path(temp_dir) / "yolov8n.pt"
+            weights.write_bytes(b"")
+            self.assertEqual(self.module.prefer_exported_weights(str(weights)), str(weights))
+
+            (Path(temp_dir) / "yolov8n.onnx").write_bytes(b"")
+            self.assertEqual(self.module.prefer_exported_weights(str(weights)), str(Path(temp_dir) / "yolov8n.onnx"))
+
+            (Path(temp_dir) / "yolov8n_ncnn_model").mkdir()
+            self.assertEqual(self.module.prefer_exported_weights(str(weights)), str(Path(temp_dir) / "yolov8n_ncnn_model"))
+
+            engine = Path(temp_dir) / "yolov8n.engine"
+            engine.write_bytes(b"")
+            self.assertEqual(self.module.prefer_exported_weights(str(engine)), str(engine))
+
+    def test_engine_loads_exported_model_unless_disabled(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pi_weights_") as temp_dir:
+            weights = Path(temp_dir) / "yolov8n.pt"
+            weights.write_bytes(b"")
+            (Path(temp_dir) / "yolov8n_ncnn_model").mkdir()
+            values = {"detector.weights_path": str(weights), "detector.prefer_exported": True}
+
+            with mock.patch.object(self.module, "get_pi_config", side_effect=lambda key, default=None: values.get(key, default)):
+                engine = self.module.SemanticEdgeEngine()
+                self.assertTrue(engine.model.weights_path.endswith("yolov8n_ncnn_model"))
+                self.assertEqual(engine.model.task, "detect")
+
+                values["detector.prefer_exported"] = False
+                engine = self.module.SemanticEdgeEngine()
+                self.assertEqual(engine.model.weights_path, str(weights))
+
+    def test_detectors_share_one_model_per_weights_path(self) -> None:
+        with tempfile.TemporaryDirectory(prefix="neurolab_pi_weights_") as temp_dir:
+            weights = Path(temp_dir) / "yolov8n.pt"
+            weights.write_bytes(b"")
+            values = {"detector.weights_path": str(weights), "detector.prefer_exported": False}
+
+            with mock.patch.object(self.module, "get_pi_config", side_effect=lambda key, default=None: values.get(key, default)):
+                first = self.module.GeneralYoloDetector()
+                second = self.module.GeneralYoloDetector()
+
+        self.assertIs(first.engine.model, second.engine.model)
+        self.assertIsNot(first.engine.last_triggers, second.engine.last_triggers)
+        self.assertEqual(list(self.module._MODEL_CACHE), [str(weights)])
+
+
+    def test_process_frame_extracts_boxes_in_bulk(self) -> None:
+        engine = self.module.SemanticEdgeEngine.__new__(self.module.SemanticEdgeEngine)
+        engine.model = _FakeYOLO("unused")
+        engine.model.results = [
+            types.SimpleNamespace(boxes=_FakeBoxes([0, 39, 0], [[1.7, 2.2, 30.9, 40.1], [5, 5, 9, 9], [50, 60, 70, 80]])),
+            types.SimpleNamespace(boxes=_FakeBoxes([], np.zeros((0, 4)))),
+        ]
+        engine.conf = 0.5
+        engine.imgsz = 320
+        engine.last_triggers = {}
+        policies = [{"event_name": "PPE穿戴检查", "trigger_classes": ["person"], "action": "crop_target"}]
+
+        with mock.patch.object(self.module, "apply_policies_to_detections", return_value=[]) as apply:
+            engine.process_frame(np.zeros((100, 100, 3), dtype=np.uint8), policies)
+
+        _, _, detected, boxes = apply.call_args.args
+        self.assertEqual(detected, ["person", "bottle", "person"])
+        self.assertEqual(boxes, {"person": [[1, 2, 30, 40], [50, 60, 70, 80]], "bottle": [[5, 5, 9, 9]]})
+
+
+if __name__ == "__main__":
+    unittest.main()